@@ -0,0 +1,165 @@
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload, selectinload
+from typing import Optional
+import models
+import schemas
+import crud
+import fast_json
+
+# Async variants of the hot read paths in crud.py, used by the async routes.
+# Everything a response serializes must be eager loaded: lazy loads cannot run on an AsyncSession.
+
+# Pagination shared by the list functions
+async def paginate(db: AsyncSession, stmt, id_column, skip: int = 0, limit: int = 100, after: Optional[int] = None):
+    """Async counterpart of crud.paginate(): returns (items, next_cursor)"""
+    if after is None:
+        result = await db.execute(stmt.offset(skip).limit(limit))
+        return list(result.unique().scalars()), None
+    result = await db.execute(stmt.filter(id_column > after).order_by(id_column).limit(limit + 1))
+    items = list(result.unique().scalars())
+    if len(items) <= limit:
+        return items, None
+    items = items[:limit]
+    return items, getattr(items[-1], id_column.key)
+
+async def paginate_rows(db: AsyncSession, shape: fast_json.Shape, stmt, id_column, skip: int = 0, limit: int = 100,
+                        after: Optional[int] = None):
+    """paginate() for SELECTs of a shape's columns: returns (items built by the shape, next_cursor)"""
+    if after is None:
+        result = await db.execute(stmt.offset(skip).limit(limit))
+        return shape.build_all(result.all()), None
+    result = await db.execute(stmt.where(id_column > after).order_by(id_column).limit(limit + 1))
+    items = shape.build_all(result.all())
+    if len(items) <= limit:
+        return items, None
+    items = items[:limit]
+    return items, items[-1]["id"]
+
+async def count_rows(db: AsyncSession, model) -> int:
+    return await db.scalar(select(func.count(model.id)))
+
+def _genc_relationships(genc):
+    """Eager load options for the account, service line and mentor nested in GenC responses"""
+    return (
+        joinedload(genc.account),
+        joinedload(genc.service_line_obj).joinedload(models.AccountServiceLine.account),
+        joinedload(genc.mentor)
+    )
+
+def _genc_row_source(genc, source):
+    """Shape of a GenC list item read from the genc table, and source outer joined to its account,
+    service line (with its account) and mentor"""
+    account = models.Account.__table__.alias()
+    service_line = models.AccountServiceLine.__table__.alias()
+    service_line_account = models.Account.__table__.alias()
+    mentor = models.Mentor.__table__.alias()
+    shape = fast_json.Shape(
+        schemas.GenCListItem, genc,
+        account=fast_json.Shape(schemas.Account, account),
+        service_line_obj=fast_json.Shape(
+            schemas.AccountServiceLine, service_line, account=fast_json.Shape(schemas.Account, service_line_account)
+        ),
+        mentor=fast_json.Shape(schemas.Mentor, mentor)
+    )
+    source = source.outerjoin(account, account.c.id == genc.c.account_id) \
+        .outerjoin(service_line, service_line.c.id == genc.c.service_line_id) \
+        .outerjoin(service_line_account, service_line_account.c.id == service_line.c.account_id) \
+        .outerjoin(mentor, mentor.c.id == genc.c.mentor_id)
+    return shape, source
+
+_GENC_ROW_SHAPE, _GENC_ROW_SOURCE = _genc_row_source(models.GenC.__table__, models.GenC.__table__)
+_GENC_SKILL_ROW_SHAPE = fast_json.Shape(
+    schemas.GenCSkill, models.GenCSkill.__table__, skill=fast_json.Shape(schemas.Skill, models.Skill.__table__)
+)
+
+def _feedback_row_source():
+    feedback = models.GenCFeedback.__table__
+    genc = models.GenC.__table__
+    mentor = models.Mentor.__table__
+    genc_shape, source = _genc_row_source(genc, feedback.outerjoin(genc, genc.c.id == feedback.c.genc_id))
+    shape = fast_json.Shape(schemas.GenCFeedback, feedback, genc=genc_shape, mentor=fast_json.Shape(schemas.Mentor, mentor))
+    return shape, source.outerjoin(mentor, mentor.c.id == feedback.c.mentor_id)
+
+_FEEDBACK_ROW_SHAPE, _FEEDBACK_ROW_SOURCE = _feedback_row_source()
+
+# Account reads
+async def get_accounts(db: AsyncSession, skip: int = 0, limit: int = 100, after: Optional[int] = None):
+    return await paginate(db, select(models.Account), models.Account.id, skip, limit, after)
+
+# Mentor reads
+async def get_mentors(db: AsyncSession, skip: int = 0, limit: int = 100, after: Optional[int] = None):
+    return await paginate(db, select(models.Mentor), models.Mentor.id, skip, limit, after)
+
+# Skill reads
+async def get_skills(db: AsyncSession, skip: int = 0, limit: int = 100, after: Optional[int] = None):
+    return await paginate(db, select(models.Skill), models.Skill.id, skip, limit, after)
+
+# GenC reads
+async def get_genc(db: AsyncSession, genc_id: int):
+    result = await db.execute(select(models.GenC).options(
+        *_genc_relationships(models.GenC),
+        selectinload(models.GenC.skills).joinedload(models.GenCSkill.skill)
+    ).filter(models.GenC.id == genc_id))
+    return result.scalars().first()
+
+async def get_gencs(db: AsyncSession, skip: int = 0, limit: int = 100, after: Optional[int] = None,
+                    include_skills: bool = False, filters: Optional[schemas.GenCFilters] = None):
+    stmt = select(models.GenC).options(*_genc_relationships(models.GenC)).filter(*crud.genc_filter_clauses(filters))
+    if include_skills:
+        stmt = stmt.options(selectinload(models.GenC.skills).joinedload(models.GenCSkill.skill))
+    return await paginate(db, stmt, models.GenC.id, skip, limit, after)
+
+async def get_genc_rows(db: AsyncSession, skip: int = 0, limit: int = 100, after: Optional[int] = None,
+                        include_skills: bool = False, filters: Optional[schemas.GenCFilters] = None):
+    """get_gencs() for the fast JSON path: the page as plain dicts shaped like GenC, built from column
+    tuples, with skills left null unless include_skills. Returns (items, next_cursor)."""
+    stmt = select(*_GENC_ROW_SHAPE.select_columns()).select_from(_GENC_ROW_SOURCE).filter(
+        *crud.genc_filter_clauses(filters)
+    )
+    items, next_cursor = await paginate_rows(db, _GENC_ROW_SHAPE, stmt, models.GenC.id, skip, limit, after)
+    if not include_skills:
+        for item in items:
+            item["skills"] = None
+    else:
+        skills = {item["id"]: [] for item in items}
+        if skills:
+            result = await db.execute(
+                select(*_GENC_SKILL_ROW_SHAPE.select_columns())
+                .select_from(models.GenCSkill.__table__.outerjoin(
+                    models.Skill.__table__, models.Skill.id == models.GenCSkill.skill_id
+                ))
+                .where(models.GenCSkill.genc_id.in_(list(skills)))
+                .order_by(models.GenCSkill.id)
+            )
+            for genc_skill in _GENC_SKILL_ROW_SHAPE.build_all(result.all()):
+                skills[genc_skill["genc_id"]].append(genc_skill)
+        for item in items:
+            item["skills"] = skills[item["id"]]
+    return items, next_cursor
+
+async def count_gencs(db: AsyncSession, filters: Optional[schemas.GenCFilters] = None) -> int:
+    return await db.scalar(select(func.count(models.GenC.id)).filter(*crud.genc_filter_clauses(filters)))
+
+# GenC Feedback reads
+async def get_genc_feedbacks(db: AsyncSession, skip: int = 0, limit: int = 100, after: Optional[int] = None):
+    genc = joinedload(models.GenCFeedback.genc)
+    stmt = select(models.GenCFeedback).options(
+        genc.joinedload(models.GenC.account),
+        genc.joinedload(models.GenC.service_line_obj).joinedload(models.AccountServiceLine.account),
+        genc.joinedload(models.GenC.mentor),
+        joinedload(models.GenCFeedback.mentor)
+    )
+    return await paginate(db, stmt, models.GenCFeedback.id, skip, limit, after)
+
+async def get_genc_feedback_rows(db: AsyncSession, skip: int = 0, limit: int = 100, after: Optional[int] = None):
+    """get_genc_feedbacks() for the fast JSON path: (items shaped like GenCFeedback, next_cursor)"""
+    stmt = select(*_FEEDBACK_ROW_SHAPE.select_columns()).select_from(_FEEDBACK_ROW_SOURCE)
+    return await paginate_rows(db, _FEEDBACK_ROW_SHAPE, stmt, models.GenCFeedback.id, skip, limit, after)
+
+# Skill matrix and dashboard, sharing the sync query code through run_sync
+async def get_skill_matrix(db: AsyncSession, **filters):
+    return await db.run_sync(lambda sync_db: crud.get_skill_matrix(sync_db, **filters))
+
+async def get_dashboard_stats(db: AsyncSession):
+    return await db.run_sync(crud.get_dashboard_stats)
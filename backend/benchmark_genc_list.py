@@ -0,0 +1,119 @@
+#!/usr/bin/env python3
+"""
+GenC list benchmark for GenC Tracking System
+Compares the old GET /gencs/ read path (account, service line, mentor and skills all
+joinedloaded in one cartesian query) with the list-optimized path: a slim projection
+without skills, and ?include=skills loading the collection with SELECT ... IN batches.
+Prints latency and peak Python memory for reading and serializing every GenC.
+
+Usage: python benchmark_genc_list.py [gencs] [skills_per_genc]
+"""
+
+import sys
+import os
+import time
+import tempfile
+import tracemalloc
+from datetime import date
+
+# Add the current directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker, joinedload
+
+from database import make_engine
+import models
+import crud
+import schemas
+
+def seed(db, genc_count: int, skills_per_genc: int):
+    db.execute(insert(models.Account), [{"account_name": "Benchmark Account", "epl_name": "EPL", "edp_name": "EDP"}])
+    db.execute(insert(models.AccountServiceLine), [{
+        "account_id": 1, "service_line": "Digital", "edl_name": "EDL", "pdl_name": "PDL", "sl_spoc": "SPOC"
+    }])
+    db.execute(insert(models.Mentor), [{
+        "associate_id": "M000001", "mentor_name": "Benchmark Mentor",
+        "designation": models.MentorDesignationEnum.M, "service_line": "Digital"
+    }])
+    db.execute(insert(models.Skill), [
+        {"skill_name": f"Skill {i:03d}", "description": "Benchmark skill", "category": "Technical"}
+        for i in range(skills_per_genc)
+    ])
+    db.execute(insert(models.GenC), [{
+        "associate_id": f"G{i:07d}", "genc_name": f"GenC {i}", "account_id": 1, "service_line_id": 1, "mentor_id": 1,
+        "status": models.StatusEnum.IDLE, "date_of_joining": date(2024, 1, 1),
+        "location": models.LocationEnum.CHENNAI, "current_designation": models.DesignationEnum.PA
+    } for i in range(genc_count)])
+    db.execute(insert(models.GenCSkill), [{
+        "genc_id": genc_id, "skill_id": skill_id, "proficiency_level": models.ProficiencyLevelEnum.INTERMEDIATE,
+        "notes": "Benchmark notes"
+    } for genc_id in range(1, genc_count + 1) for skill_id in range(1, skills_per_genc + 1)])
+    db.commit()
+
+def legacy_read_gencs(db, limit: int):
+    """The pre-change list read: every relationship, including the skills collection, joinedloaded"""
+    gencs = db.query(models.GenC).options(
+        joinedload(models.GenC.account),
+        joinedload(models.GenC.service_line_obj),
+        joinedload(models.GenC.mentor),
+        joinedload(models.GenC.skills).joinedload(models.GenCSkill.skill)
+    ).offset(0).limit(limit).all()
+    return [schemas.GenC.model_validate(genc).model_dump() for genc in gencs]
+
+def slim_read_gencs(db, limit: int):
+    gencs, _ = crud.get_gencs(db, limit=limit)
+    return [schemas.GenCListItem.model_validate(genc).model_dump() for genc in gencs]
+
+def read_gencs_with_skills(db, limit: int):
+    gencs, _ = crud.get_gencs(db, limit=limit, include_skills=True)
+    return [schemas.GenC.model_validate(genc).model_dump() for genc in gencs]
+
+def measure(Session, read, limit: int, repeats: int = 3):
+    """Best wall time over repeats and peak traced memory of one run, each on a fresh session"""
+    best = None
+    for _ in range(repeats):
+        with Session() as db:
+            start = time.perf_counter()
+            rows = read(db, limit)
+            elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    with Session() as db:
+        tracemalloc.start()
+        read(db, limit)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return len(rows), best, peak
+
+def report(label: str, rows: int, seconds: float, peak: int):
+    print(f"   {label:<22} {rows:>7} GenCs in {seconds:7.2f}s  peak {peak / (1024 * 1024):8.1f} MiB")
+
+def run_benchmark(genc_count: int, skills_per_genc: int):
+    with tempfile.TemporaryDirectory() as directory:
+        engine = make_engine(f"sqlite:///{os.path.join(directory, 'benchmark.db')}")
+        models.Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+        print(f"📊 Seeding {genc_count} GenCs x {skills_per_genc} skills...")
+        with Session() as db:
+            seed(db, genc_count, skills_per_genc)
+
+        print("🐢 Joinedload of every relationship (before)...")
+        rows, before, before_peak = measure(Session, legacy_read_gencs, genc_count)
+        report("before", rows, before, before_peak)
+
+        print("🚀 List-optimized read path (after)...")
+        rows, slim, slim_peak = measure(Session, slim_read_gencs, genc_count)
+        report("slim list", rows, slim, slim_peak)
+        rows, with_skills, with_skills_peak = measure(Session, read_gencs_with_skills, genc_count)
+        report("?include=skills", rows, with_skills, with_skills_peak)
+        engine.dispose()
+
+    print(f"✅ Slim list: {before / slim:.1f}x faster, {before_peak / slim_peak:.1f}x less memory")
+    print(f"✅ With skills: {before / with_skills:.1f}x faster, {before_peak / with_skills_peak:.1f}x less memory")
+
+if __name__ == "__main__":
+    gencs_arg = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    skills_arg = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    run_benchmark(gencs_arg, skills_arg)
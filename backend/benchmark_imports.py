@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Import benchmark for GenC Tracking System
+Compares the old row-by-row account import (one commit + refresh per row) with the
+chunked importer, on a generated sheet, and prints rows/second for both.
+
+Usage: python benchmark_imports.py [rows] [chunk_size]
+"""
+
+import sys
+import os
+import io
+import time
+import tempfile
+
+# Add the current directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import pandas as pd
+from sqlalchemy.orm import sessionmaker
+
+from database import make_engine
+import models
+import crud
+import schemas
+import importer
+
+def build_accounts_sheet(rows: int) -> bytes:
+    df = pd.DataFrame({
+        "account_name": [f"Account {i:06d}" for i in range(rows)],
+        "epl_name": [f"EPL {i % 97}" for i in range(rows)],
+        "edp_name": [f"EDP {i % 89}" for i in range(rows)],
+    })
+    buffer = io.BytesIO()
+    df.to_excel(buffer, index=False)
+    return buffer.getvalue()
+
+def fresh_session(directory: str, name: str):
+    engine = make_engine(f"sqlite:///{os.path.join(directory, name)}")
+    models.Base.metadata.create_all(bind=engine)
+    return sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+
+def legacy_import_accounts(db, contents: bytes):
+    """The pre-batching import loop: one lookup and one committed insert per row"""
+    df = pd.read_excel(io.BytesIO(contents))
+    imported = 0
+    for _, row in df.iterrows():
+        if crud.get_account_by_name(db, row["account_name"]):
+            continue
+        crud.create_account(db, schemas.AccountCreate(
+            account_name=str(row["account_name"]).strip(),
+            epl_name=str(row["epl_name"]).strip(),
+            edp_name=str(row["edp_name"]).strip()
+        ))
+        imported += 1
+    return imported
+
+def report(label: str, rows: int, seconds: float):
+    print(f"   {label:<10} {rows:>7} rows in {seconds:8.2f}s  ->  {rows / seconds:10.0f} rows/s")
+
+def run_benchmark(rows: int, chunk_size: int):
+    print(f"📊 Building a {rows}-row accounts sheet...")
+    contents = build_accounts_sheet(rows)
+
+    with tempfile.TemporaryDirectory() as directory:
+        print("🐢 Row-by-row import (before)...")
+        db = fresh_session(directory, "before.db")
+        start = time.perf_counter()
+        imported = legacy_import_accounts(db, contents)
+        before = time.perf_counter() - start
+        db.close()
+        report("before", imported, before)
+
+        print(f"🚀 Chunked import (after, {chunk_size} rows per transaction)...")
+        sheet_path = os.path.join(directory, "accounts.xlsx")
+        with open(sheet_path, "wb") as sheet:
+            sheet.write(contents)
+        db = fresh_session(directory, "after.db")
+        start = time.perf_counter()
+        result = crud.import_accounts_from_file(db, sheet_path, "accounts.xlsx", chunk_size=chunk_size)
+        after = time.perf_counter() - start
+        db.close()
+        report("after", result["imported"], after)
+
+    print(f"✅ Speedup: {before / after:.1f}x")
+
+if __name__ == "__main__":
+    row_count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    chunk = int(sys.argv[2]) if len(sys.argv) > 2 else importer.DEFAULT_CHUNK_SIZE
+    run_benchmark(row_count, chunk)
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+List serialization benchmark for GenC Tracking System
+Compares the response_model path of GET /gencs/ and GET /genc-feedbacks/ (ORM objects validated
+and serialized by FastAPI through Pydantic, then encoded with json) with the fast JSON path
+(rows built from column tuples and encoded with orjson). Checks both paths produce the same JSON.
+
+Usage: python benchmark_list_serialization.py [gencs] [skills_per_genc]
+"""
+
+import sys
+import os
+import time
+import json
+import asyncio
+import tempfile
+from datetime import date
+from typing import List
+
+# Add the current directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session as SyncSession
+
+from database import make_engine, make_async_engine
+import models
+import schemas
+import async_crud
+import fast_json
+from benchmark_writes import seed as seed_gencs
+
+FEEDBACK_PER_GENC = 2
+
+def seed(db, genc_count: int, skills_per_genc: int):
+    seed_gencs(db, genc_count)
+    db.execute(insert(models.Skill), [
+        {"skill_name": f"Extra skill {i:03d}", "description": None, "category": "Technical"} for i in range(skills_per_genc)
+    ])
+    db.execute(insert(models.GenCSkill), [{
+        "genc_id": genc_id, "skill_id": skill_id, "proficiency_level": models.ProficiencyLevelEnum.ADVANCED,
+        "date_acquired": date(2024, 2, 1), "notes": "Benchmark notes"
+    } for genc_id in range(1, genc_count + 1) for skill_id in range(11, 11 + skills_per_genc)])
+    db.execute(insert(models.GenCFeedback), [{
+        "genc_id": i % genc_count + 1, "mentor_id": 1, "date_of_feedback": date(2024, 3, 1), "feedback": f"Feedback {i}"
+    } for i in range(genc_count * FEEDBACK_PER_GENC)])
+    db.commit()
+
+async def model_path(response_model, read, slim: bool = False) -> bytes:
+    """The response_model path: what FastAPI does with the ORM objects a route returns"""
+    items, _ = await read()
+    if slim:
+        # As the route did without ?include=skills, so the unloaded collection is never touched
+        items = [schemas.GenCListItem.model_validate(item) for item in items]
+    field = create_response_field(name="response", type_=response_model)
+    content = await serialize_response(field=field, response_content=items, is_coroutine=True)
+    return JSONResponse(content).body
+
+async def fast_path(read) -> bytes:
+    items, _ = await read()
+    return fast_json.response(items).body
+
+async def timed(Session, call, repeats: int):
+    best, body = None, None
+    for _ in range(repeats):
+        async with Session() as db:
+            start = time.perf_counter()
+            body = await call(db)
+            elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return body, best
+
+async def run_benchmark(genc_count: int, skills_per_genc: int, repeats: int = 3):
+    with tempfile.TemporaryDirectory() as directory:
+        url = f"sqlite:///{os.path.join(directory, 'benchmark.db')}"
+        engine = make_engine(url)
+        models.Base.metadata.create_all(bind=engine)
+        with engine.connect() as connection:
+            with SyncSession(bind=connection) as db:
+                print(f"📊 Seeding {genc_count} GenCs x {5 + skills_per_genc} skills, {FEEDBACK_PER_GENC} feedback each...")
+                seed(db, genc_count, skills_per_genc)
+        engine.dispose()
+
+        async_engine = make_async_engine(url)
+        Session = async_sessionmaker(async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+        feedback_count = genc_count * FEEDBACK_PER_GENC
+        cases = [
+            ("GET /gencs/", genc_count,
+             lambda db: model_path(List[schemas.GenC], lambda: async_crud.get_gencs(db, limit=genc_count), slim=True),
+             lambda db: fast_path(lambda: async_crud.get_genc_rows(db, limit=genc_count))),
+            ("GET /gencs/?include=skills", genc_count,
+             lambda db: model_path(List[schemas.GenC], lambda: async_crud.get_gencs(db, limit=genc_count, include_skills=True)),
+             lambda db: fast_path(lambda: async_crud.get_genc_rows(db, limit=genc_count, include_skills=True))),
+            ("GET /gencs/?after=0", genc_count,
+             lambda db: model_path(List[schemas.GenC], lambda: async_crud.get_gencs(db, limit=genc_count, after=0), slim=True),
+             lambda db: fast_path(lambda: async_crud.get_genc_rows(db, limit=genc_count, after=0))),
+            ("GET /genc-feedbacks/", feedback_count,
+             lambda db: model_path(List[schemas.GenCFeedback], lambda: async_crud.get_genc_feedbacks(db, limit=feedback_count)),
+             lambda db: fast_path(lambda: async_crud.get_genc_feedback_rows(db, limit=feedback_count))),
+            ("GET /genc-feedbacks/?after=0", feedback_count,
+             lambda db: model_path(List[schemas.GenCFeedback], lambda: async_crud.get_genc_feedbacks(db, limit=feedback_count, after=0)),
+             lambda db: fast_path(lambda: async_crud.get_genc_feedback_rows(db, limit=feedback_count, after=0))),
+        ]
+
+        print(f"   {'route':<32} {'rows':>6} {'response_model':>15} {'fast JSON':>10} {'speedup':>8}")
+        for label, rows, model_call, fast_call in cases:
+            model_body, model_seconds = await timed(Session, model_call, repeats)
+            fast_body, fast_seconds = await timed(Session, fast_call, repeats)
+            assert json.loads(model_body) == json.loads(fast_body), f"{label}: the fast JSON path differs"
+            print(f"   {label:<32} {rows:>6} {model_seconds * 1000:13.1f}ms {fast_seconds * 1000:8.1f}ms"
+                  f" {model_seconds / fast_seconds:7.1f}x")
+        await async_engine.dispose()
+    print("✅ Both paths produce the same JSON")
+
+if __name__ == "__main__":
+    gencs_arg = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    skills_arg = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    asyncio.run(run_benchmark(gencs_arg, skills_arg))
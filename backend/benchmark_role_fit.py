@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Role-fit ranking benchmark for GenC Tracking System
+Seeds GenCs with random skill sets, then times GET /roles/{role}/candidates/ scoring on the
+in-memory proficiency matrix: the first call (which builds the matrix) and warm calls with and
+without filters. Checks the ranking against a plain Python scoring of every GenC.
+
+Usage: python benchmark_role_fit.py [gencs] [skills_per_genc]
+"""
+
+import sys
+import os
+import time
+import random
+import tempfile
+from datetime import date
+
+# Add the current directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
+
+from database import make_engine
+import models
+import crud
+import role_fit
+
+SKILL_COUNT = 200
+ROLE = models.DesignationEnum.PA
+
+def seed(db, genc_count: int, skills_per_genc: int):
+    rng = random.Random(42)
+    levels = list(models.ProficiencyLevelEnum)
+    db.execute(insert(models.Account), [{"account_name": f"Account {i}", "epl_name": "EPL", "edp_name": "EDP"} for i in range(20)])
+    db.execute(insert(models.AccountServiceLine), [{
+        "account_id": 1, "service_line": "Digital", "edl_name": "EDL", "pdl_name": "PDL", "sl_spoc": "SPOC"
+    }])
+    db.execute(insert(models.Mentor), [{
+        "associate_id": "M000001", "mentor_name": "Benchmark Mentor",
+        "designation": models.MentorDesignationEnum.M, "service_line": "Digital"
+    }])
+    db.execute(insert(models.Skill), [
+        {"skill_name": f"Skill {i:03d}", "description": "Benchmark skill", "category": "Technical"}
+        for i in range(SKILL_COUNT)
+    ])
+    db.execute(insert(models.GenC), [{
+        "associate_id": f"G{i:07d}", "genc_name": f"GenC {i}", "account_id": i % 20 + 1, "service_line_id": 1,
+        "mentor_id": 1, "status": rng.choice(list(models.StatusEnum)), "date_of_joining": date(2024, 1, 1),
+        "location": rng.choice(list(models.LocationEnum)), "current_designation": rng.choice(list(models.DesignationEnum))
+    } for i in range(genc_count)])
+    # Skewed towards the low skill ids so the role's skills are commonly held
+    db.execute(insert(models.GenCSkill), [{
+        "genc_id": genc_id, "skill_id": skill_id, "proficiency_level": rng.choice(levels)
+    } for genc_id in range(1, genc_count + 1)
+        for skill_id in sorted({min(int(rng.expovariate(1 / 20)), SKILL_COUNT - 1) + 1 for _ in range(skills_per_genc)})])
+    db.execute(insert(models.RoleSkillRequirement), [{
+        "role": ROLE, "skill_id": skill_id, "required_proficiency_level": rng.choice(levels),
+        "is_mandatory": "Yes" if skill_id <= 6 else "No"
+    } for skill_id in range(1, 13)])
+    db.commit()
+
+def reference_ranking(db, limit: int):
+    """Score every GenC one at a time in Python, for checking the vectorized ranking"""
+    requirements = db.query(models.RoleSkillRequirement).filter(models.RoleSkillRequirement.role == ROLE).all()
+    held = {}
+    for genc_id, skill_id, level in db.query(models.GenCSkill.genc_id, models.GenCSkill.skill_id, models.GenCSkill.proficiency_level):
+        held[(genc_id, skill_id)] = role_fit.PROFICIENCY_ORDER[level]
+    scored = []
+    for (genc_id,) in db.query(models.GenC.id):
+        mandatory_met, weighted_deficit = 0, 0
+        for req in requirements:
+            deficit = max(role_fit.PROFICIENCY_ORDER[req.required_proficiency_level] - held.get((genc_id, req.skill_id), 0), 0)
+            weighted_deficit += deficit * (role_fit.MANDATORY_WEIGHT if req.is_mandatory == "Yes" else 1)
+            mandatory_met += req.is_mandatory == "Yes" and deficit == 0
+        scored.append((-mandatory_met, weighted_deficit, genc_id))
+    return [genc_id for _, _, genc_id in sorted(scored)[:limit]]
+
+def timed(call, repeats: int = 1):
+    best = None
+    for _ in range(repeats):
+        start = time.perf_counter()
+        result = call()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best
+
+def run_benchmark(genc_count: int, skills_per_genc: int):
+    with tempfile.TemporaryDirectory() as directory:
+        engine = make_engine(f"sqlite:///{os.path.join(directory, 'benchmark.db')}")
+        models.Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+        print(f"📊 Seeding {genc_count} GenCs x ~{skills_per_genc} skills...")
+        with Session() as db:
+            seed(db, genc_count, skills_per_genc)
+
+        with Session() as db:
+            role_fit.invalidate()
+            _, cold = timed(lambda: crud.rank_role_candidates(db, ROLE, limit=20))
+            print(f"   first call (builds matrix)   {cold * 1000:8.1f} ms")
+
+            ranking, warm = timed(lambda: crud.rank_role_candidates(db, ROLE, limit=20), repeats=20)
+            print(f"   top 20 of all GenCs          {warm * 1000:8.1f} ms  ({ranking['candidates_considered']} considered)")
+            filtered, warm_filtered = timed(lambda: crud.rank_role_candidates(
+                db, ROLE, limit=20, status=[models.StatusEnum.IDLE], account_id=3
+            ), repeats=20)
+            print(f"   top 20 idle GenCs of account {warm_filtered * 1000:8.1f} ms  ({filtered['candidates_considered']} considered)")
+            _, warm_large = timed(lambda: crud.rank_role_candidates(db, ROLE, limit=500, all_mandatory=True), repeats=20)
+            print(f"   top 500 meeting mandatory    {warm_large * 1000:8.1f} ms")
+
+            expected = reference_ranking(db, 20)
+            assert [candidate["genc_id"] for candidate in ranking["candidates"]] == expected, "ranking differs from reference"
+            print("✅ Ranking matches the per-GenC reference scoring")
+        engine.dispose()
+
+if __name__ == "__main__":
+    gencs_arg = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    skills_arg = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    run_benchmark(gencs_arg, skills_arg)
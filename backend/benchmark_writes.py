@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Write path benchmark for GenC Tracking System
+Compares the old POST/PUT handling of /gencs/, /mentors/ and /genc-feedbacks/ (load the row,
+assign attributes, commit, refresh, then lazy-load relations while serializing) with the
+INSERT ... RETURNING / UPDATE ... RETURNING path. Each request runs on a fresh session, as
+under FastAPI, and is serialized through its response model. Prints the mean latency and the
+SQL statements issued per request.
+
+Usage: python benchmark_writes.py [requests] [existing_gencs]
+"""
+
+import sys
+import os
+import time
+import tempfile
+from datetime import date
+
+# Add the current directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import event, insert
+from sqlalchemy.orm import sessionmaker
+
+from database import make_engine
+import models
+import crud
+import schemas
+import search_index
+import skill_matrix
+import status_history
+
+def seed(db, genc_count: int):
+    db.execute(insert(models.Account), [{"account_name": "Benchmark Account", "epl_name": "EPL", "edp_name": "EDP"}])
+    db.execute(insert(models.AccountServiceLine), [{
+        "account_id": 1, "service_line": "Digital", "edl_name": "EDL", "pdl_name": "PDL", "sl_spoc": "SPOC"
+    }])
+    db.execute(insert(models.Mentor), [{
+        "associate_id": "M000000", "mentor_name": "Benchmark Mentor",
+        "designation": models.MentorDesignationEnum.M, "service_line": "Digital"
+    }])
+    db.execute(insert(models.Skill), [
+        {"skill_name": f"Skill {i:02d}", "description": "Benchmark skill", "category": "Technical"} for i in range(10)
+    ])
+    db.execute(insert(models.GenC), [genc_values(i) for i in range(genc_count)])
+    db.execute(insert(models.GenCSkill), [{
+        "genc_id": genc_id, "skill_id": skill_id, "proficiency_level": models.ProficiencyLevelEnum.INTERMEDIATE
+    } for genc_id in range(1, genc_count + 1) for skill_id in range(1, 6)])
+    db.commit()
+
+def genc_values(i: int) -> dict:
+    return {
+        "associate_id": f"G{i:07d}", "genc_name": f"GenC {i}", "account_id": 1, "service_line_id": 1, "mentor_id": 1,
+        "status": models.StatusEnum.IDLE, "date_of_joining": date(2024, 1, 1),
+        "location": models.LocationEnum.CHENNAI, "current_designation": models.DesignationEnum.PA
+    }
+
+def mentor_values(i: int, name: str = "Mentor") -> dict:
+    return {
+        "associate_id": f"M{i:06d}", "mentor_name": f"{name} {i}",
+        "designation": models.MentorDesignationEnum.M, "service_line": "Digital"
+    }
+
+def feedback_values(genc_id: int, text: str = "Settling in well") -> dict:
+    return {"genc_id": genc_id, "mentor_id": 1, "date_of_feedback": date(2024, 3, 1), "feedback": text}
+
+# The pre-change write path, route checks included
+
+def legacy_create_genc(db, genc: schemas.GenCCreate):
+    if crud.get_genc_by_associate_id(db, genc.associate_id):
+        raise ValueError("GenC associate ID already registered")
+    db_genc = models.GenC(**genc.model_dump())
+    db.add(db_genc)
+    db.flush()
+    skill_matrix.refresh(db, [db_genc.id])
+    status_history.record(db, [(db_genc.id, None, db_genc.status)])
+    db.commit()
+    db.refresh(db_genc)
+    return db_genc
+
+def legacy_update_genc(db, genc_id: int, genc: schemas.GenCUpdate):
+    db_genc = crud.get_genc(db, genc_id)
+    previous_status = db_genc.status
+    if genc.status != previous_status and not crud.validate_status_transition(previous_status, genc.status):
+        raise ValueError("Invalid status transition")
+    for key, value in genc.model_dump().items():
+        setattr(db_genc, key, value)
+    skill_matrix.refresh(db, [genc_id])
+    if db_genc.status != previous_status:
+        status_history.record(db, [(genc_id, previous_status, db_genc.status)])
+    db.commit()
+    db.refresh(db_genc)
+    return db_genc
+
+def legacy_create_mentor(db, mentor: schemas.MentorCreate):
+    if crud.get_mentor_by_associate_id(db, mentor.associate_id):
+        raise ValueError("Mentor associate ID already registered")
+    db_mentor = models.Mentor(**mentor.model_dump())
+    db.add(db_mentor)
+    db.commit()
+    db.refresh(db_mentor)
+    return db_mentor
+
+def legacy_update_mentor(db, mentor_id: int, mentor: schemas.MentorUpdate):
+    db_mentor = crud.get_mentor(db, mentor_id)
+    for key, value in mentor.model_dump().items():
+        setattr(db_mentor, key, value)
+    db.commit()
+    db.refresh(db_mentor)
+    return db_mentor
+
+def legacy_create_feedback(db, feedback: schemas.GenCFeedbackCreate):
+    db_feedback = models.GenCFeedback(**feedback.model_dump())
+    db.add(db_feedback)
+    search_index.index_feedback(db, db_feedback)
+    db.commit()
+    db.refresh(db_feedback)
+    return db_feedback
+
+def legacy_update_feedback(db, feedback_id: int, feedback: schemas.GenCFeedbackUpdate):
+    db_feedback = crud.get_genc_feedback(db, feedback_id)
+    for key, value in feedback.model_dump().items():
+        setattr(db_feedback, key, value)
+    search_index.index_feedback(db, db_feedback)
+    db.commit()
+    db.refresh(db_feedback)
+    return db_feedback
+
+# The RETURNING write path, as the routes in main.py call it
+
+def create_genc(db, genc: schemas.GenCCreate):
+    if crud.get_genc_id_by_associate_id(db, genc.associate_id) is not None:
+        raise ValueError("GenC associate ID already registered")
+    return crud.create_genc(db, genc)
+
+def create_mentor(db, mentor: schemas.MentorCreate):
+    if crud.get_mentor_by_associate_id(db, mentor.associate_id):
+        raise ValueError("Mentor associate ID already registered")
+    return crud.create_mentor(db, mentor)
+
+def requests_for(genc_count: int, count: int, offset: int, legacy: bool) -> list:
+    """(label, response model, call) for count requests to each route; offset keeps created keys unique"""
+    start = genc_count + offset
+    return [
+        ("POST /gencs/", schemas.GenC, [
+            lambda db, i=i: (legacy_create_genc if legacy else create_genc)(db, schemas.GenCCreate(**genc_values(start + i)))
+            for i in range(count)
+        ]),
+        ("PUT /gencs/{id}", schemas.GenC, [
+            lambda db, i=i: (legacy_update_genc if legacy else crud.update_genc)(
+                db, i % 2 + 1 + offset, schemas.GenCUpdate(**genc_values(i % 2 + offset), team_name=f"Team {i}")
+            )
+            for i in range(count)
+        ]),
+        ("POST /mentors/", schemas.Mentor, [
+            lambda db, i=i: (legacy_create_mentor if legacy else create_mentor)(db, schemas.MentorCreate(**mentor_values(start + i)))
+            for i in range(count)
+        ]),
+        ("PUT /mentors/{id}", schemas.Mentor, [
+            lambda db, i=i: (legacy_update_mentor if legacy else crud.update_mentor)(
+                db, 1, schemas.MentorUpdate(**mentor_values(0, f"Mentor revision {i}"))
+            )
+            for i in range(count)
+        ]),
+        ("POST /genc-feedbacks/", schemas.GenCFeedback, [
+            lambda db, i=i: (legacy_create_feedback if legacy else crud.create_genc_feedback)(
+                db, schemas.GenCFeedbackCreate(**feedback_values(i % genc_count + 1))
+            )
+            for i in range(count)
+        ]),
+        ("PUT /genc-feedbacks/{id}", schemas.GenCFeedback, [
+            lambda db, i=i: (legacy_update_feedback if legacy else crud.update_genc_feedback)(
+                db, 1, schemas.GenCFeedbackUpdate(**feedback_values(1, f"Revision {i}: doing well"))
+            )
+            for i in range(count)
+        ])
+    ]
+
+def run_requests(Session, statements: list, routes: list) -> dict:
+    """Mean seconds and statements per request of each route, serializing every response"""
+    results = {}
+    for label, response_model, calls in routes:
+        statements.clear()
+        start = time.perf_counter()
+        for call in calls:
+            with Session() as db:
+                response_model.model_validate(call(db)).model_dump()
+        elapsed = time.perf_counter() - start
+        results[label] = (elapsed / len(calls), len(statements) / len(calls))
+    return results
+
+def run_benchmark(request_count: int, genc_count: int):
+    with tempfile.TemporaryDirectory() as directory:
+        engine = make_engine(f"sqlite:///{os.path.join(directory, 'benchmark.db')}")
+        models.Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+        statements = []
+        event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+        print(f"📊 Seeding {genc_count} GenCs x 5 skills...")
+        with Session() as db:
+            seed(db, genc_count)
+            # Feedback row 1 for the PUT /genc-feedbacks/{id} requests
+            crud.create_genc_feedback(db, schemas.GenCFeedbackCreate(**feedback_values(1)))
+            skill_matrix.fill_missing(db)
+
+        print(f"⏱️  {request_count} requests per route...")
+        before = run_requests(Session, statements, requests_for(genc_count, request_count, 0, legacy=True))
+        after = run_requests(Session, statements, requests_for(genc_count, request_count, request_count, legacy=False))
+        engine.dispose()
+
+    print(f"   {'route':<26} {'before':>10} {'after':>10} {'speedup':>8}   statements")
+    for label, (seconds, per_request) in before.items():
+        after_seconds, after_per_request = after[label]
+        print(f"   {label:<26} {seconds * 1000:8.2f}ms {after_seconds * 1000:8.2f}ms {seconds / after_seconds:7.1f}x"
+              f"   {per_request:4.1f} -> {after_per_request:4.1f}")
+
+if __name__ == "__main__":
+    requests_arg = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    gencs_arg = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    run_benchmark(requests_arg, gencs_arg)
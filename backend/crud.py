@@ -1,11 +1,18 @@
-from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import and_
-from typing import List, Optional
+from sqlalchemy.orm import Session, joinedload, selectinload
+from sqlalchemy import and_, or_, func, case, delete, insert, select, tuple_, update
+from sqlalchemy.dialects import postgresql, sqlite
+from typing import List, Optional, Union
 import models
 import schemas
+import importer
+import migrations
+import skill_matrix
+import search_index
+import status_history
+import response_cache
+import role_fit
 import pandas as pd
-import io
-from fastapi import UploadFile
+import threading
 
 # Status transition rules for GenC
 ALLOWED_STATUS_TRANSITIONS = {
@@ -38,12 +45,78 @@ ALLOWED_STATUS_TRANSITIONS = {
     models.StatusEnum.RELEASED_RESIGNED: []
 }
 
+class StatusConflictError(ValueError):
+    """A GenC's status changed between validating a transition and writing it"""
+
 def validate_status_transition(current_status: models.StatusEnum, new_status: models.StatusEnum) -> bool:
     """Validate if the status transition is allowed"""
     if current_status == new_status:
         return True
     return new_status in ALLOWED_STATUS_TRANSITIONS.get(current_status, [])
 
+# Pagination shared by the list functions
+def paginate(query, id_column, skip: int = 0, limit: int = 100, after: Optional[int] = None):
+    """Fetch one page of a list query and return (items, next_cursor).
+
+    When after is given, rows are read in id order strictly after that id (keyset pagination)
+    and next_cursor is the id to pass as after for the following page, or None on the last page.
+    Otherwise the legacy skip/limit offset paging is used and next_cursor is None.
+    """
+    if after is None:
+        return query.offset(skip).limit(limit).all(), None
+    items = query.filter(id_column > after).order_by(id_column).limit(limit + 1).all()
+    if len(items) <= limit:
+        return items, None
+    items = items[:limit]
+    return items, getattr(items[-1], id_column.key)
+
+def count_rows(db: Session, model) -> int:
+    """Total row count of a table, counted over its primary key without any joins"""
+    return db.query(func.count(model.id)).scalar()
+
+def _insert_returning(db: Session, model, values: dict):
+    """INSERT one row and get it back as stored, defaults and id included, in one INSERT ... RETURNING.
+
+    The returned row carries the table's columns only; nested relations are left out of write responses.
+    """
+    return db.execute(insert(model).values(**values).returning(*model.__table__.c)).one()
+
+def _update_returning(db: Session, model, row_id: int, values: dict, *criteria):
+    """UPDATE one row by id and get it back as stored in one UPDATE ... RETURNING; None if there is no such
+    row, or it does not meet the extra criteria.
+
+    With no values there is nothing to write and the row is only read.
+    """
+    if not values:
+        return db.execute(select(*model.__table__.c).where(model.id == row_id, *criteria)).one_or_none()
+    return db.execute(
+        update(model).where(model.id == row_id, *criteria).values(**values)
+        .returning(*model.__table__.c).execution_options(synchronize_session=False)
+    ).one_or_none()
+
+def _changes(data) -> dict:
+    """Columns an update writes: every field of a PUT body, only the fields sent in a PATCH body"""
+    return data.model_dump(exclude_unset=isinstance(data, schemas.PartialUpdate))
+
+def _delete_rows(db: Session, model, *criteria) -> int:
+    """DELETE the matching rows without synchronizing the session; returns how many were deleted"""
+    return db.execute(delete(model).where(*criteria).execution_options(synchronize_session=False)).rowcount
+
+def _delete_gencs(db: Session, genc_ids) -> dict:
+    """Delete GenCs and the rows they own with one DELETE per table. Does not commit.
+
+    genc_ids may be a list or a SELECT of ids. The foreign keys cascade anyway; deleting the
+    dependents explicitly keeps the search index in step and gives per-table counts.
+    """
+    search_index.remove_gencs(db, genc_ids)
+    skill_matrix.remove(db, genc_ids)
+    status_history.remove(db, genc_ids)
+    return {
+        "genc_skills": _delete_rows(db, models.GenCSkill, models.GenCSkill.genc_id.in_(genc_ids)),
+        "genc_feedbacks": _delete_rows(db, models.GenCFeedback, models.GenCFeedback.genc_id.in_(genc_ids)),
+        "gencs": _delete_rows(db, models.GenC, models.GenC.id.in_(genc_ids))
+    }
+
 # Account CRUD
 def get_account(db: Session, account_id: int):
     return db.query(models.Account).filter(models.Account.id == account_id).first()
@@ -51,465 +124,349 @@ def get_account(db: Session, account_id: int):
 def get_account_by_name(db: Session, account_name: str):
     return db.query(models.Account).filter(models.Account.account_name == account_name).first()
 
-def get_accounts(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(models.Account).offset(skip).limit(limit).all()
+def get_accounts(db: Session, skip: int = 0, limit: int = 100, after: Optional[int] = None):
+    return paginate(db.query(models.Account), models.Account.id, skip, limit, after)
 
 def create_account(db: Session, account: schemas.AccountCreate):
-    db_account = models.Account(**account.model_dump())
-    db.add(db_account)
+    db_account = _insert_returning(db, models.Account, account.model_dump())
     db.commit()
-    db.refresh(db_account)
+    invalidate_dashboard_stats()
+    response_cache.invalidate(response_cache.ACCOUNTS)
     return db_account
 
-def update_account(db: Session, account_id: int, account: schemas.AccountUpdate):
-    db_account = get_account(db, account_id)
+def update_account(db: Session, account_id: int, account: Union[schemas.AccountUpdate, schemas.AccountPatch]):
+    db_account = _update_returning(db, models.Account, account_id, _changes(account))
     if db_account:
-        for key, value in account.model_dump().items():
-            setattr(db_account, key, value)
         db.commit()
-        db.refresh(db_account)
+        invalidate_dashboard_stats()
+        response_cache.invalidate(response_cache.ACCOUNTS)
     return db_account
 
 def delete_account(db: Session, account_id: int):
-    db_account = get_account(db, account_id)
-    if db_account:
-        db.delete(db_account)
-        db.commit()
-    return db_account
-
-async def import_accounts_from_excel(db: Session, file: UploadFile):
-    """Import accounts from Excel file"""
+    """Delete an account with its service lines and GenCs in one transaction of set-based DELETEs.
+
+    Returns the deleted row counts, or None if the account does not exist.
+    """
+    service_lines = select(models.AccountServiceLine.id).where(models.AccountServiceLine.account_id == account_id)
+    counts = _delete_gencs(db, select(models.GenC.id).where(
+        or_(models.GenC.account_id == account_id, models.GenC.service_line_id.in_(service_lines))
+    ))
+    counts["account_service_lines"] = _delete_rows(
+        db, models.AccountServiceLine, models.AccountServiceLine.account_id == account_id
+    )
+    counts["accounts"] = _delete_rows(db, models.Account, models.Account.id == account_id)
+    if not counts["accounts"]:
+        db.rollback()
+        return None
+    db.commit()
+    invalidate_dashboard_stats()
+    role_fit.invalidate()
+    response_cache.invalidate(response_cache.ACCOUNTS)
+    return counts
+
+ACCOUNT_IMPORT_COLUMNS = ['account_name', 'epl_name', 'edp_name']
+MENTOR_IMPORT_COLUMNS = ['associate_id', 'mentor_name', 'designation', 'service_line']
+ACCOUNT_SERVICE_LINE_IMPORT_COLUMNS = ['account_name', 'service_line', 'edl_name', 'pdl_name', 'sl_spoc']
+GENC_IMPORT_COLUMNS = ['associate_id', 'genc_name', 'account_name', 'service_line', 'mentor_associate_id',
+                       'status', 'date_of_joining', 'location', 'current_designation']
+
+def _import_account_frame(db: Session, df: pd.DataFrame, chunk_size: int):
+    account_names = importer.clean_text_column(df['account_name'])
+    epl_names = importer.clean_text_column(df['epl_name'])
+    edp_names = importer.clean_text_column(df['edp_name'])
+    existing_names = importer.load_existing_values(db, models.Account.account_name, account_names.unique().tolist())
+    
+    row_errors = importer.first_row_errors(df.index, [
+        (account_names.isin(existing_names) | account_names.duplicated(),
+         "Account '" + account_names + "' already exists"),
+    ])
+    valid = row_errors.isna()
+    
+    rows = [
+        (index + 2, {"account_name": account_name, "epl_name": epl_name, "edp_name": edp_name})
+        for index, account_name, epl_name, edp_name
+        in zip(df.index[valid], account_names[valid], epl_names[valid], edp_names[valid])
+    ]
+    imported_count, insert_errors = importer.insert_in_chunks(db, models.Account, rows, chunk_size)
+    return imported_count, importer.format_row_errors(row_errors) + insert_errors
+
+def import_accounts_from_file(db: Session, path: str, filename: str, chunk_size: int = importer.DEFAULT_CHUNK_SIZE, progress=None):
+    """Import accounts from a spooled Excel or CSV file"""
     try:
-        # Read the uploaded file content
-        contents = await file.read()
-        
-        # Load the Excel file into a pandas DataFrame
-        df = pd.read_excel(io.BytesIO(contents))
-        
-        # Define expected columns
-        expected_columns = ['account_name', 'epl_name', 'edp_name']
-        
-        # Check if all required columns are present
-        missing_columns = [col for col in expected_columns if col not in df.columns]
-        if missing_columns:
-            raise ValueError(f"Missing required columns: {', '.join(missing_columns)}")
-        
-        # Clean the data
-        df = df.dropna(subset=expected_columns)  # Remove rows with missing required data
-        df = df[expected_columns]  # Keep only required columns
-        
-        # Track import results
-        imported_count = 0
-        skipped_count = 0
-        errors = []
-        
-        # Process each row
-        for index, row in df.iterrows():
-            try:
-                # Check if account already exists
-                existing_account = get_account_by_name(db, row['account_name'])
-                if existing_account:
-                    skipped_count += 1
-                    errors.append(f"Row {index + 2}: Account '{row['account_name']}' already exists")
-                    continue
-                
-                # Create account data
-                account_data = schemas.AccountCreate(
-                    account_name=str(row['account_name']).strip(),
-                    epl_name=str(row['epl_name']).strip(),
-                    edp_name=str(row['edp_name']).strip()
-                )
-                
-                # Create the account
-                create_account(db, account_data)
-                imported_count += 1
-                
-            except Exception as e:
-                skipped_count += 1
-                errors.append(f"Row {index + 2}: {str(e)}")
-        
-        return {
-            "message": "Import completed",
-            "total_rows": len(df),
-            "imported": imported_count,
-            "skipped": skipped_count,
-            "errors": errors[:10] if errors else []  # Limit errors to first 10
-        }
-        
+        return importer.run_import(db, path, filename, ACCOUNT_IMPORT_COLUMNS, _import_account_frame, chunk_size, progress=progress)
     except Exception as e:
         raise ValueError(f"Failed to process Excel file: {str(e)}")
-
-async def import_mentors_from_excel(db: Session, file: UploadFile):
-    """Import mentors from Excel file"""
+    finally:
+        invalidate_dashboard_stats()
+        response_cache.invalidate(response_cache.ACCOUNTS)
+
+def _import_mentor_frame(db: Session, df: pd.DataFrame, chunk_size: int):
+    associate_ids = importer.clean_text_column(df['associate_id'])
+    mentor_names = importer.clean_text_column(df['mentor_name'])
+    designations = importer.clean_text_column(df['designation'])
+    service_lines = importer.clean_text_column(df['service_line'])
+    existing_ids = importer.load_existing_values(db, models.Mentor.associate_id, associate_ids.unique().tolist())
+    
+    row_errors = importer.first_row_errors(df.index, [
+        (associate_ids.isin(existing_ids) | associate_ids.duplicated(),
+         "Mentor '" + associate_ids + "' already exists"),
+        (~designations.isin([designation.value for designation in models.MentorDesignationEnum]),
+         "Invalid designation '" + designations + "'. Valid values: D, AD, SM, M, SA, A"),
+    ])
+    valid = row_errors.isna()
+    
+    rows = [
+        (index + 2, {
+            "associate_id": associate_id,
+            "mentor_name": mentor_name,
+            "designation": models.MentorDesignationEnum(designation),
+            "service_line": service_line
+        })
+        for index, associate_id, mentor_name, designation, service_line
+        in zip(df.index[valid], associate_ids[valid], mentor_names[valid], designations[valid], service_lines[valid])
+    ]
+    imported_count, insert_errors = importer.insert_in_chunks(db, models.Mentor, rows, chunk_size)
+    return imported_count, importer.format_row_errors(row_errors) + insert_errors
+
+def import_mentors_from_file(db: Session, path: str, filename: str, chunk_size: int = importer.DEFAULT_CHUNK_SIZE, progress=None):
+    """Import mentors from a spooled Excel or CSV file"""
     try:
-        # Read the uploaded file content
-        contents = await file.read()
-        
-        # Load the Excel file into a pandas DataFrame
-        df = pd.read_excel(io.BytesIO(contents))
-        
-        # Define expected columns
-        expected_columns = ['associate_id', 'mentor_name', 'designation', 'service_line']
-        
-        # Check if all required columns are present
-        missing_columns = [col for col in expected_columns if col not in df.columns]
-        if missing_columns:
-            raise ValueError(f"Missing required columns: {', '.join(missing_columns)}")
-        
-        # Clean the data
-        df = df.dropna(subset=expected_columns)  # Remove rows with missing required data
-        df = df[expected_columns]  # Keep only required columns
-        
-        # Track import results
-        imported_count = 0
-        skipped_count = 0
-        errors = []
-        
-        # Process each row
-        for index, row in df.iterrows():
-            try:
-                # Check if mentor already exists
-                existing_mentor = get_mentor_by_associate_id(db, row['associate_id'])
-                if existing_mentor:
-                    skipped_count += 1
-                    errors.append(f"Row {index + 2}: Mentor '{row['associate_id']}' already exists")
-                    continue
-                
-                # Validate designation
-                try:
-                    designation = models.MentorDesignationEnum(row['designation'])
-                except ValueError:
-                    skipped_count += 1
-                    errors.append(f"Row {index + 2}: Invalid designation '{row['designation']}'. Valid values: D, AD, SM, M, SA, A")
-                    continue
-                
-                # Create mentor data
-                mentor_data = schemas.MentorCreate(
-                    associate_id=str(row['associate_id']).strip(),
-                    mentor_name=str(row['mentor_name']).strip(),
-                    designation=designation,
-                    service_line=str(row['service_line']).strip()
-                )
-                
-                # Create the mentor
-                create_mentor(db, mentor_data)
-                imported_count += 1
-                
-            except Exception as e:
-                skipped_count += 1
-                errors.append(f"Row {index + 2}: {str(e)}")
-        
-        return {
-            "message": "Import completed",
-            "total_rows": len(df),
-            "imported": imported_count,
-            "skipped": skipped_count,
-            "errors": errors[:10] if errors else []  # Limit errors to first 10
-        }
-        
+        return importer.run_import(db, path, filename, MENTOR_IMPORT_COLUMNS, _import_mentor_frame, chunk_size, progress=progress)
     except Exception as e:
         raise ValueError(f"Failed to process Excel file: {str(e)}")
-
-async def import_account_service_lines_from_excel(db: Session, file: UploadFile):
-    """Import account service lines from Excel file"""
+    finally:
+        invalidate_dashboard_stats()
+        response_cache.invalidate(response_cache.MENTORS)
+
+def _import_account_service_line_frame(db: Session, df: pd.DataFrame, chunk_size: int, account_map: dict):
+    account_names = importer.clean_text_column(df['account_name'])
+    service_line_names = importer.clean_text_column(df['service_line'])
+    edl_names = importer.clean_text_column(df['edl_name'])
+    pdl_names = importer.clean_text_column(df['pdl_name'])
+    sl_spocs = importer.clean_text_column(df['sl_spoc'])
+    account_ids = account_names.map(account_map)
+    
+    row_errors = importer.first_row_errors(df.index, [
+        (account_ids.isna(), "Account '" + account_names + "' not found"),
+    ])
+    valid = row_errors.isna()
+    
+    rows = [
+        (index + 2, {
+            "account_id": int(account_id),
+            "service_line": service_line,
+            "edl_name": edl_name,
+            "pdl_name": pdl_name,
+            "sl_spoc": sl_spoc
+        })
+        for index, account_id, service_line, edl_name, pdl_name, sl_spoc
+        in zip(df.index[valid], account_ids[valid], service_line_names[valid], edl_names[valid], pdl_names[valid], sl_spocs[valid])
+    ]
+    imported_count, insert_errors = importer.insert_in_chunks(db, models.AccountServiceLine, rows, chunk_size)
+    return imported_count, importer.format_row_errors(row_errors) + insert_errors
+
+def import_account_service_lines_from_file(db: Session, path: str, filename: str, chunk_size: int = importer.DEFAULT_CHUNK_SIZE, progress=None):
+    """Import account service lines from a spooled Excel or CSV file"""
     try:
-        # Read the uploaded file content
-        contents = await file.read()
-        
-        # Load the Excel file into a pandas DataFrame
-        df = pd.read_excel(io.BytesIO(contents))
-        
-        # Define expected columns
-        expected_columns = ['account_name', 'service_line', 'edl_name', 'pdl_name', 'sl_spoc']
-        
-        # Check if all required columns are present
-        missing_columns = [col for col in expected_columns if col not in df.columns]
-        if missing_columns:
-            raise ValueError(f"Missing required columns: {', '.join(missing_columns)}")
-        
-        # Clean the data
-        df = df.dropna(subset=expected_columns)  # Remove rows with missing required data
-        df = df[expected_columns]  # Keep only required columns
-        
-        # Track import results
-        imported_count = 0
-        skipped_count = 0
-        errors = []
-        
-        # Process each row
-        for index, row in df.iterrows():
-            try:
-                # Find account by name
-                account = get_account_by_name(db, row['account_name'])
-                if not account:
-                    skipped_count += 1
-                    errors.append(f"Row {index + 2}: Account '{row['account_name']}' not found")
-                    continue
-                
-                # Create service line data
-                service_line_data = schemas.AccountServiceLineCreate(
-                    account_id=account.id,
-                    service_line=str(row['service_line']).strip(),
-                    edl_name=str(row['edl_name']).strip(),
-                    pdl_name=str(row['pdl_name']).strip(),
-                    sl_spoc=str(row['sl_spoc']).strip()
-                )
-                
-                # Create the service line
-                create_account_service_line(db, service_line_data)
-                imported_count += 1
-                
-            except Exception as e:
-                skipped_count += 1
-                errors.append(f"Row {index + 2}: {str(e)}")
-        
-        return {
-            "message": "Import completed",
-            "total_rows": len(df),
-            "imported": imported_count,
-            "skipped": skipped_count,
-            "errors": errors[:10] if errors else []  # Limit errors to first 10
-        }
-        
+        account_map = {name: id_ for id_, name in db.query(models.Account.id, models.Account.account_name)}
+        return importer.run_import(
+            db, path, filename, ACCOUNT_SERVICE_LINE_IMPORT_COLUMNS,
+            lambda db, df, chunk_size: _import_account_service_line_frame(db, df, chunk_size, account_map),
+            chunk_size, progress=progress
+        )
     except Exception as e:
         raise ValueError(f"Failed to process Excel file: {str(e)}")
 
-async def import_gencs_from_excel(db: Session, file: UploadFile):
-    """Import GenCs from Excel file"""
+def _load_genc_import_lookups(db: Session):
+    """Preload the account, service line and mentor maps the GenC importer needs"""
+    account_ids = {name: id_ for id_, name in db.query(models.Account.id, models.Account.account_name)}
+    
+    # Keep the lowest id per (account, service line) pair, matching the old .first() lookup
+    service_line_ids = {}
+    for id_, account_id, name in db.query(
+        models.AccountServiceLine.id,
+        models.AccountServiceLine.account_id,
+        models.AccountServiceLine.service_line
+    ).order_by(models.AccountServiceLine.id.desc()):
+        service_line_ids[(account_id, name)] = id_
+    
+    mentor_ids = {associate_id: id_ for id_, associate_id in db.query(models.Mentor.id, models.Mentor.associate_id)}
+    
+    return account_ids, service_line_ids, mentor_ids
+
+def _import_genc_frame(db: Session, df: pd.DataFrame, chunk_size: int, lookups):
+    account_map, service_line_map, mentor_map = lookups
+    
+    associate_ids = importer.clean_text_column(df['associate_id'])
+    genc_names = importer.clean_text_column(df['genc_name'])
+    account_names = importer.clean_text_column(df['account_name'])
+    service_line_names = importer.clean_text_column(df['service_line'])
+    mentor_associate_ids = importer.clean_text_column(df['mentor_associate_id'])
+    statuses = importer.clean_text_column(df['status'])
+    locations = importer.clean_text_column(df['location'])
+    designations = importer.clean_text_column(df['current_designation'])
+    existing_associate_ids = importer.load_existing_values(db, models.GenC.associate_id, associate_ids.unique().tolist())
+    
+    # Resolve foreign keys for every row at once
+    account_ids = account_names.map(account_map)
+    service_line_ids = pd.Series(
+        [service_line_map.get((account_id, name)) for account_id, name in zip(account_ids, service_line_names)],
+        index=df.index, dtype=object
+    )
+    mentor_ids = mentor_associate_ids.map(mentor_map)
+    dates_of_joining = pd.to_datetime(df['date_of_joining'], format='%Y-%m-%d', errors='coerce')
+    
+    # Record the first failing check per row, in the same order the per-row importer used
+    row_errors = importer.first_row_errors(df.index, [
+        (associate_ids.isin(existing_associate_ids) | associate_ids.duplicated(),
+         "GenC '" + associate_ids + "' already exists"),
+        (account_ids.isna(),
+         "Account '" + account_names + "' not found"),
+        (service_line_ids.isna(),
+         "Service line '" + service_line_names + "' not found for account '" + account_names + "'"),
+        (mentor_ids.isna(),
+         "Mentor '" + mentor_associate_ids + "' not found"),
+        (~statuses.isin([status.value for status in models.StatusEnum]),
+         "Invalid status '" + statuses + "'"),
+        (~locations.isin([location.value for location in models.LocationEnum]),
+         "Invalid location '" + locations + "'"),
+        (~designations.isin([designation.value for designation in models.DesignationEnum]),
+         "Invalid designation '" + designations + "'"),
+        (dates_of_joining.isna(),
+         "Invalid date format for date_of_joining. Use YYYY-MM-DD format"),
+    ])
+    valid = row_errors.isna()
+    
+    rows = [
+        (index + 2, {
+            "associate_id": associate_id,
+            "genc_name": genc_name,
+            "account_id": int(account_id),
+            "service_line_id": int(service_line_id),
+            "mentor_id": int(mentor_id),
+            "status": models.StatusEnum(status),
+            "date_of_joining": date_of_joining.date(),
+            "location": models.LocationEnum(location),
+            "current_designation": models.DesignationEnum(designation),
+        })
+        for index, associate_id, genc_name, account_id, service_line_id, mentor_id, status, date_of_joining, location, designation
+        in zip(df.index[valid], associate_ids[valid], genc_names[valid], account_ids[valid], service_line_ids[valid],
+               mentor_ids[valid], statuses[valid], dates_of_joining[valid], locations[valid], designations[valid])
+    ]
+    imported_count, insert_errors = importer.insert_in_chunks(db, models.GenC, rows, chunk_size)
+    return imported_count, importer.format_row_errors(row_errors) + insert_errors
+
+def import_gencs_from_file(db: Session, path: str, filename: str, chunk_size: int = importer.DEFAULT_CHUNK_SIZE, progress=None):
+    """Import GenCs from a spooled Excel or CSV file using preloaded lookups and chunked bulk inserts"""
     try:
-        # Read the uploaded file content
-        contents = await file.read()
-        
-        # Load the Excel file into a pandas DataFrame
-        df = pd.read_excel(io.BytesIO(contents))
-        
-        # Define expected columns
-        expected_columns = ['associate_id', 'genc_name', 'account_name', 'service_line', 'mentor_associate_id', 
-                          'status', 'date_of_joining', 'location', 'current_designation']
-        
-        # Check if all required columns are present
-        missing_columns = [col for col in expected_columns if col not in df.columns]
-        if missing_columns:
-            raise ValueError(f"Missing required columns: {', '.join(missing_columns)}")
-        
-        # Clean the data - only check required columns for NaN
-        required_cols = ['associate_id', 'genc_name', 'account_name', 'service_line', 'mentor_associate_id', 
-                        'status', 'date_of_joining', 'location', 'current_designation']
-        df = df.dropna(subset=required_cols)
-        
-        # Track import results
-        imported_count = 0
-        skipped_count = 0
-        errors = []
-        
-        # Process each row
-        for index, row in df.iterrows():
-            try:
-                # Check if GenC already exists
-                existing_genc = get_genc_by_associate_id(db, row['associate_id'])
-                if existing_genc:
-                    skipped_count += 1
-                    errors.append(f"Row {index + 2}: GenC '{row['associate_id']}' already exists")
-                    continue
-                
-                # Find account by name
-                account = get_account_by_name(db, row['account_name'])
-                if not account:
-                    skipped_count += 1
-                    errors.append(f"Row {index + 2}: Account '{row['account_name']}' not found")
-                    continue
-                
-                # Find service line by account and service line name
-                service_line = db.query(models.AccountServiceLine).filter(
-                    models.AccountServiceLine.account_id == account.id,
-                    models.AccountServiceLine.service_line == row['service_line']
-                ).first()
-                if not service_line:
-                    skipped_count += 1
-                    errors.append(f"Row {index + 2}: Service line '{row['service_line']}' not found for account '{row['account_name']}'")
-                    continue
-                
-                # Find mentor by associate ID
-                mentor = get_mentor_by_associate_id(db, row['mentor_associate_id'])
-                if not mentor:
-                    skipped_count += 1
-                    errors.append(f"Row {index + 2}: Mentor '{row['mentor_associate_id']}' not found")
-                    continue
-                
-                # Validate enums
-                try:
-                    status = models.StatusEnum(row['status'])
-                except ValueError:
-                    skipped_count += 1
-                    errors.append(f"Row {index + 2}: Invalid status '{row['status']}'")
-                    continue
-                
-                try:
-                    location = models.LocationEnum(row['location'])
-                except ValueError:
-                    skipped_count += 1
-                    errors.append(f"Row {index + 2}: Invalid location '{row['location']}'")
-                    continue
-                
-                try:
-                    designation = models.DesignationEnum(row['current_designation'])
-                except ValueError:
-                    skipped_count += 1
-                    errors.append(f"Row {index + 2}: Invalid designation '{row['current_designation']}'")
-                    continue
-                
-                # Parse date
-                try:
-                    if isinstance(row['date_of_joining'], str):
-                        from datetime import datetime
-                        date_of_joining = datetime.strptime(row['date_of_joining'], '%Y-%m-%d').date()
-                    else:
-                        date_of_joining = row['date_of_joining'].date() if hasattr(row['date_of_joining'], 'date') else row['date_of_joining']
-                except ValueError:
-                    skipped_count += 1
-                    errors.append(f"Row {index + 2}: Invalid date format for date_of_joining. Use YYYY-MM-DD format")
-                    continue
-                
-                # Create GenC data
-                genc_data = schemas.GenCCreate(
-                    associate_id=str(row['associate_id']).strip(),
-                    genc_name=str(row['genc_name']).strip(),
-                    account_id=account.id,
-                    service_line_id=service_line.id,
-                    mentor_id=mentor.id,
-                    status=status,
-                    date_of_joining=date_of_joining,
-                    location=location,
-                    current_designation=designation,
-                    # Optional fields
-                    date_of_allocation=None,
-                    allocation_project=None,
-                    team_name=None,
-                    planned_billing_start_date=None,
-                    actual_billing_start_date=None
-                )
-                
-                # Create the GenC
-                create_genc(db, genc_data)
-                imported_count += 1
-                
-            except Exception as e:
-                skipped_count += 1
-                errors.append(f"Row {index + 2}: {str(e)}")
-        
-        return {
-            "message": "Import completed",
-            "total_rows": len(df),
-            "imported": imported_count,
-            "skipped": skipped_count,
-            "errors": errors[:10] if errors else []  # Limit errors to first 10
-        }
-        
+        lookups = _load_genc_import_lookups(db)
+        return importer.run_import(
+            db, path, filename, GENC_IMPORT_COLUMNS,
+            lambda db, df, chunk_size: _import_genc_frame(db, df, chunk_size, lookups),
+            chunk_size, progress=progress
+        )
     except Exception as e:
         raise ValueError(f"Failed to process Excel file: {str(e)}")
-
-def delete_all_accounts_and_related_data(db: Session):
-    """Delete all accounts and their related data in the correct order"""
-    try:
-        # Get counts before deletion for reporting
-        gencs_count = db.query(models.GenC).count()
-        genc_skills_count = db.query(models.GenCSkill).count()
-        genc_feedbacks_count = db.query(models.GenCFeedback).count()
-        service_lines_count = db.query(models.AccountServiceLine).count()
-        accounts_count = db.query(models.Account).count()
-        
-        # Delete in order to respect foreign key constraints
-        # 1. Delete GenC Skills (depends on GenC)
-        db.query(models.GenCSkill).filter(
-            models.GenCSkill.genc_id.in_(
-                db.query(models.GenC.id).filter(
-                    models.GenC.account_id.in_(
-                        db.query(models.Account.id)
-                    )
-                )
-            )
-        ).delete(synchronize_session=False)
-        
-        # 2. Delete GenC Feedback (depends on GenC)
-        db.query(models.GenCFeedback).filter(
-            models.GenCFeedback.genc_id.in_(
-                db.query(models.GenC.id).filter(
-                    models.GenC.account_id.in_(
-                        db.query(models.Account.id)
-                    )
-                )
-            )
-        ).delete(synchronize_session=False)
-        
-        # 3. Delete GenCs (depends on Account and AccountServiceLine)
-        db.query(models.GenC).filter(
-            models.GenC.account_id.in_(
-                db.query(models.Account.id)
-            )
-        ).delete(synchronize_session=False)
-        
-        # 4. Delete Account Service Lines (depends on Account)
-        db.query(models.AccountServiceLine).filter(
-            models.AccountServiceLine.account_id.in_(
-                db.query(models.Account.id)
-            )
-        ).delete(synchronize_session=False)
-        
-        # 5. Delete Accounts
-        db.query(models.Account).delete(synchronize_session=False)
-        
-        # Commit all deletions
+    finally:
+        # Materialize skill matrix rows for the GenCs inserted by the committed chunks
+        db.rollback()
+        skill_matrix.fill_missing(db)
+        status_history.fill_missing(db)
+        invalidate_dashboard_stats()
+        role_fit.invalidate()
+
+def _delete_in_batches(db: Session, model, chunk_size: int) -> int:
+    """Delete every row of a table, committing after each batch of chunk_size rows"""
+    total = 0
+    while True:
+        batch = select(model.id).order_by(model.id).limit(chunk_size).scalar_subquery()
+        deleted = _delete_rows(db, model, model.id.in_(batch))
         db.commit()
-        
-        return {
-            "message": "All accounts and related data deleted successfully",
-            "deleted_counts": {
-                "genc_skills": genc_skills_count,
-                "genc_feedbacks": genc_feedbacks_count,
-                "gencs": gencs_count,
-                "account_service_lines": service_lines_count,
-                "accounts": accounts_count
-            }
-        }
-        
+        total += deleted
+        if deleted < chunk_size:
+            return total
+
+def delete_all_accounts_and_related_data(db: Session, chunk_size: Optional[int] = None):
+    """Delete all accounts and their service lines, GenCs and GenC data.
+
+    By default everything goes in one transaction. With chunk_size, rows are deleted in batches of
+    that many GenCs (then service lines, then accounts), each committed on its own, so other writers
+    only ever wait for one batch; a failure part way leaves the batches already committed deleted.
+    Counts come from the deletes themselves.
+    """
+    counts = {"genc_skills": 0, "genc_feedbacks": 0, "gencs": 0, "account_service_lines": 0, "accounts": 0}
+    account_gencs = select(models.GenC.id).where(models.GenC.account_id.in_(select(models.Account.id)))
+    try:
+        if chunk_size is None:
+            counts.update(_delete_gencs(db, account_gencs))
+            counts["account_service_lines"] = _delete_rows(db, models.AccountServiceLine)
+            counts["accounts"] = _delete_rows(db, models.Account)
+            db.commit()
+        else:
+            while True:
+                genc_ids = db.execute(account_gencs.order_by(models.GenC.id).limit(chunk_size)).scalars().all()
+                if not genc_ids:
+                    break
+                for key, deleted in _delete_gencs(db, genc_ids).items():
+                    counts[key] += deleted
+                db.commit()
+            counts["account_service_lines"] = _delete_in_batches(db, models.AccountServiceLine, chunk_size)
+            counts["accounts"] = _delete_in_batches(db, models.Account, chunk_size)
     except Exception as e:
         db.rollback()
         raise ValueError(f"Failed to delete accounts and related data: {str(e)}")
+    finally:
+        invalidate_dashboard_stats()
+        role_fit.invalidate()
+        response_cache.invalidate(response_cache.ACCOUNTS)
+
+    return {
+        "message": "All accounts and related data deleted successfully",
+        "deleted_counts": counts
+    }
 
 # Account Service Line CRUD
 def get_account_service_line(db: Session, service_line_id: int):
     return db.query(models.AccountServiceLine).filter(models.AccountServiceLine.id == service_line_id).first()
 
-def get_account_service_lines(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(models.AccountServiceLine).options(
+def get_account_service_lines(db: Session, skip: int = 0, limit: int = 100, after: Optional[int] = None):
+    query = db.query(models.AccountServiceLine).options(
         joinedload(models.AccountServiceLine.account)
-    ).offset(skip).limit(limit).all()
+    )
+    return paginate(query, models.AccountServiceLine.id, skip, limit, after)
 
 def get_service_lines_by_account(db: Session, account_id: int):
     return db.query(models.AccountServiceLine).filter(models.AccountServiceLine.account_id == account_id).all()
 
 def create_account_service_line(db: Session, service_line: schemas.AccountServiceLineCreate):
-    db_service_line = models.AccountServiceLine(**service_line.model_dump())
-    db.add(db_service_line)
+    db_service_line = _insert_returning(db, models.AccountServiceLine, service_line.model_dump())
     db.commit()
-    db.refresh(db_service_line)
     return db_service_line
 
-def update_account_service_line(db: Session, service_line_id: int, service_line: schemas.AccountServiceLineUpdate):
-    db_service_line = get_account_service_line(db, service_line_id)
+def update_account_service_line(db: Session, service_line_id: int,
+                                service_line: Union[schemas.AccountServiceLineUpdate, schemas.AccountServiceLinePatch]):
+    db_service_line = _update_returning(db, models.AccountServiceLine, service_line_id, _changes(service_line))
     if db_service_line:
-        for key, value in service_line.model_dump().items():
-            setattr(db_service_line, key, value)
         db.commit()
-        db.refresh(db_service_line)
     return db_service_line
 
 def delete_account_service_line(db: Session, service_line_id: int):
-    db_service_line = get_account_service_line(db, service_line_id)
-    if db_service_line:
-        db.delete(db_service_line)
-        db.commit()
-    return db_service_line
+    """Delete a service line with a set-based DELETE.
+
+    Returns the deleted row counts, or None if the service line does not exist. Raises ValueError
+    while GenCs are still on the service line.
+    """
+    assigned = db.query(func.count(models.GenC.id)).filter(models.GenC.service_line_id == service_line_id).scalar()
+    if assigned:
+        raise ValueError(f"Service line has {assigned} GenCs; move them to another service line before deleting it")
+    counts = {
+        "account_service_lines": _delete_rows(db, models.AccountServiceLine, models.AccountServiceLine.id == service_line_id)
+    }
+    if not counts["account_service_lines"]:
+        db.rollback()
+        return None
+    db.commit()
+    return counts
 
 # Mentor CRUD
 def get_mentor(db: Session, mentor_id: int):
@@ -518,31 +475,47 @@ def get_mentor(db: Session, mentor_id: int):
 def get_mentor_by_associate_id(db: Session, associate_id: str):
     return db.query(models.Mentor).filter(models.Mentor.associate_id == associate_id).first()
 
-def get_mentors(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(models.Mentor).offset(skip).limit(limit).all()
+def get_mentors(db: Session, skip: int = 0, limit: int = 100, after: Optional[int] = None):
+    return paginate(db.query(models.Mentor), models.Mentor.id, skip, limit, after)
 
 def create_mentor(db: Session, mentor: schemas.MentorCreate):
-    db_mentor = models.Mentor(**mentor.model_dump())
-    db.add(db_mentor)
+    db_mentor = _insert_returning(db, models.Mentor, mentor.model_dump())
     db.commit()
-    db.refresh(db_mentor)
+    invalidate_dashboard_stats()
+    response_cache.invalidate(response_cache.MENTORS)
     return db_mentor
 
-def update_mentor(db: Session, mentor_id: int, mentor: schemas.MentorUpdate):
-    db_mentor = get_mentor(db, mentor_id)
+def update_mentor(db: Session, mentor_id: int, mentor: Union[schemas.MentorUpdate, schemas.MentorPatch]):
+    db_mentor = _update_returning(db, models.Mentor, mentor_id, _changes(mentor))
     if db_mentor:
-        for key, value in mentor.model_dump().items():
-            setattr(db_mentor, key, value)
         db.commit()
-        db.refresh(db_mentor)
+        response_cache.invalidate(response_cache.MENTORS)
     return db_mentor
 
 def delete_mentor(db: Session, mentor_id: int):
-    db_mentor = get_mentor(db, mentor_id)
-    if db_mentor:
-        db.delete(db_mentor)
-        db.commit()
-    return db_mentor
+    """Delete a mentor and the feedback they gave with set-based DELETEs.
+
+    Returns the deleted row counts, or None if the mentor does not exist. Raises ValueError while
+    GenCs are still assigned to the mentor.
+    """
+    assigned = db.query(func.count(models.GenC.id)).filter(models.GenC.mentor_id == mentor_id).scalar()
+    if assigned:
+        raise ValueError(f"Mentor has {assigned} GenCs assigned; reassign them before deleting the mentor")
+    feedback_ids = db.execute(
+        delete(models.GenCFeedback).where(models.GenCFeedback.mentor_id == mentor_id).returning(models.GenCFeedback.id)
+    ).scalars().all()
+    search_index.remove(db, search_index.FEEDBACK, feedback_ids)
+    counts = {
+        "genc_feedbacks": len(feedback_ids),
+        "mentors": _delete_rows(db, models.Mentor, models.Mentor.id == mentor_id)
+    }
+    if not counts["mentors"]:
+        db.rollback()
+        return None
+    db.commit()
+    invalidate_dashboard_stats()
+    response_cache.invalidate(response_cache.MENTORS)
+    return counts
 
 # Skill CRUD
 def get_skill(db: Session, skill_id: int):
@@ -551,34 +524,57 @@ def get_skill(db: Session, skill_id: int):
 def get_skill_by_name(db: Session, skill_name: str):
     return db.query(models.Skill).filter(models.Skill.skill_name == skill_name).first()
 
-def get_skills(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(models.Skill).offset(skip).limit(limit).all()
+def get_skills(db: Session, skip: int = 0, limit: int = 100, after: Optional[int] = None):
+    return paginate(db.query(models.Skill), models.Skill.id, skip, limit, after)
+
+def get_skill_categories(db: Session):
+    return skill_matrix.get_categories(db)
 
 def get_skills_by_category(db: Session, category: str):
     return db.query(models.Skill).filter(models.Skill.category == category).all()
 
 def create_skill(db: Session, skill: schemas.SkillCreate):
-    db_skill = models.Skill(**skill.model_dump())
-    db.add(db_skill)
+    db_skill = _insert_returning(db, models.Skill, skill.model_dump())
     db.commit()
-    db.refresh(db_skill)
+    response_cache.invalidate(response_cache.SKILLS)
     return db_skill
 
-def update_skill(db: Session, skill_id: int, skill: schemas.SkillUpdate):
-    db_skill = get_skill(db, skill_id)
+def update_skill(db: Session, skill_id: int, skill: Union[schemas.SkillUpdate, schemas.SkillPatch]):
+    db_skill = _update_returning(db, models.Skill, skill_id, _changes(skill))
     if db_skill:
-        for key, value in skill.model_dump().items():
-            setattr(db_skill, key, value)
+        skill_matrix.refresh_skill(db, skill_id)
         db.commit()
-        db.refresh(db_skill)
+        response_cache.invalidate(response_cache.SKILLS)
     return db_skill
 
 def delete_skill(db: Session, skill_id: int):
-    db_skill = get_skill(db, skill_id)
-    if db_skill:
-        db.delete(db_skill)
-        db.commit()
-    return db_skill
+    """Delete a skill, the GenC skills holding it and the role requirements for it with set-based DELETEs.
+
+    Returns the deleted row counts, or None if the skill does not exist.
+    """
+    genc_skills = db.execute(
+        delete(models.GenCSkill).where(models.GenCSkill.skill_id == skill_id)
+        .returning(models.GenCSkill.id, models.GenCSkill.genc_id)
+    ).all()
+    search_index.remove(db, search_index.SKILL_NOTE, [genc_skill_id for genc_skill_id, _ in genc_skills])
+    roles = db.execute(
+        delete(models.RoleSkillRequirement).where(models.RoleSkillRequirement.skill_id == skill_id)
+        .returning(models.RoleSkillRequirement.role)
+    ).scalars().all()
+    counts = {
+        "genc_skills": len(genc_skills),
+        "role_skill_requirements": len(roles),
+        "skills": _delete_rows(db, models.Skill, models.Skill.id == skill_id)
+    }
+    if not counts["skills"]:
+        db.rollback()
+        return None
+    skill_matrix.refresh(db, [genc_id for _, genc_id in genc_skills])
+    skill_matrix.refresh_role(db, roles)
+    db.commit()
+    response_cache.invalidate(response_cache.SKILLS, response_cache.ROLE_REQUIREMENTS)
+    role_fit.invalidate()
+    return counts
 
 # GenC Skill CRUD
 def get_genc_skill(db: Session, genc_skill_id: int):
@@ -587,11 +583,12 @@ def get_genc_skill(db: Session, genc_skill_id: int):
         joinedload(models.GenCSkill.genc)
     ).filter(models.GenCSkill.id == genc_skill_id).first()
 
-def get_genc_skills(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(models.GenCSkill).options(
+def get_genc_skills(db: Session, skip: int = 0, limit: int = 100, after: Optional[int] = None):
+    query = db.query(models.GenCSkill).options(
         joinedload(models.GenCSkill.skill),
         joinedload(models.GenCSkill.genc)
-    ).offset(skip).limit(limit).all()
+    )
+    return paginate(query, models.GenCSkill.id, skip, limit, after)
 
 def get_skills_by_genc(db: Session, genc_id: int):
     return db.query(models.GenCSkill).options(
@@ -604,53 +601,170 @@ def get_gencs_by_skill(db: Session, skill_id: int):
     ).filter(models.GenCSkill.skill_id == skill_id).all()
 
 def create_genc_skill(db: Session, genc_skill: schemas.GenCSkillCreate):
-    # Check if this GenC-Skill combination already exists
-    existing = db.query(models.GenCSkill).filter(
-        and_(models.GenCSkill.genc_id == genc_skill.genc_id, 
-             models.GenCSkill.skill_id == genc_skill.skill_id)
-    ).first()
-    
-    if existing:
-        # Update existing record
-        for key, value in genc_skill.model_dump().items():
-            setattr(existing, key, value)
-        db.commit()
-        db.refresh(existing)
-        return existing
+    """Create a GenC skill, or update the existing one for the same GenC and skill, in one upsert
+    where the database supports it"""
+    if _can_upsert(db, "uq_genc_skills_genc_id_skill_id"):
+        stmt = _upsert_insert(db, models.GenCSkill).values(**genc_skill.model_dump())
+        db_genc_skill = db.execute(stmt.on_conflict_do_update(
+            index_elements=[models.GenCSkill.genc_id, models.GenCSkill.skill_id],
+            set_={
+                "proficiency_level": stmt.excluded.proficiency_level,
+                "date_acquired": stmt.excluded.date_acquired,
+                "notes": stmt.excluded.notes
+            }
+        ).returning(*models.GenCSkill.__table__.c)).one()
     else:
-        # Create new record
-        db_genc_skill = models.GenCSkill(**genc_skill.model_dump())
-        db.add(db_genc_skill)
-        db.commit()
-        db.refresh(db_genc_skill)
-        return db_genc_skill
+        (db_genc_skill,) = _write_by_lookup(db, models.GenCSkill, ["genc_id", "skill_id"], [genc_skill.model_dump()])
+    skill_matrix.refresh(db, [db_genc_skill.genc_id])
+    search_index.index_genc_skill(db, db_genc_skill)
+    db.commit()
+    role_fit.invalidate()
+    return db_genc_skill
 
-def update_genc_skill(db: Session, genc_skill_id: int, genc_skill: schemas.GenCSkillUpdate):
-    db_genc_skill = get_genc_skill(db, genc_skill_id)
+def update_genc_skill(db: Session, genc_skill_id: int, genc_skill: Union[schemas.GenCSkillUpdate, schemas.GenCSkillPatch]):
+    db_genc_skill = _update_returning(db, models.GenCSkill, genc_skill_id, _changes(genc_skill))
     if db_genc_skill:
-        for key, value in genc_skill.model_dump(exclude_unset=True).items():
-            setattr(db_genc_skill, key, value)
+        skill_matrix.refresh(db, [db_genc_skill.genc_id])
+        search_index.index_genc_skill(db, db_genc_skill)
         db.commit()
-        db.refresh(db_genc_skill)
+        role_fit.invalidate()
     return db_genc_skill
 
 def delete_genc_skill(db: Session, genc_skill_id: int):
     db_genc_skill = get_genc_skill(db, genc_skill_id)
     if db_genc_skill:
         db.delete(db_genc_skill)
+        skill_matrix.refresh(db, [db_genc_skill.genc_id])
+        search_index.remove(db, search_index.SKILL_NOTE, [genc_skill_id])
         db.commit()
+        role_fit.invalidate()
     return db_genc_skill
 
+# Rows per multi-row INSERT in upsert_genc_skills(), well under SQLite's bound parameter limit
+UPSERT_BATCH_SIZE = 500
+
+def _can_upsert(db: Session, index_name: str) -> bool:
+    """Whether the database can run an ON CONFLICT upsert against the unique index index_name.
+
+    Other dialects have no ON CONFLICT, and on an existing database migrations.upgrade() leaves the
+    index out while duplicate rows block it; callers then look the rows up and write them instead.
+    """
+    return (db.get_bind().dialect.name in ("postgresql", "sqlite")
+            and index_name in migrations.unique_indexes(db.connection()))
+
+def _write_by_lookup(db: Session, model, keys: List[str], rows: List[dict]) -> list:
+    """Update the row matching each value dict on the key columns, or add it when there is none.
+
+    The fallback for upserts that cannot run ON CONFLICT. Where duplicates exist the oldest row is
+    updated. Returns the written ORM objects, flushed, in the order of rows.
+    """
+    key_columns = [getattr(model, key) for key in keys]
+    written = []
+    for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+        batch = rows[start:start + UPSERT_BATCH_SIZE]
+        existing = {}
+        for db_row in db.query(model).filter(
+            tuple_(*key_columns).in_([tuple(row[key] for key in keys) for row in batch])
+        ).order_by(model.id):
+            existing.setdefault(tuple(getattr(db_row, key) for key in keys), db_row)
+        for row in batch:
+            db_row = existing.get(tuple(row[key] for key in keys))
+            if db_row is None:
+                db_row = model(**row)
+                db.add(db_row)
+            else:
+                for key, value in row.items():
+                    setattr(db_row, key, value)
+            written.append(db_row)
+    db.flush()
+    return written
+
+def _upsert_insert(db: Session, model):
+    """INSERT construct supporting ON CONFLICT for the session's database, once _can_upsert() has allowed it"""
+    if db.get_bind().dialect.name == "postgresql":
+        return postgresql.insert(model)
+    return sqlite.insert(model)
+
+def upsert_genc_skills(db: Session, items: List[schemas.GenCSkillCreate], replace_genc_ids: Optional[List[int]] = None):
+    """Create or update many GenC skills in one transaction, keyed on the unique (genc_id, skill_id).
+
+    Skills of the GenCs in replace_genc_ids that are not in items are deleted. Returns the resulting
+    skills of every affected GenC.
+    """
+    pairs = set()
+    for item in items:
+        if (item.genc_id, item.skill_id) in pairs:
+            raise ValueError(f"Skill {item.skill_id} is listed more than once for GenC {item.genc_id}")
+        pairs.add((item.genc_id, item.skill_id))
+
+    genc_ids = sorted({item.genc_id for item in items} | set(replace_genc_ids or []))
+    missing_gencs = set(genc_ids) - {genc_id for (genc_id,) in db.query(models.GenC.id).filter(models.GenC.id.in_(genc_ids))}
+    if missing_gencs:
+        raise ValueError(f"GenC {min(missing_gencs)} not found")
+    skill_ids = {item.skill_id for item in items}
+    missing_skills = skill_ids - {skill_id for (skill_id,) in db.query(models.Skill.id).filter(models.Skill.id.in_(skill_ids))}
+    if missing_skills:
+        raise ValueError(f"Skill {min(missing_skills)} not found")
+
+    if replace_genc_ids:
+        removed = delete(models.GenCSkill).where(models.GenCSkill.genc_id.in_(replace_genc_ids))
+        if pairs:
+            removed = removed.where(tuple_(models.GenCSkill.genc_id, models.GenCSkill.skill_id).notin_(sorted(pairs)))
+        # Only the search index needs the removed ids, and RETURNING is not available everywhere
+        if search_index.is_supported(db):
+            removed_ids = db.execute(removed.returning(models.GenCSkill.id)).scalars().all()
+            search_index.remove(db, search_index.SKILL_NOTE, removed_ids)
+        else:
+            db.execute(removed)
+
+    rows = [item.model_dump() for item in items]
+    if _can_upsert(db, "uq_genc_skills_genc_id_skill_id"):
+        for start in range(0, len(rows), UPSERT_BATCH_SIZE):
+            stmt = _upsert_insert(db, models.GenCSkill).values(rows[start:start + UPSERT_BATCH_SIZE])
+            db.execute(stmt.on_conflict_do_update(
+                index_elements=[models.GenCSkill.genc_id, models.GenCSkill.skill_id],
+                set_={
+                    "proficiency_level": stmt.excluded.proficiency_level,
+                    "date_acquired": stmt.excluded.date_acquired,
+                    "notes": stmt.excluded.notes
+                }
+            ))
+    else:
+        _write_by_lookup(db, models.GenCSkill, ["genc_id", "skill_id"], rows)
+
+    if search_index.is_supported(db):
+        search_index.index_genc_skills(db, [
+            genc_skill for genc_skill in db.query(models.GenCSkill).filter(
+                models.GenCSkill.genc_id.in_(genc_ids)
+            ).populate_existing()
+            if (genc_skill.genc_id, genc_skill.skill_id) in pairs
+        ])
+    skill_matrix.refresh(db, genc_ids)
+    db.commit()
+    role_fit.invalidate()
+
+    return db.query(models.GenCSkill).options(
+        joinedload(models.GenCSkill.skill)
+    ).filter(models.GenCSkill.genc_id.in_(genc_ids)).order_by(models.GenCSkill.genc_id, models.GenCSkill.id).all()
+
+def replace_genc_skills(db: Session, genc_id: int, skills: List[schemas.GenCSkillAssignment]):
+    """Make skills the complete skill set of a GenC; None if the GenC does not exist"""
+    if db.query(models.GenC.id).filter(models.GenC.id == genc_id).first() is None:
+        return None
+    items = [schemas.GenCSkillCreate(genc_id=genc_id, **skill.model_dump()) for skill in skills]
+    return upsert_genc_skills(db, items, replace_genc_ids=[genc_id])
+
 # Role Skill Requirement CRUD
 def get_role_skill_requirement(db: Session, requirement_id: int):
     return db.query(models.RoleSkillRequirement).options(
         joinedload(models.RoleSkillRequirement.skill)
     ).filter(models.RoleSkillRequirement.id == requirement_id).first()
 
-def get_role_skill_requirements(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(models.RoleSkillRequirement).options(
+def get_role_skill_requirements(db: Session, skip: int = 0, limit: int = 100, after: Optional[int] = None):
+    query = db.query(models.RoleSkillRequirement).options(
         joinedload(models.RoleSkillRequirement.skill)
-    ).offset(skip).limit(limit).all()
+    )
+    return paginate(query, models.RoleSkillRequirement.id, skip, limit, after)
 
 def get_requirements_by_role(db: Session, role: models.DesignationEnum):
     return db.query(models.RoleSkillRequirement).options(
@@ -658,41 +772,47 @@ def get_requirements_by_role(db: Session, role: models.DesignationEnum):
     ).filter(models.RoleSkillRequirement.role == role).all()
 
 def create_role_skill_requirement(db: Session, requirement: schemas.RoleSkillRequirementCreate):
-    # Check if this role-skill combination already exists
-    existing = db.query(models.RoleSkillRequirement).filter(
-        and_(models.RoleSkillRequirement.role == requirement.role,
-             models.RoleSkillRequirement.skill_id == requirement.skill_id)
-    ).first()
-    
-    if existing:
-        # Update existing record
-        for key, value in requirement.model_dump().items():
-            setattr(existing, key, value)
-        db.commit()
-        db.refresh(existing)
-        return existing
+    """Create a role requirement, or update the existing one for the same role and skill, in one upsert
+    where the database supports it"""
+    if _can_upsert(db, "uq_role_skill_requirements_role_skill_id"):
+        stmt = _upsert_insert(db, models.RoleSkillRequirement).values(**requirement.model_dump())
+        db_requirement = db.execute(stmt.on_conflict_do_update(
+            index_elements=[models.RoleSkillRequirement.role, models.RoleSkillRequirement.skill_id],
+            set_={
+                "required_proficiency_level": stmt.excluded.required_proficiency_level,
+                "is_mandatory": stmt.excluded.is_mandatory
+            }
+        ).returning(*models.RoleSkillRequirement.__table__.c)).one()
     else:
-        # Create new record
-        db_requirement = models.RoleSkillRequirement(**requirement.model_dump())
-        db.add(db_requirement)
-        db.commit()
-        db.refresh(db_requirement)
-        return db_requirement
+        (db_requirement,) = _write_by_lookup(
+            db, models.RoleSkillRequirement, ["role", "skill_id"], [requirement.model_dump()]
+        )
+    skill_matrix.refresh_role(db, [db_requirement.role])
+    db.commit()
+    response_cache.invalidate(response_cache.ROLE_REQUIREMENTS)
+    return db_requirement
 
-def update_role_skill_requirement(db: Session, requirement_id: int, requirement: schemas.RoleSkillRequirementUpdate):
-    db_requirement = get_role_skill_requirement(db, requirement_id)
+def update_role_skill_requirement(db: Session, requirement_id: int,
+                                  requirement: Union[schemas.RoleSkillRequirementUpdate, schemas.RoleSkillRequirementPatch]):
+    values = _changes(requirement)
+    # GenCs of the old role need refreshing too when the requirement moves to another role
+    previous_role = db.query(models.RoleSkillRequirement.role).filter(
+        models.RoleSkillRequirement.id == requirement_id
+    ).scalar() if "role" in values else None
+    db_requirement = _update_returning(db, models.RoleSkillRequirement, requirement_id, values)
     if db_requirement:
-        for key, value in requirement.model_dump().items():
-            setattr(db_requirement, key, value)
+        skill_matrix.refresh_role(db, [role for role in (previous_role, db_requirement.role) if role is not None])
         db.commit()
-        db.refresh(db_requirement)
+        response_cache.invalidate(response_cache.ROLE_REQUIREMENTS)
     return db_requirement
 
 def delete_role_skill_requirement(db: Session, requirement_id: int):
     db_requirement = get_role_skill_requirement(db, requirement_id)
     if db_requirement:
         db.delete(db_requirement)
+        skill_matrix.refresh_role(db, [db_requirement.role])
         db.commit()
+        response_cache.invalidate(response_cache.ROLE_REQUIREMENTS)
     return db_requirement
 
 # GenC CRUD (updated with relationships)
@@ -701,7 +821,7 @@ def get_genc(db: Session, genc_id: int):
         joinedload(models.GenC.account),
         joinedload(models.GenC.service_line_obj),
         joinedload(models.GenC.mentor),
-        joinedload(models.GenC.skills).joinedload(models.GenCSkill.skill)
+        selectinload(models.GenC.skills).joinedload(models.GenCSkill.skill)
     ).filter(models.GenC.id == genc_id).first()
 
 def get_genc_by_associate_id(db: Session, associate_id: str):
@@ -709,44 +829,198 @@ def get_genc_by_associate_id(db: Session, associate_id: str):
         joinedload(models.GenC.account),
         joinedload(models.GenC.service_line_obj),
         joinedload(models.GenC.mentor),
-        joinedload(models.GenC.skills).joinedload(models.GenCSkill.skill)
+        selectinload(models.GenC.skills).joinedload(models.GenCSkill.skill)
     ).filter(models.GenC.associate_id == associate_id).first()
 
-def get_gencs(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(models.GenC).options(
+def get_genc_id_by_associate_id(db: Session, associate_id: str) -> Optional[int]:
+    """Id of the GenC with an associate ID, without loading the GenC"""
+    return db.query(models.GenC.id).filter(models.GenC.associate_id == associate_id).scalar()
+
+def genc_filter_clauses(filters: Optional[schemas.GenCFilters]) -> list:
+    """SQL predicates for the GenC list filters, shared by the sync and async list queries"""
+    if filters is None:
+        return []
+    clauses = []
+    if filters.status:
+        clauses.append(models.GenC.status.in_(filters.status))
+    if filters.account_id is not None:
+        clauses.append(models.GenC.account_id == filters.account_id)
+    if filters.service_line_id is not None:
+        clauses.append(models.GenC.service_line_id == filters.service_line_id)
+    if filters.mentor_id is not None:
+        clauses.append(models.GenC.mentor_id == filters.mentor_id)
+    if filters.location is not None:
+        clauses.append(models.GenC.location == filters.location)
+    if filters.designation is not None:
+        clauses.append(models.GenC.current_designation == filters.designation)
+    if filters.joined_from is not None:
+        clauses.append(models.GenC.date_of_joining >= filters.joined_from)
+    if filters.joined_to is not None:
+        clauses.append(models.GenC.date_of_joining <= filters.joined_to)
+    if filters.billing_from is not None:
+        clauses.append(models.GenC.actual_billing_start_date >= filters.billing_from)
+    if filters.billing_to is not None:
+        clauses.append(models.GenC.actual_billing_start_date <= filters.billing_to)
+    if filters.search:
+        # autoescape makes % and _ in the search text match literally
+        search = filters.search.strip()
+        clauses.append(or_(
+            models.GenC.genc_name.icontains(search, autoescape=True),
+            models.GenC.associate_id.icontains(search, autoescape=True)
+        ))
+    return clauses
+
+def get_gencs(db: Session, skip: int = 0, limit: int = 100, after: Optional[int] = None, include_skills: bool = False,
+              filters: Optional[schemas.GenCFilters] = None):
+    """List GenCs with their account, service line and mentor, narrowed by filters.
+
+    Skills are only loaded when include_skills is set, as one batched SELECT ... IN per page
+    rather than a join that repeats every GenC row once per skill.
+    """
+    query = db.query(models.GenC).options(
         joinedload(models.GenC.account),
         joinedload(models.GenC.service_line_obj),
-        joinedload(models.GenC.mentor),
-        joinedload(models.GenC.skills).joinedload(models.GenCSkill.skill)
-    ).offset(skip).limit(limit).all()
+        joinedload(models.GenC.mentor)
+    ).filter(*genc_filter_clauses(filters))
+    if include_skills:
+        query = query.options(selectinload(models.GenC.skills).joinedload(models.GenCSkill.skill))
+    return paginate(query, models.GenC.id, skip, limit, after)
+
+def count_gencs(db: Session, filters: Optional[schemas.GenCFilters] = None) -> int:
+    return db.query(func.count(models.GenC.id)).filter(*genc_filter_clauses(filters)).scalar()
 
 def create_genc(db: Session, genc: schemas.GenCCreate):
-    db_genc = models.GenC(**genc.model_dump())
-    db.add(db_genc)
+    db_genc = _insert_returning(db, models.GenC, genc.model_dump())
+    skill_matrix.refresh(db, [db_genc.id])
+    status_history.record(db, [(db_genc.id, None, db_genc.status)])
     db.commit()
-    db.refresh(db_genc)
+    invalidate_dashboard_stats()
+    role_fit.invalidate()
     return db_genc
 
-def update_genc(db: Session, genc_id: int, genc: schemas.GenCUpdate):
-    db_genc = get_genc(db, genc_id)
-    if db_genc:
-        # Validate status transition if status is being changed
-        if hasattr(genc, 'status') and genc.status != db_genc.status:
-            if not validate_status_transition(db_genc.status, genc.status):
-                raise ValueError(f"Invalid status transition from {db_genc.status.value} to {genc.status.value}")
-        
-        for key, value in genc.model_dump().items():
-            setattr(db_genc, key, value)
-        db.commit()
-        db.refresh(db_genc)
+# GenC columns that appear in its stored skill matrix row
+SKILL_MATRIX_FIELDS = {"associate_id", "genc_name", "current_designation"}
+
+def update_genc(db: Session, genc_id: int, genc: Union[schemas.GenCUpdate, schemas.GenCPatch]):
+    """Write a full (PUT) or partial (PATCH) GenC update.
+
+    A partial update that leaves the status alone is a single UPDATE; a status change first reads
+    the current status, as that is all the transition check needs. The UPDATE only applies while
+    the status is still the one checked; otherwise StatusConflictError is raised.
+    """
+    values = _changes(genc)
+    previous_status = None
+    guard = []
+    if "status" in values:
+        previous_status = db.query(models.GenC.status).filter(models.GenC.id == genc_id).scalar()
+        if previous_status is None:
+            return None
+        if values["status"] != previous_status and not validate_status_transition(previous_status, values["status"]):
+            raise ValueError(f"Invalid status transition from {previous_status.value} to {values['status'].value}")
+        guard.append(models.GenC.status == previous_status)
+
+    db_genc = _update_returning(db, models.GenC, genc_id, values, *guard)
+    if db_genc is None:
+        db.rollback()
+        if guard and db.query(models.GenC.id).filter(models.GenC.id == genc_id).first() is not None:
+            raise StatusConflictError("GenC status changed while the update was applied; retry the request")
+        return None
+    if SKILL_MATRIX_FIELDS & values.keys():
+        skill_matrix.refresh(db, [genc_id])
+    if previous_status is not None and db_genc.status != previous_status:
+        status_history.record(db, [(genc_id, previous_status, db_genc.status)])
+    db.commit()
+    invalidate_dashboard_stats()
+    role_fit.invalidate()
     return db_genc
 
 def delete_genc(db: Session, genc_id: int):
-    db_genc = get_genc(db, genc_id)
-    if db_genc:
-        db.delete(db_genc)
+    """Delete a GenC and the rows it owns with set-based DELETEs.
+
+    Returns the deleted row counts, or None if the GenC does not exist.
+    """
+    counts = _delete_gencs(db, [genc_id])
+    if not counts["gencs"]:
+        db.rollback()
+        return None
+    db.commit()
+    invalidate_dashboard_stats()
+    role_fit.invalidate()
+    return counts
+
+# Dates a bulk status transition may set along with the status
+STATUS_TRANSITION_DATE_FIELDS = ("date_of_allocation", "planned_billing_start_date", "actual_billing_start_date")
+
+def transition_genc_statuses(db: Session, items: List[schemas.GenCStatusTransition]) -> List[dict]:
+    """Validate and apply many status changes at once.
+
+    Valid changes are committed together with one UPDATE per target status; invalid ones are
+    reported without blocking the rest. Returns one result per item, in request order.
+    """
+    # Read without locking; the guarded UPDATEs below refuse rows whose status has changed since
+    current_statuses = dict(db.query(models.GenC.id, models.GenC.status).filter(
+        models.GenC.id.in_({item.genc_id for item in items})
+    ).all())
+
+    results = []
+    by_status = {}
+    seen = set()
+    for item in items:
+        previous_status = current_statuses.get(item.genc_id)
+        result = {"genc_id": item.genc_id, "success": False, "previous_status": previous_status, "status": previous_status}
+        if previous_status is None:
+            result["detail"] = "GenC not found"
+        elif item.genc_id in seen:
+            result["detail"] = "GenC appears more than once in the request"
+        elif not validate_status_transition(previous_status, item.new_status):
+            result["detail"] = f"Invalid status transition from {previous_status.value} to {item.new_status.value}"
+        else:
+            result.update(success=True, status=item.new_status)
+            by_status.setdefault(item.new_status, []).append(item)
+        seen.add(item.genc_id)
+        results.append(result)
+
+    for new_status, group in by_status.items():
+        genc_ids = [item.genc_id for item in group]
+        values = {models.GenC.status: new_status}
+        for field in STATUS_TRANSITION_DATE_FIELDS:
+            dates = {item.genc_id: getattr(item, field) for item in group if getattr(item, field) is not None}
+            if dates:
+                column = getattr(models.GenC, field)
+                values[column] = case(dates, value=models.GenC.id, else_=column)
+        # Only rows still in a status that may move to new_status are updated; anything else
+        # changed since it was validated, so nothing is applied
+        sources = [status for status, targets in ALLOWED_STATUS_TRANSITIONS.items() if new_status in targets]
+        updated = db.query(models.GenC).filter(
+            models.GenC.id.in_(genc_ids),
+            models.GenC.status.in_(sources + [new_status])
+        ).update(values, synchronize_session=False)
+        if updated != len(genc_ids):
+            db.rollback()
+            raise StatusConflictError("GenC statuses changed while the transitions were applied; retry the request")
+        status_history.record(db, [
+            (item.genc_id, current_statuses[item.genc_id], new_status)
+            for item in group if current_statuses[item.genc_id] != new_status
+        ])
+
+    if by_status:
         db.commit()
-    return db_genc
+        invalidate_dashboard_stats()
+        role_fit.invalidate()
+    return results
+
+# GenC status history
+def get_genc_status_history(db: Session, genc_id: int):
+    return status_history.get_history(db, genc_id)
+
+def get_status_analytics(db: Session, include_current: bool = False,
+                         cohort_status: models.StatusEnum = models.StatusEnum.BILLING_STARTED, cohort_months: int = 12):
+    return {
+        "time_in_status": status_history.time_in_status(db, include_current=include_current),
+        "funnel": status_history.funnel(db),
+        "cohort_status": cohort_status,
+        "cohorts": status_history.cohorts(db, target_status=cohort_status, months=cohort_months)
+    }
 
 # GenC Feedback CRUD
 def get_genc_feedback(db: Session, feedback_id: int):
@@ -755,11 +1029,12 @@ def get_genc_feedback(db: Session, feedback_id: int):
         joinedload(models.GenCFeedback.mentor)
     ).filter(models.GenCFeedback.id == feedback_id).first()
 
-def get_genc_feedbacks(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(models.GenCFeedback).options(
+def get_genc_feedbacks(db: Session, skip: int = 0, limit: int = 100, after: Optional[int] = None):
+    query = db.query(models.GenCFeedback).options(
         joinedload(models.GenCFeedback.genc),
         joinedload(models.GenCFeedback.mentor)
-    ).offset(skip).limit(limit).all()
+    )
+    return paginate(query, models.GenCFeedback.id, skip, limit, after)
 
 def get_feedbacks_by_genc(db: Session, genc_id: int):
     return db.query(models.GenCFeedback).options(
@@ -767,28 +1042,29 @@ def get_feedbacks_by_genc(db: Session, genc_id: int):
     ).filter(models.GenCFeedback.genc_id == genc_id).all()
 
 def create_genc_feedback(db: Session, feedback: schemas.GenCFeedbackCreate):
-    db_feedback = models.GenCFeedback(**feedback.model_dump())
-    db.add(db_feedback)
+    db_feedback = _insert_returning(db, models.GenCFeedback, feedback.model_dump())
+    search_index.index_feedback(db, db_feedback)
     db.commit()
-    db.refresh(db_feedback)
     return db_feedback
 
-def update_genc_feedback(db: Session, feedback_id: int, feedback: schemas.GenCFeedbackUpdate):
-    db_feedback = get_genc_feedback(db, feedback_id)
+def update_genc_feedback(db: Session, feedback_id: int, feedback: Union[schemas.GenCFeedbackUpdate, schemas.GenCFeedbackPatch]):
+    db_feedback = _update_returning(db, models.GenCFeedback, feedback_id, _changes(feedback))
     if db_feedback:
-        for key, value in feedback.model_dump().items():
-            setattr(db_feedback, key, value)
+        search_index.index_feedback(db, db_feedback)
         db.commit()
-        db.refresh(db_feedback)
     return db_feedback
 
 def delete_genc_feedback(db: Session, feedback_id: int):
     db_feedback = get_genc_feedback(db, feedback_id)
     if db_feedback:
         db.delete(db_feedback)
+        search_index.remove(db, search_index.FEEDBACK, [feedback_id])
         db.commit()
     return db_feedback
 
+def search_feedback(db: Session, q: str, kind: Optional[str] = None, skip: int = 0, limit: int = 20):
+    return search_index.search(db, q, kind=kind, skip=skip, limit=limit)
+
 # Application User CRUD
 def get_application_user(db: Session, user_id: int):
     return db.query(models.ApplicationUser).filter(models.ApplicationUser.id == user_id).first()
@@ -796,23 +1072,18 @@ def get_application_user(db: Session, user_id: int):
 def get_application_user_by_assoc_id(db: Session, user_assoc_id: str):
     return db.query(models.ApplicationUser).filter(models.ApplicationUser.user_assoc_id == user_assoc_id).first()
 
-def get_application_users(db: Session, skip: int = 0, limit: int = 100):
-    return db.query(models.ApplicationUser).offset(skip).limit(limit).all()
+def get_application_users(db: Session, skip: int = 0, limit: int = 100, after: Optional[int] = None):
+    return paginate(db.query(models.ApplicationUser), models.ApplicationUser.id, skip, limit, after)
 
 def create_application_user(db: Session, user: schemas.ApplicationUserCreate):
-    db_user = models.ApplicationUser(**user.model_dump())
-    db.add(db_user)
+    db_user = _insert_returning(db, models.ApplicationUser, user.model_dump())
     db.commit()
-    db.refresh(db_user)
     return db_user
 
-def update_application_user(db: Session, user_id: int, user: schemas.ApplicationUserUpdate):
-    db_user = get_application_user(db, user_id)
+def update_application_user(db: Session, user_id: int, user: Union[schemas.ApplicationUserUpdate, schemas.ApplicationUserPatch]):
+    db_user = _update_returning(db, models.ApplicationUser, user_id, _changes(user))
     if db_user:
-        for key, value in user.model_dump().items():
-            setattr(db_user, key, value)
         db.commit()
-        db.refresh(db_user)
     return db_user
 
 def delete_application_user(db: Session, user_id: int):
@@ -823,95 +1094,26 @@ def delete_application_user(db: Session, user_id: int):
     return db_user
 
 # Skill Matrix functions
-def get_skill_matrix(db: Session):
-    """Get skill matrix for all GenCs with role requirements and gap analysis"""
-    gencs = db.query(models.GenC).options(
-        joinedload(models.GenC.skills).joinedload(models.GenCSkill.skill)
-    ).all()
-    
-    # Get all role requirements for comparison
-    role_requirements = db.query(models.RoleSkillRequirement).options(
-        joinedload(models.RoleSkillRequirement.skill)
-    ).all()
-    
-    # Create a mapping of role -> skill -> requirement
-    role_skill_map = {}
-    for req in role_requirements:
-        role_key = req.role.value
-        if role_key not in role_skill_map:
-            role_skill_map[role_key] = {}
-        role_skill_map[role_key][req.skill.skill_name] = {
-            "required_proficiency_level": req.required_proficiency_level.value,
-            "is_mandatory": req.is_mandatory
-        }
-    
-    # Proficiency level hierarchy for comparison
-    proficiency_levels = {
-        "Beginner": 1,
-        "Intermediate": 2,
-        "Advanced": 3,
-        "Expert": 4
-    }
-    
-    result = []
-    
-    for genc in gencs:
-        genc_skills = []
-        current_role = genc.current_designation.value
-        role_requirements_for_genc = role_skill_map.get(current_role, {})
-        
-        for skill_rel in genc.skills:
-            skill_name = skill_rel.skill.skill_name
-            current_proficiency = skill_rel.proficiency_level.value
-            current_level_value = proficiency_levels.get(current_proficiency, 0)
-            
-            # Check if this skill has requirements for the current role
-            requirement = role_requirements_for_genc.get(skill_name)
-            meets_requirement = True
-            required_proficiency = None
-            is_mandatory = False
-            
-            if requirement:
-                required_proficiency = requirement["required_proficiency_level"]
-                is_mandatory = requirement["is_mandatory"] == "Yes"
-                required_level_value = proficiency_levels.get(required_proficiency, 0)
-                meets_requirement = current_level_value >= required_level_value
-            
-            genc_skills.append({
-                "skill_name": skill_rel.skill.skill_name,
-                "proficiency_level": current_proficiency,
-                "category": skill_rel.skill.category,
-                "date_acquired": skill_rel.date_acquired.isoformat() if skill_rel.date_acquired else None,
-                "notes": skill_rel.notes,
-                "required_proficiency_level": required_proficiency,
-                "is_mandatory": is_mandatory,
-                "meets_requirement": meets_requirement
-            })
-        
-        # Check for missing mandatory skills
-        missing_skills = []
-        for skill_name, requirement in role_requirements_for_genc.items():
-            if requirement["is_mandatory"] == "Yes":
-                # Check if GenC has this skill
-                has_skill = any(skill["skill_name"] == skill_name for skill in genc_skills)
-                if not has_skill:
-                    missing_skills.append({
-                        "skill_name": skill_name,
-                        "required_proficiency_level": requirement["required_proficiency_level"],
-                        "is_mandatory": True,
-                        "is_missing": True
-                    })
-        
-        result.append({
-            "associate_id": genc.associate_id,
-            "genc_name": genc.genc_name,
-            "current_designation": genc.current_designation.value,
-            "skills": genc_skills,
-            "missing_mandatory_skills": missing_skills,
-            "skill_gaps_count": len([s for s in genc_skills if not s["meets_requirement"]]) + len(missing_skills)
-        })
-    
-    return result
+def get_skill_matrix(db: Session, designation: Optional[models.DesignationEnum] = None, account_id: Optional[int] = None,
+                     category: Optional[str] = None, only_with_gaps: bool = False, min_gap_count: Optional[int] = None,
+                     search: Optional[str] = None, sort: str = "id", after: Optional[str] = None, limit: int = 100):
+    """Get one page of the skill matrix with role requirements and gap analysis, served from the precomputed store.
+
+    Returns (entries, next_cursor).
+    """
+    return skill_matrix.get_entries(
+        db, designation=designation, account_id=account_id, category=category, only_with_gaps=only_with_gaps,
+        min_gap_count=min_gap_count, search=search, sort=sort, after=after, limit=limit
+    )
+
+def rank_role_candidates(db: Session, role: models.DesignationEnum, limit: int = 20,
+                         status: Optional[List[models.StatusEnum]] = None, account_id: Optional[int] = None,
+                         location: Optional[models.LocationEnum] = None,
+                         designation: Optional[models.DesignationEnum] = None, all_mandatory: bool = False):
+    return role_fit.rank_candidates(
+        db, role, limit=limit, status=status, account_id=account_id, location=location,
+        designation=designation, all_mandatory=all_mandatory
+    )
 
 def get_role_requirements_matrix(db: Session):
     """Get role requirements matrix for all roles"""
@@ -936,4 +1138,54 @@ def get_role_requirements_matrix(db: Session):
             "requirements": role_requirements
         })
     
-    return result 
\ No newline at end of file
+    return result 
+
+# Dashboard statistics
+_dashboard_stats_cache = None
+_dashboard_stats_generation = 0
+_dashboard_stats_lock = threading.Lock()
+
+def invalidate_dashboard_stats():
+    """Drop the cached dashboard statistics after a GenC, mentor or account write"""
+    global _dashboard_stats_cache, _dashboard_stats_generation
+    with _dashboard_stats_lock:
+        _dashboard_stats_cache = None
+        _dashboard_stats_generation += 1
+
+def _count_gencs_by(db: Session, column):
+    return {value.value: count for value, count in db.query(column, func.count(models.GenC.id)).group_by(column)}
+
+def get_dashboard_stats(db: Session):
+    """Get GenC counts by status, location, designation and account, computed with GROUP BY queries"""
+    global _dashboard_stats_cache
+    with _dashboard_stats_lock:
+        if _dashboard_stats_cache is not None:
+            return _dashboard_stats_cache
+        generation = _dashboard_stats_generation
+    
+    account_counts = db.query(
+        models.Account.id,
+        models.Account.account_name,
+        func.count(models.GenC.id)
+    ).outerjoin(models.GenC, models.GenC.account_id == models.Account.id).group_by(
+        models.Account.id, models.Account.account_name
+    ).order_by(func.count(models.GenC.id).desc(), models.Account.account_name).all()
+    
+    stats = {
+        "total_gencs": db.query(func.count(models.GenC.id)).scalar(),
+        "total_mentors": db.query(func.count(models.Mentor.id)).scalar(),
+        "total_accounts": db.query(func.count(models.Account.id)).scalar(),
+        "status_counts": _count_gencs_by(db, models.GenC.status),
+        "location_counts": _count_gencs_by(db, models.GenC.location),
+        "designation_counts": _count_gencs_by(db, models.GenC.current_designation),
+        "account_counts": [
+            {"account_id": account_id, "account_name": account_name, "genc_count": genc_count}
+            for account_id, account_name, genc_count in account_counts
+        ]
+    }
+    
+    with _dashboard_stats_lock:
+        # Only cache if no write happened while the counts were being computed
+        if generation == _dashboard_stats_generation:
+            _dashboard_stats_cache = stats
+    return stats
@@ -0,0 +1,179 @@
+from sqlalchemy.orm import Session
+from sqlalchemy import insert
+from typing import List, Tuple, Iterable, Iterator, Callable, Optional
+from fastapi import UploadFile
+from fastapi.concurrency import run_in_threadpool
+import pandas as pd
+import openpyxl
+import os
+import tempfile
+
+# Rows written per transaction by the Excel importers
+DEFAULT_CHUNK_SIZE = 1000
+
+# Rows read from the spooled upload per DataFrame handed to an importer
+DEFAULT_READ_CHUNK_SIZE = 5000
+
+# File extensions accepted by the import endpoints
+SUPPORTED_IMPORT_EXTENSIONS = ('.xlsx', '.xls', '.csv')
+
+# Copy buffer used while spooling uploads to disk
+SPOOL_BLOCK_SIZE = 1024 * 1024
+
+# Number of bound parameters per IN (...) lookup, kept well below SQLite's limit
+LOOKUP_BATCH_SIZE = 500
+
+def clean_text_column(series: pd.Series) -> pd.Series:
+    """Convert a DataFrame column to stripped strings"""
+    return series.astype(str).str.strip()
+
+def load_existing_values(db: Session, column, values: List[str]) -> set:
+    """Return the subset of values already stored in the given column"""
+    existing = set()
+    for start in range(0, len(values), LOOKUP_BATCH_SIZE):
+        batch = values[start:start + LOOKUP_BATCH_SIZE]
+        rows = db.query(column).filter(column.in_(batch)).all()
+        existing.update(value for (value,) in rows)
+    return existing
+
+def first_row_errors(index: pd.Index, checks: Iterable[Tuple[pd.Series, pd.Series]]) -> pd.Series:
+    """Evaluate (failed_mask, message) checks in order and keep the first failing message per row"""
+    row_errors = pd.Series(None, index=index, dtype=object)
+    for failed, message in checks:
+        if not isinstance(message, pd.Series):
+            message = pd.Series(message, index=index)
+        pending = failed & row_errors.isna()
+        row_errors[pending] = message[pending]
+    return row_errors
+
+def format_row_errors(row_errors: pd.Series) -> List[str]:
+    """Turn a first_row_errors() result into 'Row N: message' strings (Excel row numbers)"""
+    return [f"Row {index + 2}: {message}" for index, message in row_errors.dropna().items()]
+
+def insert_in_chunks(db: Session, model, rows: List[Tuple[int, dict]], chunk_size: int = DEFAULT_CHUNK_SIZE):
+    """Insert (row_number, values) pairs with one transaction per chunk.
+
+    Each chunk is first attempted as a single bulk INSERT inside a savepoint. If that
+    fails, the chunk is replayed row by row, each in its own savepoint, so a bad row is
+    reported without rolling back the rest of the chunk.
+    Returns (imported_count, errors).
+    """
+    imported_count = 0
+    errors = []
+
+    for start in range(0, len(rows), chunk_size):
+        chunk = rows[start:start + chunk_size]
+        try:
+            with db.begin_nested():
+                db.execute(insert(model), [values for _, values in chunk])
+            imported_count += len(chunk)
+        except Exception:
+            for row_number, values in chunk:
+                try:
+                    with db.begin_nested():
+                        db.execute(insert(model), [values])
+                    imported_count += 1
+                except Exception as e:
+                    errors.append(f"Row {row_number}: {str(getattr(e, 'orig', e))}")
+        db.commit()
+
+    return imported_count, errors
+
+async def spool_upload(file: UploadFile) -> str:
+    """Copy an upload to a temporary file in fixed-size blocks and return its path.
+
+    Disk writes run on the threadpool so large uploads never block the event loop.
+    """
+    suffix = os.path.splitext(file.filename or "")[1].lower()
+    spooled = await run_in_threadpool(tempfile.NamedTemporaryFile, suffix=suffix, delete=False)
+    try:
+        while True:
+            block = await file.read(SPOOL_BLOCK_SIZE)
+            if not block:
+                break
+            await run_in_threadpool(spooled.write, block)
+    finally:
+        await run_in_threadpool(spooled.close)
+    return spooled.name
+
+def _iter_xlsx_frames(path: str, chunk_size: int) -> Iterator[pd.DataFrame]:
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = workbook.active.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+        columns = [str(name).strip() if name is not None else f"Unnamed: {position}" for position, name in enumerate(header)]
+        batch = []
+        yielded = False
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= chunk_size:
+                yield pd.DataFrame(batch, columns=columns)
+                batch = []
+                yielded = True
+        if batch or not yielded:
+            yield pd.DataFrame(batch, columns=columns)
+    finally:
+        workbook.close()
+
+def iter_upload_frames(path: str, filename: str, chunk_size: int = DEFAULT_READ_CHUNK_SIZE) -> Iterator[pd.DataFrame]:
+    """Read a spooled upload as a sequence of DataFrames of at most chunk_size rows.
+
+    Frame indexes continue across chunks, so index + 2 is always the spreadsheet row number.
+    Legacy .xls workbooks cannot be streamed and are read in one piece.
+    """
+    extension = os.path.splitext(filename or "")[1].lower()
+    if extension == '.csv':
+        frames = pd.read_csv(path, chunksize=chunk_size)
+    elif extension == '.xlsx':
+        frames = _iter_xlsx_frames(path, chunk_size)
+    else:
+        frames = iter([pd.read_excel(path)])
+
+    offset = 0
+    for frame in frames:
+        frame.index = pd.RangeIndex(offset, offset + len(frame))
+        offset += len(frame)
+        yield frame
+
+def run_import(db: Session, path: str, filename: str, expected_columns: List[str],
+               import_frame: Callable[[Session, pd.DataFrame, int], Tuple[int, List[str]]],
+               chunk_size: int = DEFAULT_CHUNK_SIZE, read_chunk_size: int = DEFAULT_READ_CHUNK_SIZE,
+               progress: Optional[Callable[[int, int, List[str]], None]] = None):
+    """Feed a spooled upload to import_frame one bounded DataFrame at a time.
+
+    import_frame receives rows with all expected columns present and returns (imported_count, errors).
+    progress, if given, is called after every frame with (rows_processed, imported_count, errors).
+    """
+    total_rows = 0
+    imported_count = 0
+    errors = []
+
+    for frame in iter_upload_frames(path, filename, read_chunk_size):
+        # Check if all required columns are present
+        missing_columns = [col for col in expected_columns if col not in frame.columns]
+        if missing_columns:
+            raise ValueError(f"Missing required columns: {', '.join(missing_columns)}")
+
+        # Remove rows with missing required data and keep only required columns
+        frame = frame.dropna(subset=expected_columns)[expected_columns]
+        total_rows += len(frame)
+
+        frame_imported, frame_errors = import_frame(db, frame, chunk_size)
+        imported_count += frame_imported
+        errors.extend(frame_errors)
+        if progress:
+            progress(total_rows, imported_count, errors)
+
+    return import_report(total_rows, imported_count, errors)
+
+def import_report(total_rows: int, imported_count: int, errors: List[str]):
+    """Build the summary returned for every import"""
+    return {
+        "message": "Import completed",
+        "total_rows": total_rows,
+        "imported": imported_count,
+        "skipped": total_rows - imported_count,
+        "errors": errors
+    }
@@ -0,0 +1,111 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, Optional
+from fastapi import UploadFile
+import os
+import threading
+import time
+import uuid
+import importer
+from database import SessionLocal
+
+# Number of imports that may run at the same time
+IMPORT_WORKER_COUNT = int(os.getenv("IMPORT_WORKER_COUNT", "2"))
+
+# Finished jobs are forgotten after this many seconds
+JOB_RETENTION_SECONDS = 3600
+
+class ImportJob:
+    """Progress and outcome of one background import"""
+
+    def __init__(self, kind: str, filename: str):
+        self.job_id = uuid.uuid4().hex
+        self.kind = kind
+        self.filename = filename
+        self.status = "queued"
+        self.detail: Optional[str] = None
+        self.rows_processed = 0
+        self.imported = 0
+        self.errors = []
+        self.created_at = datetime.utcnow()
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self._finished_monotonic: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        with self._lock:
+            self.status = "running"
+            self.started_at = datetime.utcnow()
+
+    def update_progress(self, rows_processed: int, imported: int, errors):
+        with self._lock:
+            self.rows_processed = rows_processed
+            self.imported = imported
+            self.errors = list(errors)
+
+    def finish(self, status: str, detail: Optional[str] = None):
+        with self._lock:
+            self.status = status
+            self.detail = detail
+            self.finished_at = datetime.utcnow()
+            self._finished_monotonic = time.monotonic()
+
+    def is_expired(self, now: float) -> bool:
+        return self._finished_monotonic is not None and now - self._finished_monotonic > JOB_RETENTION_SECONDS
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "job_id": self.job_id,
+                "kind": self.kind,
+                "filename": self.filename,
+                "status": self.status,
+                "detail": self.detail,
+                "total_rows": self.rows_processed,
+                "imported": self.imported,
+                "skipped": self.rows_processed - self.imported,
+                "errors": list(self.errors),
+                "created_at": self.created_at,
+                "started_at": self.started_at,
+                "finished_at": self.finished_at
+            }
+
+_executor = ThreadPoolExecutor(max_workers=IMPORT_WORKER_COUNT, thread_name_prefix="import-worker")
+_jobs: Dict[str, ImportJob] = {}
+_jobs_lock = threading.Lock()
+
+def _run_job(job: ImportJob, import_file: Callable, path: str):
+    db = SessionLocal()
+    try:
+        job.start()
+        result = import_file(db, path, job.filename, progress=job.update_progress)
+        job.update_progress(result["total_rows"], result["imported"], result["errors"])
+        job.finish("completed", result["message"])
+    except Exception as e:
+        db.rollback()
+        job.finish("failed", str(e))
+    finally:
+        db.close()
+        os.remove(path)
+
+def _forget_expired_jobs():
+    now = time.monotonic()
+    with _jobs_lock:
+        for job_id in [job_id for job_id, job in _jobs.items() if job.is_expired(now)]:
+            del _jobs[job_id]
+
+async def submit_import(kind: str, file: UploadFile, import_file: Callable) -> dict:
+    """Spool an upload to disk and queue import_file(db, path, filename, progress=...) on the worker pool"""
+    _forget_expired_jobs()
+    path = await importer.spool_upload(file)
+    job = ImportJob(kind, file.filename)
+    with _jobs_lock:
+        _jobs[job.job_id] = job
+    _executor.submit(_run_job, job, import_file, path)
+    return job.snapshot()
+
+def get_import_job(job_id: str) -> Optional[dict]:
+    with _jobs_lock:
+        job = _jobs.get(job_id)
+    return job.snapshot() if job else None
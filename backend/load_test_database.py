@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Database concurrency load test for GenC Tracking System
+Runs a mixed read/write CRUD workload from many threads (as the FastAPI threadpool does)
+against the old bare SQLite engine and against database.make_engine(), and prints
+throughput and "database is locked" failures for both.
+
+Usage: python load_test_database.py [threads] [seconds] [write_percent]
+"""
+
+import sys
+import os
+import random
+import tempfile
+import threading
+import time
+
+# Add the current directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from database import make_engine
+import models
+import crud
+import schemas
+
+SEED_ACCOUNTS = 2000
+
+def legacy_engine(database_url: str):
+    """The engine database.py used to build: default rollback journal, no pragmas, no pool sizing"""
+    return create_engine(database_url, connect_args={"check_same_thread": False})
+
+def seed(Session):
+    with Session() as db:
+        db.execute(insert(models.Account), [
+            {"account_name": f"Account {i:05d}", "epl_name": "EPL", "edp_name": "EDP"} for i in range(SEED_ACCOUNTS)
+        ])
+        db.commit()
+
+def worker(Session, deadline: float, write_percent: int, counters: dict, lock: threading.Lock):
+    rng = random.Random(threading.get_ident())
+    reads = writes = failures = 0
+    while time.perf_counter() < deadline:
+        db = Session()
+        try:
+            account_id = rng.randint(1, SEED_ACCOUNTS)
+            if rng.randrange(100) < write_percent:
+                crud.update_account(db, account_id, schemas.AccountUpdate(
+                    account_name=f"Account {account_id - 1:05d}", epl_name=f"EPL {rng.randrange(1000)}", edp_name="EDP"
+                ))
+                writes += 1
+            else:
+                crud.get_accounts(db, skip=rng.randrange(SEED_ACCOUNTS - 50), limit=50)
+                crud.get_account(db, account_id)
+                reads += 1
+        except Exception:
+            db.rollback()
+            failures += 1
+        finally:
+            db.close()
+    with lock:
+        counters["reads"] += reads
+        counters["writes"] += writes
+        counters["failures"] += failures
+
+def run_load(engine, threads: int, seconds: float, write_percent: int):
+    models.Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    seed(Session)
+
+    counters = {"reads": 0, "writes": 0, "failures": 0}
+    lock = threading.Lock()
+    deadline = time.perf_counter() + seconds
+    pool = [threading.Thread(target=worker, args=(Session, deadline, write_percent, counters, lock)) for _ in range(threads)]
+    for thread in pool:
+        thread.start()
+    for thread in pool:
+        thread.join()
+    engine.dispose()
+    return counters
+
+def report(label: str, counters: dict, seconds: float):
+    operations = counters["reads"] + counters["writes"]
+    print(f"   {label:<8} {operations / seconds:8.0f} ops/s  "
+          f"({counters['reads']} reads, {counters['writes']} writes, {counters['failures']} failed)")
+
+def run_load_test(threads: int, seconds: float, write_percent: int):
+    print(f"📊 {threads} threads, {seconds:.0f}s per run, {write_percent}% writes")
+    with tempfile.TemporaryDirectory() as directory:
+        print("🐢 Bare SQLite engine (before)...")
+        before = run_load(legacy_engine(f"sqlite:///{os.path.join(directory, 'before.db')}"), threads, seconds, write_percent)
+        report("before", before, seconds)
+
+        print("🚀 Pooled WAL engine from make_engine() (after)...")
+        after = run_load(make_engine(f"sqlite:///{os.path.join(directory, 'after.db')}", pool_size=threads),
+                         threads, seconds, write_percent)
+        report("after", after, seconds)
+
+    before_ops = before["reads"] + before["writes"]
+    after_ops = after["reads"] + after["writes"]
+    print(f"✅ Throughput: {after_ops / max(before_ops, 1):.1f}x, failures {before['failures']} -> {after['failures']}")
+
+if __name__ == "__main__":
+    thread_count = int(sys.argv[1]) if len(sys.argv) > 1 else 16
+    duration = float(sys.argv[2]) if len(sys.argv) > 2 else 10
+    write_share = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+    run_load_test(thread_count, duration, write_share)
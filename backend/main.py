@@ -1,17 +1,39 @@
-from fastapi import FastAPI, Depends, HTTPException, status, UploadFile, File
+from fastapi import FastAPI, Depends, HTTPException, status, UploadFile, File, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.orm import Session
-from typing import List
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import List, Optional
+from datetime import date
+import hashlib
+import json
 import models
 import schemas
 import crud
-from database import SessionLocal, engine, get_db
-
-# Create database tables
+import async_crud
+import importer
+import jobs
+import migrations
+import skill_matrix
+import search_index
+import status_history
+import response_cache
+import fast_json
+from database import SessionLocal, engine, get_db, get_async_db
+
+# Create database tables, then add indexes introduced since an existing database was created
 models.Base.metadata.create_all(bind=engine)
+migrations.upgrade(engine)
+
+# Materialize skill matrix rows and start the status history of GenCs created before those stores existed
+with SessionLocal() as startup_db:
+    skill_matrix.fill_missing(startup_db)
+    status_history.fill_missing(startup_db)
 
 app = FastAPI(title="GenC Tracking System", version="1.0.0")
 
+# Reference data responses served from the in-process cache (added first so CORS wraps it)
+app.add_middleware(response_cache.ResponseCacheMiddleware)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -19,8 +41,15 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Total-Count", "ETag"],
 )
 
+def set_pagination_headers(response: Response, next_cursor: Optional[int], total: int):
+    """Expose the keyset cursor of the next page and the total row count on a list response"""
+    if next_cursor is not None:
+        response.headers["X-Next-Cursor"] = str(next_cursor)
+    response.headers["X-Total-Count"] = str(total)
+
 # Root endpoint
 @app.get("/")
 def read_root():
@@ -35,8 +64,10 @@ def create_account(account: schemas.AccountCreate, db: Session = Depends(get_db)
     return crud.create_account(db=db, account=account)
 
 @app.get("/accounts/", response_model=List[schemas.Account])
-def read_accounts(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    accounts = crud.get_accounts(db, skip=skip, limit=limit)
+async def read_accounts(response: Response, skip: int = 0, limit: int = 100, after: Optional[int] = None,
+                        db: AsyncSession = Depends(get_async_db)):
+    accounts, next_cursor = await async_crud.get_accounts(db, skip=skip, limit=limit, after=after)
+    set_pagination_headers(response, next_cursor, await async_crud.count_rows(db, models.Account))
     return accounts
 
 @app.get("/accounts/{account_id}", response_model=schemas.Account)
@@ -53,12 +84,19 @@ def update_account(account_id: int, account: schemas.AccountUpdate, db: Session
         raise HTTPException(status_code=404, detail="Account not found")
     return db_account
 
+@app.patch("/accounts/{account_id}", response_model=schemas.Account)
+def patch_account(account_id: int, account: schemas.AccountPatch, db: Session = Depends(get_db)):
+    db_account = crud.update_account(db, account_id=account_id, account=account)
+    if db_account is None:
+        raise HTTPException(status_code=404, detail="Account not found")
+    return db_account
+
 @app.delete("/accounts/{account_id}")
 def delete_account(account_id: int, db: Session = Depends(get_db)):
-    db_account = crud.delete_account(db, account_id=account_id)
-    if db_account is None:
+    deleted_counts = crud.delete_account(db, account_id=account_id)
+    if deleted_counts is None:
         raise HTTPException(status_code=404, detail="Account not found")
-    return {"message": "Account deleted successfully"}
+    return {"message": "Account deleted successfully", "deleted_counts": deleted_counts}
 
 # Test endpoint to verify server restart
 @app.get("/test-import/")
@@ -66,40 +104,44 @@ def test_import_endpoint():
     return {"message": "Import endpoint is available", "status": "working"}
 
 # Account Import endpoint
-@app.post("/accounts/import/")
-async def import_accounts(file: UploadFile = File(...), db: Session = Depends(get_db)):
-    """Import accounts from Excel file"""
-    if not file.filename or not file.filename.endswith(('.xlsx', '.xls')):
-        raise HTTPException(status_code=400, detail="File must be an Excel file (.xlsx or .xls)")
+@app.post("/accounts/import/", response_model=schemas.ImportJob, status_code=status.HTTP_202_ACCEPTED)
+async def import_accounts(file: UploadFile = File(...)):
+    """Import accounts from Excel or CSV file as a background job"""
+    if not file.filename or not file.filename.lower().endswith(importer.SUPPORTED_IMPORT_EXTENSIONS):
+        raise HTTPException(status_code=400, detail="File must be an Excel or CSV file (.xlsx, .xls or .csv)")
     
-    try:
-        result = await crud.import_accounts_from_excel(db, file)
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Error processing file: {str(e)}")
+    return await jobs.submit_import("accounts", file, crud.import_accounts_from_file)
 
 # Delete all accounts and related data endpoint
 @app.delete("/accounts/delete-all/")
-def delete_all_accounts(db: Session = Depends(get_db)):
-    """Delete all accounts and their related data (GenCs, Service Lines, Skills, Feedback)"""
+def delete_all_accounts(chunk_size: Optional[int] = Query(None, ge=1, le=100000), db: Session = Depends(get_db)):
+    """Delete all accounts and their related data (GenCs, Service Lines, Skills, Feedback)
+
+    With chunk_size, deletes in batches of that many rows, each in its own short transaction.
+    """
     try:
-        result = crud.delete_all_accounts_and_related_data(db)
+        result = crud.delete_all_accounts_and_related_data(db, chunk_size=chunk_size)
         return result
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Error deleting accounts: {str(e)}")
 
 # Mentor Import endpoint
-@app.post("/mentors/import/")
-async def import_mentors(file: UploadFile = File(...), db: Session = Depends(get_db)):
-    """Import mentors from Excel file"""
-    if not file.filename or not file.filename.endswith(('.xlsx', '.xls')):
-        raise HTTPException(status_code=400, detail="File must be an Excel file (.xlsx or .xls)")
+@app.post("/mentors/import/", response_model=schemas.ImportJob, status_code=status.HTTP_202_ACCEPTED)
+async def import_mentors(file: UploadFile = File(...)):
+    """Import mentors from Excel or CSV file as a background job"""
+    if not file.filename or not file.filename.lower().endswith(importer.SUPPORTED_IMPORT_EXTENSIONS):
+        raise HTTPException(status_code=400, detail="File must be an Excel or CSV file (.xlsx, .xls or .csv)")
     
-    try:
-        result = await crud.import_mentors_from_excel(db, file)
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Error processing file: {str(e)}")
+    return await jobs.submit_import("mentors", file, crud.import_mentors_from_file)
+
+# Import job endpoints
+@app.get("/import-jobs/{job_id}", response_model=schemas.ImportJob)
+def read_import_job(job_id: str):
+    """Get progress and the full error list of a background import"""
+    job = jobs.get_import_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Import job not found")
+    return job
 
 # Account Service Line endpoints
 @app.post("/account-service-lines/", response_model=schemas.AccountServiceLine, status_code=status.HTTP_201_CREATED)
@@ -107,8 +149,10 @@ def create_account_service_line(service_line: schemas.AccountServiceLineCreate,
     return crud.create_account_service_line(db=db, service_line=service_line)
 
 @app.get("/account-service-lines/", response_model=List[schemas.AccountServiceLine])
-def read_account_service_lines(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    service_lines = crud.get_account_service_lines(db, skip=skip, limit=limit)
+def read_account_service_lines(response: Response, skip: int = 0, limit: int = 100, after: Optional[int] = None,
+                               db: Session = Depends(get_db)):
+    service_lines, next_cursor = crud.get_account_service_lines(db, skip=skip, limit=limit, after=after)
+    set_pagination_headers(response, next_cursor, crud.count_rows(db, models.AccountServiceLine))
     return service_lines
 
 @app.get("/account-service-lines/{service_line_id}", response_model=schemas.AccountServiceLine)
@@ -129,25 +173,31 @@ def update_account_service_line(service_line_id: int, service_line: schemas.Acco
         raise HTTPException(status_code=404, detail="Account Service Line not found")
     return db_service_line
 
+@app.patch("/account-service-lines/{service_line_id}", response_model=schemas.AccountServiceLine)
+def patch_account_service_line(service_line_id: int, service_line: schemas.AccountServiceLinePatch, db: Session = Depends(get_db)):
+    db_service_line = crud.update_account_service_line(db, service_line_id=service_line_id, service_line=service_line)
+    if db_service_line is None:
+        raise HTTPException(status_code=404, detail="Account Service Line not found")
+    return db_service_line
+
 @app.delete("/account-service-lines/{service_line_id}")
 def delete_account_service_line(service_line_id: int, db: Session = Depends(get_db)):
-    db_service_line = crud.delete_account_service_line(db, service_line_id=service_line_id)
-    if db_service_line is None:
+    try:
+        deleted_counts = crud.delete_account_service_line(db, service_line_id=service_line_id)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    if deleted_counts is None:
         raise HTTPException(status_code=404, detail="Account Service Line not found")
-    return {"message": "Account Service Line deleted successfully"}
+    return {"message": "Account Service Line deleted successfully", "deleted_counts": deleted_counts}
 
 # Account Service Line Import endpoint
-@app.post("/account-service-lines/import/")
-async def import_account_service_lines(file: UploadFile = File(...), db: Session = Depends(get_db)):
-    """Import account service lines from Excel file"""
-    if not file.filename or not file.filename.endswith(('.xlsx', '.xls')):
-        raise HTTPException(status_code=400, detail="File must be an Excel file (.xlsx or .xls)")
+@app.post("/account-service-lines/import/", response_model=schemas.ImportJob, status_code=status.HTTP_202_ACCEPTED)
+async def import_account_service_lines(file: UploadFile = File(...)):
+    """Import account service lines from Excel or CSV file as a background job"""
+    if not file.filename or not file.filename.lower().endswith(importer.SUPPORTED_IMPORT_EXTENSIONS):
+        raise HTTPException(status_code=400, detail="File must be an Excel or CSV file (.xlsx, .xls or .csv)")
     
-    try:
-        result = await crud.import_account_service_lines_from_excel(db, file)
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Error processing file: {str(e)}")
+    return await jobs.submit_import("account_service_lines", file, crud.import_account_service_lines_from_file)
 
 # Mentor endpoints
 @app.post("/mentors/", response_model=schemas.Mentor, status_code=status.HTTP_201_CREATED)
@@ -158,8 +208,10 @@ def create_mentor(mentor: schemas.MentorCreate, db: Session = Depends(get_db)):
     return crud.create_mentor(db=db, mentor=mentor)
 
 @app.get("/mentors/", response_model=List[schemas.Mentor])
-def read_mentors(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    mentors = crud.get_mentors(db, skip=skip, limit=limit)
+async def read_mentors(response: Response, skip: int = 0, limit: int = 100, after: Optional[int] = None,
+                       db: AsyncSession = Depends(get_async_db)):
+    mentors, next_cursor = await async_crud.get_mentors(db, skip=skip, limit=limit, after=after)
+    set_pagination_headers(response, next_cursor, await async_crud.count_rows(db, models.Mentor))
     return mentors
 
 @app.get("/mentors/{mentor_id}", response_model=schemas.Mentor)
@@ -176,12 +228,22 @@ def update_mentor(mentor_id: int, mentor: schemas.MentorUpdate, db: Session = De
         raise HTTPException(status_code=404, detail="Mentor not found")
     return db_mentor
 
+@app.patch("/mentors/{mentor_id}", response_model=schemas.Mentor)
+def patch_mentor(mentor_id: int, mentor: schemas.MentorPatch, db: Session = Depends(get_db)):
+    db_mentor = crud.update_mentor(db, mentor_id=mentor_id, mentor=mentor)
+    if db_mentor is None:
+        raise HTTPException(status_code=404, detail="Mentor not found")
+    return db_mentor
+
 @app.delete("/mentors/{mentor_id}")
 def delete_mentor(mentor_id: int, db: Session = Depends(get_db)):
-    db_mentor = crud.delete_mentor(db, mentor_id=mentor_id)
-    if db_mentor is None:
+    try:
+        deleted_counts = crud.delete_mentor(db, mentor_id=mentor_id)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    if deleted_counts is None:
         raise HTTPException(status_code=404, detail="Mentor not found")
-    return {"message": "Mentor deleted successfully"}
+    return {"message": "Mentor deleted successfully", "deleted_counts": deleted_counts}
 
 # Skill endpoints
 @app.post("/skills/", response_model=schemas.Skill, status_code=status.HTTP_201_CREATED)
@@ -192,8 +254,10 @@ def create_skill(skill: schemas.SkillCreate, db: Session = Depends(get_db)):
     return crud.create_skill(db=db, skill=skill)
 
 @app.get("/skills/", response_model=List[schemas.Skill])
-def read_skills(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    skills = crud.get_skills(db, skip=skip, limit=limit)
+async def read_skills(response: Response, skip: int = 0, limit: int = 100, after: Optional[int] = None,
+                      db: AsyncSession = Depends(get_async_db)):
+    skills, next_cursor = await async_crud.get_skills(db, skip=skip, limit=limit, after=after)
+    set_pagination_headers(response, next_cursor, await async_crud.count_rows(db, models.Skill))
     return skills
 
 @app.get("/skills/{skill_id}", response_model=schemas.Skill)
@@ -203,6 +267,10 @@ def read_skill(skill_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Skill not found")
     return db_skill
 
+@app.get("/skills/categories/", response_model=List[str])
+def read_skill_categories(db: Session = Depends(get_db)):
+    return crud.get_skill_categories(db)
+
 @app.get("/skills/category/{category}", response_model=List[schemas.Skill])
 def read_skills_by_category(category: str, db: Session = Depends(get_db)):
     return crud.get_skills_by_category(db, category=category)
@@ -214,21 +282,43 @@ def update_skill(skill_id: int, skill: schemas.SkillUpdate, db: Session = Depend
         raise HTTPException(status_code=404, detail="Skill not found")
     return db_skill
 
+@app.patch("/skills/{skill_id}", response_model=schemas.Skill)
+def patch_skill(skill_id: int, skill: schemas.SkillPatch, db: Session = Depends(get_db)):
+    db_skill = crud.update_skill(db, skill_id=skill_id, skill=skill)
+    if db_skill is None:
+        raise HTTPException(status_code=404, detail="Skill not found")
+    return db_skill
+
 @app.delete("/skills/{skill_id}")
 def delete_skill(skill_id: int, db: Session = Depends(get_db)):
-    db_skill = crud.delete_skill(db, skill_id=skill_id)
-    if db_skill is None:
+    deleted_counts = crud.delete_skill(db, skill_id=skill_id)
+    if deleted_counts is None:
         raise HTTPException(status_code=404, detail="Skill not found")
-    return {"message": "Skill deleted successfully"}
+    return {"message": "Skill deleted successfully", "deleted_counts": deleted_counts}
 
 # GenC Skill endpoints
 @app.post("/genc-skills/", response_model=schemas.GenCSkill, status_code=status.HTTP_201_CREATED)
 def create_genc_skill(genc_skill: schemas.GenCSkillCreate, db: Session = Depends(get_db)):
     return crud.create_genc_skill(db=db, genc_skill=genc_skill)
 
+@app.post("/genc-skills/bulk", response_model=List[schemas.GenCSkill])
+def upsert_genc_skills(batch: schemas.GenCSkillBulkUpsert, db: Session = Depends(get_db)):
+    """Create or update many GenC skills at once.
+
+    With `replace`, skills of the listed GenCs that are not in `items` are removed. Returns the
+    resulting skills of every listed GenC.
+    """
+    replace_genc_ids = sorted({item.genc_id for item in batch.items}) if batch.replace else None
+    try:
+        return crud.upsert_genc_skills(db, batch.items, replace_genc_ids=replace_genc_ids)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 @app.get("/genc-skills/", response_model=List[schemas.GenCSkill])
-def read_genc_skills(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    genc_skills = crud.get_genc_skills(db, skip=skip, limit=limit)
+def read_genc_skills(response: Response, skip: int = 0, limit: int = 100, after: Optional[int] = None,
+                     db: Session = Depends(get_db)):
+    genc_skills, next_cursor = crud.get_genc_skills(db, skip=skip, limit=limit, after=after)
+    set_pagination_headers(response, next_cursor, crud.count_rows(db, models.GenCSkill))
     return genc_skills
 
 @app.get("/genc-skills/{genc_skill_id}", response_model=schemas.GenCSkill)
@@ -242,6 +332,17 @@ def read_genc_skill(genc_skill_id: int, db: Session = Depends(get_db)):
 def read_skills_by_genc(genc_id: int, db: Session = Depends(get_db)):
     return crud.get_skills_by_genc(db, genc_id=genc_id)
 
+@app.put("/gencs/{genc_id}/skills", response_model=List[schemas.GenCSkill])
+def replace_genc_skills(genc_id: int, skills: List[schemas.GenCSkillAssignment], db: Session = Depends(get_db)):
+    """Replace the skill set of a GenC: listed skills are created or updated, others removed"""
+    try:
+        genc_skills = crud.replace_genc_skills(db, genc_id=genc_id, skills=skills)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if genc_skills is None:
+        raise HTTPException(status_code=404, detail="GenC not found")
+    return genc_skills
+
 @app.get("/skills/{skill_id}/gencs/", response_model=List[schemas.GenCSkill])
 def read_gencs_by_skill(skill_id: int, db: Session = Depends(get_db)):
     return crud.get_gencs_by_skill(db, skill_id=skill_id)
@@ -253,6 +354,13 @@ def update_genc_skill(genc_skill_id: int, genc_skill: schemas.GenCSkillUpdate, d
         raise HTTPException(status_code=404, detail="GenC Skill not found")
     return db_genc_skill
 
+@app.patch("/genc-skills/{genc_skill_id}", response_model=schemas.GenCSkill)
+def patch_genc_skill(genc_skill_id: int, genc_skill: schemas.GenCSkillPatch, db: Session = Depends(get_db)):
+    db_genc_skill = crud.update_genc_skill(db, genc_skill_id=genc_skill_id, genc_skill=genc_skill)
+    if db_genc_skill is None:
+        raise HTTPException(status_code=404, detail="GenC Skill not found")
+    return db_genc_skill
+
 @app.delete("/genc-skills/{genc_skill_id}")
 def delete_genc_skill(genc_skill_id: int, db: Session = Depends(get_db)):
     db_genc_skill = crud.delete_genc_skill(db, genc_skill_id=genc_skill_id)
@@ -266,8 +374,10 @@ def create_role_skill_requirement(requirement: schemas.RoleSkillRequirementCreat
     return crud.create_role_skill_requirement(db=db, requirement=requirement)
 
 @app.get("/role-skill-requirements/", response_model=List[schemas.RoleSkillRequirement])
-def read_role_skill_requirements(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    requirements = crud.get_role_skill_requirements(db, skip=skip, limit=limit)
+def read_role_skill_requirements(response: Response, skip: int = 0, limit: int = 100, after: Optional[int] = None,
+                                 db: Session = Depends(get_db)):
+    requirements, next_cursor = crud.get_role_skill_requirements(db, skip=skip, limit=limit, after=after)
+    set_pagination_headers(response, next_cursor, crud.count_rows(db, models.RoleSkillRequirement))
     return requirements
 
 @app.get("/role-skill-requirements/{requirement_id}", response_model=schemas.RoleSkillRequirement)
@@ -281,6 +391,26 @@ def read_role_skill_requirement(requirement_id: int, db: Session = Depends(get_d
 def read_requirements_by_role(role: models.DesignationEnum, db: Session = Depends(get_db)):
     return crud.get_requirements_by_role(db, role=role)
 
+@app.get("/roles/{role}/candidates/", response_model=schemas.RoleFitRanking)
+def rank_role_candidates(
+    role: models.DesignationEnum,
+    limit: int = Query(20, ge=1, le=500),
+    status: Optional[List[models.StatusEnum]] = Query(None),
+    account_id: Optional[int] = None,
+    location: Optional[models.LocationEnum] = None,
+    designation: Optional[models.DesignationEnum] = None,
+    all_mandatory: bool = False,
+    db: Session = Depends(get_db)
+):
+    """Best-fitting GenCs for a role's skill requirements, ranked by mandatory requirements met and then by score.
+
+    status may be repeated; all_mandatory keeps only GenCs meeting every mandatory requirement.
+    """
+    return crud.rank_role_candidates(
+        db, role, limit=limit, status=status, account_id=account_id, location=location,
+        designation=designation, all_mandatory=all_mandatory
+    )
+
 @app.put("/role-skill-requirements/{requirement_id}", response_model=schemas.RoleSkillRequirement)
 def update_role_skill_requirement(requirement_id: int, requirement: schemas.RoleSkillRequirementUpdate, db: Session = Depends(get_db)):
     db_requirement = crud.update_role_skill_requirement(db, requirement_id=requirement_id, requirement=requirement)
@@ -288,6 +418,13 @@ def update_role_skill_requirement(requirement_id: int, requirement: schemas.Role
         raise HTTPException(status_code=404, detail="Role Skill Requirement not found")
     return db_requirement
 
+@app.patch("/role-skill-requirements/{requirement_id}", response_model=schemas.RoleSkillRequirement)
+def patch_role_skill_requirement(requirement_id: int, requirement: schemas.RoleSkillRequirementPatch, db: Session = Depends(get_db)):
+    db_requirement = crud.update_role_skill_requirement(db, requirement_id=requirement_id, requirement=requirement)
+    if db_requirement is None:
+        raise HTTPException(status_code=404, detail="Role Skill Requirement not found")
+    return db_requirement
+
 @app.delete("/role-skill-requirements/{requirement_id}")
 def delete_role_skill_requirement(requirement_id: int, db: Session = Depends(get_db)):
     db_requirement = crud.delete_role_skill_requirement(db, requirement_id=requirement_id)
@@ -301,24 +438,57 @@ def create_genc(genc: schemas.GenCCreate, db: Session = Depends(get_db)):
     print(f"Received GenC data: {genc}")  # Debug log
     try:
         # Check for duplicate associate ID
-        db_genc = crud.get_genc_by_associate_id(db, genc.associate_id)
-        if db_genc:
+        if crud.get_genc_id_by_associate_id(db, genc.associate_id) is not None:
             raise HTTPException(status_code=400, detail="GenC associate ID already registered")
         
         # Create the GenC
         return crud.create_genc(db=db, genc=genc)
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"Error creating GenC: {str(e)}")  # Debug log
         raise HTTPException(status_code=500, detail=f"Error creating GenC: {str(e)}")
 
 @app.get("/gencs/", response_model=List[schemas.GenC])
-def read_gencs(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    gencs = crud.get_gencs(db, skip=skip, limit=limit)
-    return gencs
+async def read_gencs(
+    skip: int = 0,
+    limit: int = 100,
+    after: Optional[int] = None,
+    include: Optional[str] = None,
+    status: Optional[List[models.StatusEnum]] = Query(None),
+    account_id: Optional[int] = None,
+    service_line_id: Optional[int] = None,
+    mentor_id: Optional[int] = None,
+    location: Optional[models.LocationEnum] = None,
+    designation: Optional[models.DesignationEnum] = None,
+    joined_from: Optional[date] = None,
+    joined_to: Optional[date] = None,
+    billing_from: Optional[date] = None,
+    billing_to: Optional[date] = None,
+    search: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """List GenCs matching the given filters. Nested skills are only returned with ?include=skills.
+
+    status may be repeated to match any of several statuses; X-Total-Count counts the matching GenCs.
+    """
+    include_skills = "skills" in (include or "").split(",")
+    filters = schemas.GenCFilters(
+        status=status, account_id=account_id, service_line_id=service_line_id, mentor_id=mentor_id,
+        location=location, designation=designation, joined_from=joined_from, joined_to=joined_to,
+        billing_from=billing_from, billing_to=billing_to, search=search
+    )
+    gencs, next_cursor = await async_crud.get_genc_rows(
+        db, skip=skip, limit=limit, after=after, include_skills=include_skills, filters=filters
+    )
+    # Encoded straight from the rows; response_model only documents the shape
+    response = fast_json.response(gencs)
+    set_pagination_headers(response, next_cursor, await async_crud.count_gencs(db, filters))
+    return response
 
 @app.get("/gencs/{genc_id}", response_model=schemas.GenC)
-def read_genc(genc_id: int, db: Session = Depends(get_db)):
-    db_genc = crud.get_genc(db, genc_id=genc_id)
+async def read_genc(genc_id: int, db: AsyncSession = Depends(get_async_db)):
+    db_genc = await async_crud.get_genc(db, genc_id=genc_id)
     if db_genc is None:
         raise HTTPException(status_code=404, detail="GenC not found")
     return db_genc
@@ -330,28 +500,58 @@ def update_genc(genc_id: int, genc: schemas.GenCUpdate, db: Session = Depends(ge
         if db_genc is None:
             raise HTTPException(status_code=404, detail="GenC not found")
         return db_genc
+    except crud.StatusConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
+@app.patch("/gencs/{genc_id}", response_model=schemas.GenC)
+def patch_genc(genc_id: int, genc: schemas.GenCPatch, db: Session = Depends(get_db)):
+    """Update only the fields sent; a status change must still be an allowed transition"""
+    try:
+        db_genc = crud.update_genc(db, genc_id=genc_id, genc=genc)
+        if db_genc is None:
+            raise HTTPException(status_code=404, detail="GenC not found")
+        return db_genc
+    except crud.StatusConflictError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+@app.post("/gencs/status-transitions", response_model=schemas.GenCStatusTransitionResponse)
+def transition_genc_statuses(batch: schemas.GenCStatusTransitionBatch, db: Session = Depends(get_db)):
+    """Move many GenCs to new statuses in one request.
+
+    Every item is checked against the allowed status transitions; valid items are applied together
+    and invalid ones are reported in `results` without failing the request.
+    """
+    try:
+        results = crud.transition_genc_statuses(db, batch.items)
+    except ValueError as e:
+        raise HTTPException(status_code=409, detail=str(e))
+    applied = sum(1 for result in results if result["success"])
+    return {"applied": applied, "failed": len(results) - applied, "results": results}
+
+@app.get("/gencs/{genc_id}/status-history", response_model=List[schemas.GenCStatusChange])
+def read_genc_status_history(genc_id: int, db: Session = Depends(get_db)):
+    """Status changes of a GenC, oldest first"""
+    return crud.get_genc_status_history(db, genc_id=genc_id)
+
 @app.delete("/gencs/{genc_id}")
 def delete_genc(genc_id: int, db: Session = Depends(get_db)):
-    db_genc = crud.delete_genc(db, genc_id=genc_id)
-    if db_genc is None:
+    deleted_counts = crud.delete_genc(db, genc_id=genc_id)
+    if deleted_counts is None:
         raise HTTPException(status_code=404, detail="GenC not found")
-    return {"message": "GenC deleted successfully"}
+    return {"message": "GenC deleted successfully", "deleted_counts": deleted_counts}
 
 # GenC Import endpoint
-@app.post("/gencs/import/")
-async def import_gencs(file: UploadFile = File(...), db: Session = Depends(get_db)):
-    """Import GenCs from Excel file"""
-    if not file.filename or not file.filename.endswith(('.xlsx', '.xls')):
-        raise HTTPException(status_code=400, detail="File must be an Excel file (.xlsx or .xls)")
+@app.post("/gencs/import/", response_model=schemas.ImportJob, status_code=status.HTTP_202_ACCEPTED)
+async def import_gencs(file: UploadFile = File(...)):
+    """Import GenCs from Excel or CSV file as a background job"""
+    if not file.filename or not file.filename.lower().endswith(importer.SUPPORTED_IMPORT_EXTENSIONS):
+        raise HTTPException(status_code=400, detail="File must be an Excel or CSV file (.xlsx, .xls or .csv)")
     
-    try:
-        result = await crud.import_gencs_from_excel(db, file)
-        return result
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Error processing file: {str(e)}")
+    return await jobs.submit_import("gencs", file, crud.import_gencs_from_file)
 
 # GenC Feedback endpoints
 @app.post("/genc-feedbacks/", response_model=schemas.GenCFeedback, status_code=status.HTTP_201_CREATED)
@@ -359,9 +559,12 @@ def create_genc_feedback(feedback: schemas.GenCFeedbackCreate, db: Session = Dep
     return crud.create_genc_feedback(db=db, feedback=feedback)
 
 @app.get("/genc-feedbacks/", response_model=List[schemas.GenCFeedback])
-def read_genc_feedbacks(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    feedbacks = crud.get_genc_feedbacks(db, skip=skip, limit=limit)
-    return feedbacks
+async def read_genc_feedbacks(skip: int = 0, limit: int = 100, after: Optional[int] = None,
+                              db: AsyncSession = Depends(get_async_db)):
+    feedbacks, next_cursor = await async_crud.get_genc_feedback_rows(db, skip=skip, limit=limit, after=after)
+    response = fast_json.response(feedbacks)
+    set_pagination_headers(response, next_cursor, await async_crud.count_rows(db, models.GenCFeedback))
+    return response
 
 @app.get("/genc-feedbacks/{feedback_id}", response_model=schemas.GenCFeedback)
 def read_genc_feedback(feedback_id: int, db: Session = Depends(get_db)):
@@ -381,6 +584,13 @@ def update_genc_feedback(feedback_id: int, feedback: schemas.GenCFeedbackUpdate,
         raise HTTPException(status_code=404, detail="GenC Feedback not found")
     return db_feedback
 
+@app.patch("/genc-feedbacks/{feedback_id}", response_model=schemas.GenCFeedback)
+def patch_genc_feedback(feedback_id: int, feedback: schemas.GenCFeedbackPatch, db: Session = Depends(get_db)):
+    db_feedback = crud.update_genc_feedback(db, feedback_id=feedback_id, feedback=feedback)
+    if db_feedback is None:
+        raise HTTPException(status_code=404, detail="GenC Feedback not found")
+    return db_feedback
+
 @app.delete("/genc-feedbacks/{feedback_id}")
 def delete_genc_feedback(feedback_id: int, db: Session = Depends(get_db)):
     db_feedback = crud.delete_genc_feedback(db, feedback_id=feedback_id)
@@ -388,6 +598,29 @@ def delete_genc_feedback(feedback_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="GenC Feedback not found")
     return {"message": "GenC Feedback deleted successfully"}
 
+# Search endpoints
+@app.get("/search/feedback", response_model=List[schemas.SearchResult])
+def search_feedback(
+    response: Response,
+    q: str = Query(..., min_length=1),
+    kind: Optional[str] = None,
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db)
+):
+    """Full-text search over GenC feedback and skill notes, ranked by relevance.
+
+    `kind` narrows results to `feedback` or `skill_note`. Snippets are HTML-escaped with matches in <mark> tags.
+    """
+    if not search_index.is_supported(db):
+        raise HTTPException(status_code=501, detail="Full-text search requires an SQLite database")
+    try:
+        results, total = crud.search_feedback(db, q, kind=kind, skip=skip, limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    set_pagination_headers(response, None, total)
+    return results
+
 # Application User endpoints
 @app.post("/application-users/", response_model=schemas.ApplicationUser, status_code=status.HTTP_201_CREATED)
 def create_application_user(user: schemas.ApplicationUserCreate, db: Session = Depends(get_db)):
@@ -397,8 +630,10 @@ def create_application_user(user: schemas.ApplicationUserCreate, db: Session = D
     return crud.create_application_user(db=db, user=user)
 
 @app.get("/application-users/", response_model=List[schemas.ApplicationUser])
-def read_application_users(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    users = crud.get_application_users(db, skip=skip, limit=limit)
+def read_application_users(response: Response, skip: int = 0, limit: int = 100, after: Optional[int] = None,
+                           db: Session = Depends(get_db)):
+    users, next_cursor = crud.get_application_users(db, skip=skip, limit=limit, after=after)
+    set_pagination_headers(response, next_cursor, crud.count_rows(db, models.ApplicationUser))
     return users
 
 @app.get("/application-users/{user_id}", response_model=schemas.ApplicationUser)
@@ -415,6 +650,13 @@ def update_application_user(user_id: int, user: schemas.ApplicationUserUpdate, d
         raise HTTPException(status_code=404, detail="Application User not found")
     return db_user
 
+@app.patch("/application-users/{user_id}", response_model=schemas.ApplicationUser)
+def patch_application_user(user_id: int, user: schemas.ApplicationUserPatch, db: Session = Depends(get_db)):
+    db_user = crud.update_application_user(db, user_id=user_id, user=user)
+    if db_user is None:
+        raise HTTPException(status_code=404, detail="Application User not found")
+    return db_user
+
 @app.delete("/application-users/{user_id}")
 def delete_application_user(user_id: int, db: Session = Depends(get_db)):
     db_user = crud.delete_application_user(db, user_id=user_id)
@@ -424,44 +666,117 @@ def delete_application_user(user_id: int, db: Session = Depends(get_db)):
 
 # Skill Matrix endpoints
 @app.get("/skill-matrix/")
-def get_skill_matrix(db: Session = Depends(get_db)):
-    """Get skill matrix showing all GenCs with their skills and proficiency levels"""
-    return crud.get_skill_matrix(db)
+async def get_skill_matrix(
+    response: Response,
+    designation: Optional[models.DesignationEnum] = None,
+    account_id: Optional[int] = None,
+    category: Optional[str] = None,
+    only_with_gaps: bool = False,
+    min_gap_count: Optional[int] = None,
+    search: Optional[str] = None,
+    sort: str = "id",
+    after: Optional[str] = None,
+    limit: int = Query(100, ge=1, le=1000),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """Get a page of the skill matrix showing GenCs with their skills and proficiency levels.
+
+    Pass the X-Next-Cursor response header back as `after` to fetch the next page.
+    """
+    try:
+        entries, next_cursor = await async_crud.get_skill_matrix(
+            db, designation=designation, account_id=account_id, category=category, only_with_gaps=only_with_gaps,
+            min_gap_count=min_gap_count, search=search, sort=sort, after=after, limit=limit
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if next_cursor:
+        response.headers["X-Next-Cursor"] = next_cursor
+    return entries
 
 @app.get("/role-requirements-matrix/")
 def get_role_requirements_matrix(db: Session = Depends(get_db)):
     """Get role requirements matrix showing required skills for each role"""
     return crud.get_role_requirements_matrix(db)
 
+# Statistics endpoints
+@app.get("/stats/dashboard", response_model=schemas.DashboardStats)
+async def get_dashboard_stats(db: AsyncSession = Depends(get_async_db)):
+    """Get aggregated GenC counts for the dashboard"""
+    return await async_crud.get_dashboard_stats(db)
+
+@app.get("/stats/status-analytics", response_model=schemas.StatusAnalytics)
+def get_status_analytics(
+    include_current: bool = False,
+    cohort_status: models.StatusEnum = models.StatusEnum.BILLING_STARTED,
+    cohort_months: int = Query(12, ge=0, le=36),
+    db: Session = Depends(get_db)
+):
+    """Time-in-status distributions, funnel conversion along the status workflow and joining-month cohorts.
+
+    `include_current` counts the time GenCs have spent in their current status so far;
+    cohorts track how many GenCs reached `cohort_status` within each month after joining.
+    """
+    return crud.get_status_analytics(db, include_current=include_current, cohort_status=cohort_status,
+                                     cohort_months=cohort_months)
+
+@app.get("/stats/cache", response_model=schemas.ResponseCacheStats)
+def get_response_cache_stats():
+    """Hit/miss counters of the reference data response cache"""
+    return response_cache.cache.stats()
+
 # Utility endpoints
+# Enum values never change while the app runs, so the bundle and its ETag are built once at startup
+ENUMS = {
+    "status": {status.name: status.value for status in models.StatusEnum},
+    "location": {location.name: location.value for location in models.LocationEnum},
+    "designation": {designation.name: designation.value for designation in models.DesignationEnum},
+    "mentor_designation": {designation.name: designation.value for designation in models.MentorDesignationEnum},
+    "user_type": {user_type.name: user_type.value for user_type in models.UserTypeEnum},
+    "proficiency_level": {level.name: level.value for level in models.ProficiencyLevelEnum},
+    "status_transitions": {status.value: [transition.value for transition in transitions]
+                           for status, transitions in crud.ALLOWED_STATUS_TRANSITIONS.items()}
+}
+ENUMS_BODY = json.dumps(ENUMS, separators=(",", ":")).encode()
+ENUMS_HEADERS = {
+    "ETag": '"' + hashlib.sha256(ENUMS_BODY).hexdigest()[:32] + '"',
+    "Cache-Control": "public, max-age=86400"
+}
+
+@app.get("/enums", response_model=schemas.EnumBundle)
+def get_enums(request: Request):
+    """All enum values and the allowed status transitions in one response"""
+    if response_cache.matches_etag(request.headers.get("if-none-match"), ENUMS_HEADERS["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=ENUMS_HEADERS)
+    return Response(content=ENUMS_BODY, media_type="application/json", headers=ENUMS_HEADERS)
+
 @app.get("/enums/status")
 def get_status_enum():
-    return {status.name: status.value for status in models.StatusEnum}
+    return ENUMS["status"]
 
 @app.get("/enums/location")
 def get_location_enum():
-    return {location.name: location.value for location in models.LocationEnum}
+    return ENUMS["location"]
 
 @app.get("/enums/designation")
 def get_designation_enum():
-    return {designation.name: designation.value for designation in models.DesignationEnum}
+    return ENUMS["designation"]
 
 @app.get("/enums/mentor-designation")
 def get_mentor_designation_enum():
-    return {designation.name: designation.value for designation in models.MentorDesignationEnum}
+    return ENUMS["mentor_designation"]
 
 @app.get("/enums/user-type")
 def get_user_type_enum():
-    return {user_type.name: user_type.value for user_type in models.UserTypeEnum}
+    return ENUMS["user_type"]
 
 @app.get("/enums/proficiency-level")
 def get_proficiency_level_enum():
-    return {level.name: level.value for level in models.ProficiencyLevelEnum}
+    return ENUMS["proficiency_level"]
 
 @app.get("/enums/status-transitions")
 def get_status_transitions():
-    return {status.value: [transition.value for transition in transitions] 
-            for status, transitions in crud.ALLOWED_STATUS_TRANSITIONS.items()}
+    return ENUMS["status_transitions"]
 
 if __name__ == "__main__":
     import uvicorn
@@ -0,0 +1,199 @@
+from sqlalchemy import inspect, select, func, delete, text
+from sqlalchemy.orm import Session
+from sqlalchemy.schema import AddConstraint, CreateTable
+import logging
+import os
+import weakref
+from database import Base
+import models
+import search_index
+import skill_matrix
+
+# create_all() only creates missing tables, so indexes and foreign key changes made to existing
+# tables are applied here. Everything is idempotent and runs on every startup.
+
+logger = logging.getLogger(__name__)
+
+# Rows that block an upgrade (orphans of a new ON DELETE CASCADE, duplicates of a new unique index)
+# are only deleted when this is set; otherwise the step is skipped and the rows are logged
+DB_UPGRADE_REMOVE_INVALID_ROWS = os.getenv("DB_UPGRADE_REMOVE_INVALID_ROWS", "").lower() in ("1", "true", "yes")
+
+# Unique indexes present in each database, looked up once per engine and refreshed by upgrade()
+_unique_indexes = weakref.WeakKeyDictionary()
+
+def unique_indexes(connection) -> set:
+    """Names of the unique indexes in the database.
+
+    upgrade() leaves a unique index uncreated while duplicate rows block it, so code relying on
+    one (ON CONFLICT upserts) checks here first.
+    """
+    names = _unique_indexes.get(connection.engine)
+    if names is None:
+        inspector = inspect(connection)
+        names = {
+            index["name"]
+            for table_name in inspector.get_table_names()
+            for index in inspector.get_indexes(table_name) if index["unique"]
+        }
+        _unique_indexes[connection.engine] = names
+    return names
+
+def _missing_indexes(engine):
+    inspector = inspect(engine)
+    existing = {}
+    for table_name in inspector.get_table_names():
+        existing[table_name] = {index["name"] for index in inspector.get_indexes(table_name)}
+    return [
+        index
+        for table in Base.metadata.sorted_tables
+        for index in sorted(table.indexes, key=lambda index: index.name)
+        if index.name not in existing.get(table.name, set())
+    ]
+
+def _duplicates(model, columns):
+    """Criterion for rows that would violate a new unique index: all but the oldest row of each group"""
+    return model.id.notin_(select(func.min(model.id)).group_by(*columns))
+
+def _outdated_foreign_keys(engine):
+    """(table, foreign key constraint) pairs whose ON DELETE action in the database differs from the models"""
+    inspector = inspect(engine)
+    table_names = set(inspector.get_table_names())
+    outdated = []
+    for table in Base.metadata.sorted_tables:
+        if table.name not in table_names:
+            continue
+        reflected = {
+            (tuple(fk["constrained_columns"]), fk["referred_table"]): fk
+            for fk in inspector.get_foreign_keys(table.name)
+        }
+        for constraint in sorted(table.foreign_key_constraints, key=lambda constraint: constraint.column_keys):
+            existing = reflected.get((tuple(constraint.column_keys), constraint.referred_table.name))
+            if existing is None:
+                continue
+            if (existing["options"].get("ondelete") or "").upper() != (constraint.ondelete or "").upper():
+                outdated.append((table, constraint, existing))
+    return outdated
+
+def _orphans(constraint):
+    """Criterion for rows whose parent is gone, which ON DELETE CASCADE would have deleted"""
+    (column,) = constraint.columns
+    (element,) = constraint.elements
+    return column.isnot(None) & column.notin_(select(element.column))
+
+def _row_ids(connection, table, criterion) -> list:
+    (key,) = table.primary_key.columns
+    return connection.execute(select(key).where(criterion).order_by(key)).scalars().all()
+
+def _rebuild_sqlite_table(connection, table):
+    """Recreate a table from its model definition and copy its rows over.
+
+    SQLite cannot alter a constraint in place; this is its documented table rebuild procedure and
+    must run with foreign key enforcement off. Indexes are recreated afterwards by upgrade().
+    """
+    existing_columns = {column["name"] for column in inspect(connection).get_columns(table.name)}
+    columns = ", ".join(column.name for column in table.columns if column.name in existing_columns)
+    staging = f"{table.name}_rebuild"
+    create = str(CreateTable(table).compile(dialect=connection.dialect))
+    connection.execute(text(create.replace(f"CREATE TABLE {table.name} (", f"CREATE TABLE {staging} (", 1)))
+    connection.execute(text(f"INSERT INTO {staging} ({columns}) SELECT {columns} FROM {table.name}"))
+    connection.execute(text(f"DROP TABLE {table.name}"))
+    connection.execute(text(f"ALTER TABLE {staging} RENAME TO {table.name}"))
+
+def upgrade_foreign_keys(engine, remove_invalid_rows: bool = DB_UPGRADE_REMOVE_INVALID_ROWS):
+    """Bring ON DELETE actions of existing tables in line with the models.
+
+    Rows already orphaned under a new ON DELETE CASCADE are deleted first, with their search index
+    rows, if remove_invalid_rows; otherwise they are logged and the foreign keys are left as they are.
+    """
+    outdated = _outdated_foreign_keys(engine)
+    if not outdated:
+        return
+
+    with engine.connect() as connection:
+        sqlite = engine.dialect.name == "sqlite"
+        if sqlite:
+            connection.exec_driver_sql("PRAGMA foreign_keys=OFF")
+        try:
+            for table, constraint, _ in outdated:
+                if not (constraint.ondelete and constraint.ondelete.upper() == "CASCADE"):
+                    continue
+                orphans = _orphans(constraint)
+                ids = _row_ids(connection, table, orphans)
+                if not ids:
+                    continue
+                if not remove_invalid_rows:
+                    logger.warning(
+                        "Foreign keys not upgraded: %d rows of %s reference a missing %s row (ids %s). "
+                        "Set DB_UPGRADE_REMOVE_INVALID_ROWS=1 to delete them and upgrade",
+                        len(ids), table.name, constraint.referred_table.name, ids
+                    )
+                    connection.rollback()
+                    return
+                connection.execute(delete(table).where(orphans))
+                logger.warning(
+                    "Removed %d rows from %s whose %s row no longer exists (ids %s)",
+                    len(ids), table.name, constraint.referred_table.name, ids
+                )
+            search_index.remove_stale(connection)
+            if sqlite:
+                for table in dict.fromkeys(table for table, _, _ in outdated):
+                    _rebuild_sqlite_table(connection, table)
+            else:
+                for table, constraint, existing in outdated:
+                    connection.execute(text(f'ALTER TABLE {table.name} DROP CONSTRAINT "{existing["name"]}"'))
+                    connection.execute(AddConstraint(constraint))
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        finally:
+            # Outside any transaction, where the pragma takes effect
+            if sqlite:
+                connection.exec_driver_sql("PRAGMA foreign_keys=ON")
+
+def upgrade(engine, remove_invalid_rows: bool = DB_UPGRADE_REMOVE_INVALID_ROWS):
+    """Apply foreign key changes and create indexes missing from an existing database.
+
+    Rows that break a new unique index are deleted first, keeping the oldest of each group, if
+    remove_invalid_rows; otherwise they are logged and that index is not created.
+    """
+    _unique_indexes.pop(engine, None)
+    upgrade_foreign_keys(engine, remove_invalid_rows)
+    missing = _missing_indexes(engine)
+    if not missing:
+        return
+
+    blocked = set()
+    with Session(engine) as db:
+        for index in missing:
+            if not index.unique:
+                continue
+            model = next(mapper.class_ for mapper in Base.registry.mappers if mapper.local_table is index.table)
+            duplicates = _duplicates(model, [getattr(model, column.key) for column in index.columns])
+            rows = db.query(model).filter(duplicates).order_by(model.id).all()
+            if not rows:
+                continue
+            ids = [row.id for row in rows]
+            if not remove_invalid_rows:
+                logger.warning(
+                    "Index %s not created: %s has %d duplicate rows (ids %s). "
+                    "Upserts keyed on it look rows up before writing them instead. "
+                    "Set DB_UPGRADE_REMOVE_INVALID_ROWS=1 to delete them, keeping the oldest of each, and create it",
+                    index.name, index.table.name, len(ids), ids
+                )
+                blocked.add(index.name)
+                continue
+            db.execute(delete(model).where(duplicates))
+            logger.warning("Removed %d duplicate rows from %s before creating %s (ids %s)",
+                           len(ids), index.table.name, index.name, ids)
+            if model is models.GenCSkill:
+                search_index.remove(db, search_index.SKILL_NOTE, ids)
+                skill_matrix.refresh(db, [row.genc_id for row in rows])
+            elif model is models.RoleSkillRequirement:
+                skill_matrix.refresh_role(db, [row.role for row in rows])
+        db.commit()
+
+    for index in missing:
+        if index.name not in blocked:
+            index.create(bind=engine, checkfirst=True)
+    _unique_indexes.pop(engine, None)
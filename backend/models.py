@@ -1,6 +1,7 @@
-from sqlalchemy import Column, Integer, String, Date, ForeignKey, Enum as SQLEnum, Text
+from sqlalchemy import Column, Integer, String, Date, DateTime, ForeignKey, Index, Enum as SQLEnum, Text
 from sqlalchemy.orm import relationship
 from database import Base
+from datetime import datetime
 import enum
 
 class StatusEnum(enum.Enum):
@@ -58,9 +59,9 @@ class Account(Base):
     epl_name = Column(String(255), nullable=False)
     edp_name = Column(String(255), nullable=False)
     
-    # Relationships
-    service_lines = relationship("AccountServiceLine", back_populates="account")
-    gencs = relationship("GenC", back_populates="account")
+    # Relationships; children are removed by the database's ON DELETE CASCADE, not loaded first
+    service_lines = relationship("AccountServiceLine", back_populates="account", cascade="all, delete", passive_deletes=True)
+    gencs = relationship("GenC", back_populates="account", cascade="all, delete", passive_deletes=True)
 
 class Mentor(Base):
     __tablename__ = "mentors"
@@ -73,13 +74,17 @@ class Mentor(Base):
     
     # Relationships
     gencs = relationship("GenC", back_populates="mentor")
-    feedbacks = relationship("GenCFeedback", back_populates="mentor")
+    feedbacks = relationship("GenCFeedback", back_populates="mentor", cascade="all, delete", passive_deletes=True)
 
 class AccountServiceLine(Base):
     __tablename__ = "account_service_lines"
+    __table_args__ = (
+        # Service line lookup by account and name (GenC importer, service lines per account)
+        Index("ix_account_service_lines_account_id_service_line", "account_id", "service_line"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
-    account_id = Column(Integer, ForeignKey("accounts.id"), nullable=False)
+    account_id = Column(Integer, ForeignKey("accounts.id", ondelete="CASCADE"), nullable=False)
     service_line = Column(String(255), nullable=False)
     edl_name = Column(String(255), nullable=False)
     pdl_name = Column(String(255), nullable=False)
@@ -98,8 +103,8 @@ class Skill(Base):
     category = Column(String(100))  # e.g., "Technical", "Soft Skills", "Domain"
     
     # Relationships
-    genc_skills = relationship("GenCSkill", back_populates="skill")
-    role_requirements = relationship("RoleSkillRequirement", back_populates="skill")
+    genc_skills = relationship("GenCSkill", back_populates="skill", cascade="all, delete", passive_deletes=True)
+    role_requirements = relationship("RoleSkillRequirement", back_populates="skill", cascade="all, delete", passive_deletes=True)
 
 class GenC(Base):
     __tablename__ = "gencs"
@@ -107,32 +112,37 @@ class GenC(Base):
     id = Column(Integer, primary_key=True, index=True)
     associate_id = Column(String(50), unique=True, index=True, nullable=False)
     genc_name = Column(String(255), nullable=False)
-    account_id = Column(Integer, ForeignKey("accounts.id"), nullable=False)
-    service_line_id = Column(Integer, ForeignKey("account_service_lines.id"), nullable=False)
-    mentor_id = Column(Integer, ForeignKey("mentors.id"), nullable=False)
-    status = Column(SQLEnum(StatusEnum), nullable=False, default=StatusEnum.IDLE)
-    date_of_joining = Column(Date, nullable=False)
+    account_id = Column(Integer, ForeignKey("accounts.id", ondelete="CASCADE"), nullable=False, index=True)
+    service_line_id = Column(Integer, ForeignKey("account_service_lines.id"), nullable=False, index=True)
+    # No cascade: a mentor cannot be deleted while GenCs are assigned to them
+    mentor_id = Column(Integer, ForeignKey("mentors.id"), nullable=False, index=True)
+    status = Column(SQLEnum(StatusEnum), nullable=False, default=StatusEnum.IDLE, index=True)
+    date_of_joining = Column(Date, nullable=False, index=True)
     date_of_allocation = Column(Date)
     allocation_project = Column(String(255))
     team_name = Column(String(255))
     location = Column(SQLEnum(LocationEnum), nullable=False)
-    current_designation = Column(SQLEnum(DesignationEnum), nullable=False)
+    current_designation = Column(SQLEnum(DesignationEnum), nullable=False, index=True)
     planned_billing_start_date = Column(Date)
-    actual_billing_start_date = Column(Date)
+    actual_billing_start_date = Column(Date, index=True)
     
     # Relationships
     account = relationship("Account", back_populates="gencs")
     service_line_obj = relationship("AccountServiceLine", back_populates="gencs")
     mentor = relationship("Mentor", back_populates="gencs")
-    feedbacks = relationship("GenCFeedback", back_populates="genc")
-    skills = relationship("GenCSkill", back_populates="genc")
+    feedbacks = relationship("GenCFeedback", back_populates="genc", cascade="all, delete", passive_deletes=True)
+    skills = relationship("GenCSkill", back_populates="genc", cascade="all, delete", passive_deletes=True)
 
 class GenCSkill(Base):
     __tablename__ = "genc_skills"
+    __table_args__ = (
+        # One row per GenC and skill; also serves lookups by genc_id
+        Index("uq_genc_skills_genc_id_skill_id", "genc_id", "skill_id", unique=True),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
-    genc_id = Column(Integer, ForeignKey("gencs.id"), nullable=False)
-    skill_id = Column(Integer, ForeignKey("skills.id"), nullable=False)
+    genc_id = Column(Integer, ForeignKey("gencs.id", ondelete="CASCADE"), nullable=False)
+    skill_id = Column(Integer, ForeignKey("skills.id", ondelete="CASCADE"), nullable=False, index=True)
     proficiency_level = Column(SQLEnum(ProficiencyLevelEnum), nullable=False)
     date_acquired = Column(Date)
     notes = Column(Text)
@@ -143,22 +153,48 @@ class GenCSkill(Base):
 
 class RoleSkillRequirement(Base):
     __tablename__ = "role_skill_requirements"
+    __table_args__ = (
+        # One requirement per role and skill; also serves lookups by role
+        Index("uq_role_skill_requirements_role_skill_id", "role", "skill_id", unique=True),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     role = Column(SQLEnum(DesignationEnum), nullable=False)
-    skill_id = Column(Integer, ForeignKey("skills.id"), nullable=False)
+    skill_id = Column(Integer, ForeignKey("skills.id", ondelete="CASCADE"), nullable=False, index=True)
     required_proficiency_level = Column(SQLEnum(ProficiencyLevelEnum), nullable=False)
     is_mandatory = Column(String(10), default="Yes")  # "Yes" or "No"
     
     # Relationships
     skill = relationship("Skill", back_populates="role_requirements")
 
+class GenCSkillMatrixEntry(Base):
+    """Precomputed skill matrix row per GenC, maintained by skill_matrix.refresh()"""
+    __tablename__ = "genc_skill_matrix"
+    
+    genc_id = Column(Integer, ForeignKey("gencs.id", ondelete="CASCADE"), primary_key=True)
+    skill_gaps_count = Column(Integer, nullable=False, default=0)
+    missing_mandatory_count = Column(Integer, nullable=False, default=0)
+    entry = Column(Text, nullable=False)  # JSON-encoded row as returned by /skill-matrix/
+
+class GenCStatusChange(Base):
+    """Append-only log of GenC status changes, written by status_history.record()"""
+    __tablename__ = "genc_status_history"
+    __table_args__ = (
+        Index("ix_genc_status_history_genc_id_changed_at", "genc_id", "changed_at"),
+    )
+    
+    id = Column(Integer, primary_key=True, index=True)
+    genc_id = Column(Integer, ForeignKey("gencs.id", ondelete="CASCADE"), nullable=False)
+    from_status = Column(SQLEnum(StatusEnum))  # None for the status a GenC started with
+    to_status = Column(SQLEnum(StatusEnum), nullable=False, index=True)
+    changed_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+
 class GenCFeedback(Base):
     __tablename__ = "genc_feedbacks"
     
     id = Column(Integer, primary_key=True, index=True)
-    genc_id = Column(Integer, ForeignKey("gencs.id"), nullable=False)
-    mentor_id = Column(Integer, ForeignKey("mentors.id"), nullable=False)
+    genc_id = Column(Integer, ForeignKey("gencs.id", ondelete="CASCADE"), nullable=False, index=True)
+    mentor_id = Column(Integer, ForeignKey("mentors.id", ondelete="CASCADE"), nullable=False, index=True)
     date_of_feedback = Column(Date, nullable=False)
     feedback = Column(Text, nullable=False)
     
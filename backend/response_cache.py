@@ -0,0 +1,190 @@
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode
+import hashlib
+import os
+import re
+import threading
+import time
+
+# In-process cache of encoded GET responses for reference data that is read on every page but
+# rarely written. Entries are grouped under tags; crud invalidates a tag after committing a write
+# to its tables. Each worker process has its own cache, so the TTL bounds staleness across workers.
+
+RESPONSE_CACHE_MAX_ENTRIES = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", "512"))
+RESPONSE_CACHE_TTL_SECONDS = float(os.getenv("RESPONSE_CACHE_TTL_SECONDS", "300"))
+
+# Invalidation tags
+ACCOUNTS = "accounts"
+MENTORS = "mentors"
+SKILLS = "skills"
+ROLE_REQUIREMENTS = "role_requirements"
+ENUMS = "enums"
+
+# Cached routes and the tags whose writes change them
+CACHED_ROUTES = [
+    (re.compile(r"^/accounts/(\d+)?$"), (ACCOUNTS,)),
+    (re.compile(r"^/mentors/(\d+)?$"), (MENTORS,)),
+    (re.compile(r"^/skills/(\d+|categories/|category/[^/]+)?$"), (SKILLS,)),
+    # Requirements embed their skill
+    (re.compile(r"^/role-skill-requirements/(\d+)?$"), (ROLE_REQUIREMENTS, SKILLS)),
+    (re.compile(r"^/roles/[^/]+/requirements/$"), (ROLE_REQUIREMENTS, SKILLS)),
+    (re.compile(r"^/role-requirements-matrix/$"), (ROLE_REQUIREMENTS, SKILLS)),
+    (re.compile(r"^/enums/[^/]+$"), (ENUMS,)),
+]
+
+# Clients may keep a copy but must revalidate it, which is answered with a 304 while it is current
+CACHE_CONTROL = b"no-cache"
+
+class CachedResponse:
+    def __init__(self, headers: List[Tuple[bytes, bytes]], body: bytes, expires_at: float):
+        self.etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+        self.headers = [
+            (name, value) for name, value in headers
+            if name.lower() not in (b"content-length", b"etag", b"cache-control")
+        ] + [(b"etag", self.etag.encode()), (b"cache-control", CACHE_CONTROL)]
+        self.body = body
+        self.expires_at = expires_at
+
+class ResponseCache:
+    """Thread-safe LRU of encoded responses with a TTL, invalidated by tag"""
+
+    def __init__(self, max_entries: int = RESPONSE_CACHE_MAX_ENTRIES, ttl_seconds: float = RESPONSE_CACHE_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[tuple, Tuple[CachedResponse, tuple]]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key: tuple) -> Optional[CachedResponse]:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is not None and item[0].expires_at <= time.monotonic():
+                del self._entries[key]
+                self.evictions += 1
+                item = None
+            if item is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return item[0]
+
+    def generation(self, tags: Iterable[str]) -> tuple:
+        """Snapshot of the tags' write counters, taken before building a response"""
+        with self._lock:
+            return tuple(self._generations.get(tag, 0) for tag in tags)
+
+    def put(self, key: tuple, tags: tuple, generation: tuple, headers, body: bytes) -> CachedResponse:
+        """Store a built response, unless one of its tags was invalidated while it was being built"""
+        entry = CachedResponse(headers, body, time.monotonic() + self.ttl_seconds)
+        with self._lock:
+            if generation != tuple(self._generations.get(tag, 0) for tag in tags):
+                return entry
+            self._entries[key] = (entry, tags)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return entry
+
+    def record_not_modified(self):
+        with self._lock:
+            self.not_modified += 1
+
+    def invalidate(self, *tags: str):
+        with self._lock:
+            for tag in tags:
+                self._generations[tag] = self._generations.get(tag, 0) + 1
+            stale = [key for key, (_, entry_tags) in self._entries.items() if set(entry_tags) & set(tags)]
+            for key in stale:
+                del self._entries[key]
+            self.invalidations += 1
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl_seconds,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else None,
+                "not_modified": self.not_modified,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations
+            }
+
+cache = ResponseCache()
+
+def invalidate(*tags: str):
+    """Drop cached responses built from the tagged data; call after the write has committed"""
+    cache.invalidate(*tags)
+
+def _route_tags(path: str) -> Optional[tuple]:
+    for pattern, tags in CACHED_ROUTES:
+        if pattern.match(path):
+            return tags
+    return None
+
+def matches_etag(if_none_match, etag: str) -> bool:
+    """Whether an If-None-Match header value (str or bytes) matches etag"""
+    if not if_none_match:
+        return False
+    if isinstance(if_none_match, bytes):
+        if_none_match = if_none_match.decode("latin-1")
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    # Weak comparison, as If-None-Match requires
+    return "*" in candidates or etag in [candidate[2:] if candidate.startswith("W/") else candidate for candidate in candidates]
+
+class ResponseCacheMiddleware:
+    """ASGI middleware serving CACHED_ROUTES from the cache, with ETag and If-None-Match support"""
+
+    def __init__(self, app, response_cache: ResponseCache = cache):
+        self.app = app
+        self.cache = response_cache
+
+    async def __call__(self, scope, receive, send):
+        tags = _route_tags(scope["path"]) if scope["type"] == "http" and scope["method"] == "GET" else None
+        if tags is None:
+            await self.app(scope, receive, send)
+            return
+
+        # Route plus parameters, with parameter order normalized
+        query = urlencode(sorted(parse_qsl(scope["query_string"].decode("latin-1"), keep_blank_values=True)))
+        key = (scope["path"], query)
+        if_none_match = dict(scope["headers"]).get(b"if-none-match")
+
+        entry = self.cache.get(key)
+        if entry is None:
+            generation = self.cache.generation(tags)
+            messages = []
+
+            async def capture(message):
+                messages.append(message)
+
+            await self.app(scope, receive, capture)
+            start = messages[0]
+            if start["status"] != 200:
+                for message in messages:
+                    await send(message)
+                return
+            body = b"".join(message.get("body", b"") for message in messages[1:])
+            entry = self.cache.put(key, tags, generation, start["headers"], body)
+
+        if matches_etag(if_none_match, entry.etag):
+            self.cache.record_not_modified()
+            await send({"type": "http.response.start", "status": 304, "headers": [
+                (b"etag", entry.etag.encode()), (b"cache-control", CACHE_CONTROL)
+            ]})
+            await send({"type": "http.response.body", "body": b""})
+            return
+        await send({"type": "http.response.start", "status": 200,
+                    "headers": entry.headers + [(b"content-length", str(len(entry.body)).encode())]})
+        await send({"type": "http.response.body", "body": entry.body})
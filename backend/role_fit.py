@@ -0,0 +1,200 @@
+from sqlalchemy import select, case, cast, func, String
+from sqlalchemy.orm import Session
+from typing import List, Optional
+import numpy as np
+import os
+import threading
+import time
+import models
+
+# Role-fit ranking over an in-memory GenC x skill proficiency matrix. Proficiencies are held as
+# uint8 ordinals (0 = skill not held) in a GenC-by-skill array, with the filterable GenC columns
+# as parallel integer arrays, so scoring a role touches only the role's skill columns. The matrix
+# is built from the database on first use; crud invalidates it after committing GenC or GenC skill
+# writes. Each worker process has its own copy, so the TTL bounds staleness across workers.
+
+ROLE_FIT_MATRIX_TTL_SECONDS = float(os.getenv("ROLE_FIT_MATRIX_TTL_SECONDS", "300"))
+
+# Ordinal of each proficiency level; deficits are measured in these steps
+PROFICIENCY_ORDER = {level: rank for rank, level in enumerate(models.ProficiencyLevelEnum, start=1)}
+
+# Deficits on mandatory skills count this many times as much as on optional ones
+MANDATORY_WEIGHT = 2
+
+# Bit widths of the proficiency ordinal and skill id in a packed GenC skill
+_LEVEL_BITS = 3
+_SKILL_BITS = 24
+
+STATUSES = list(models.StatusEnum)
+LOCATIONS = list(models.LocationEnum)
+DESIGNATIONS = list(models.DesignationEnum)
+
+class ProficiencyMatrix:
+    """Snapshot of every GenC's skill proficiencies and filter columns, rows ordered by GenC id"""
+
+    def __init__(self, gencs: list, genc_skills: np.ndarray):
+        self.genc_ids = np.array([row.id for row in gencs], dtype=np.int64)
+        self.associate_ids = [row.associate_id for row in gencs]
+        self.genc_names = [row.genc_name for row in gencs]
+        status_codes = {status: code for code, status in enumerate(STATUSES)}
+        location_codes = {location: code for code, location in enumerate(LOCATIONS)}
+        designation_codes = {designation: code for code, designation in enumerate(DESIGNATIONS)}
+        self.status = np.array([status_codes[row.status] for row in gencs], dtype=np.uint8)
+        self.location = np.array([location_codes[row.location] for row in gencs], dtype=np.uint8)
+        self.designation = np.array([designation_codes[row.current_designation] for row in gencs], dtype=np.uint8)
+        self.account_id = np.array([row.account_id for row in gencs], dtype=np.int64)
+
+        # genc_skills holds packed (GenC id, skill id, proficiency ordinal) integers
+        levels = (genc_skills & ((1 << _LEVEL_BITS) - 1)).astype(np.uint8)
+        skill_column = (genc_skills >> _LEVEL_BITS) & ((1 << _SKILL_BITS) - 1)
+        genc_column = genc_skills >> (_LEVEL_BITS + _SKILL_BITS)
+        skill_ids = np.unique(skill_column)
+        self.skill_columns = {int(skill_id): column for column, skill_id in enumerate(skill_ids)}
+        # Column-major, so each skill's proficiencies are contiguous
+        self.proficiency = np.zeros((len(gencs), len(skill_ids)), dtype=np.uint8, order="F")
+        self.proficiency[np.searchsorted(self.genc_ids, genc_column), np.searchsorted(skill_ids, skill_column)] = levels
+        self.built_at = time.monotonic()
+
+    @classmethod
+    def load(cls, db: Session) -> "ProficiencyMatrix":
+        gencs = db.query(
+            models.GenC.id, models.GenC.associate_id, models.GenC.genc_name, models.GenC.status,
+            models.GenC.location, models.GenC.current_designation, models.GenC.account_id
+        ).order_by(models.GenC.id).all()
+        # Each GenC skill is packed into one integer and the lot fetched as a single aggregated
+        # string, which is far cheaper than building a result row per GenC skill
+        level = case(*[(models.GenCSkill.proficiency_level == level, rank) for level, rank in PROFICIENCY_ORDER.items()],
+                     else_=0)
+        packed = (models.GenCSkill.genc_id * (1 << _SKILL_BITS) + models.GenCSkill.skill_id) * (1 << _LEVEL_BITS) + level
+        encoded = db.execute(
+            select(func.aggregate_strings(cast(packed, String), ","))
+            .select_from(models.GenCSkill)
+            .join(models.GenC, models.GenC.id == models.GenCSkill.genc_id)
+        ).scalar()
+        genc_skills = np.array(encoded.split(",") if encoded else [], dtype=np.int64)
+        return cls(gencs, genc_skills)
+
+    def held(self, skill_ids: List[int], rows: np.ndarray) -> np.ndarray:
+        """Proficiency ordinals of the given rows for the given skills; zero for skills nobody holds"""
+        held = np.zeros((len(rows), len(skill_ids)), dtype=np.uint8)
+        for index, skill_id in enumerate(skill_ids):
+            column = self.skill_columns.get(skill_id)
+            if column is not None:
+                held[:, index] = self.proficiency[rows, column]
+        return held
+
+_matrix: Optional[ProficiencyMatrix] = None
+_generation = 0
+_lock = threading.Lock()
+
+def invalidate():
+    """Drop the matrix after a GenC or GenC skill write has committed"""
+    global _matrix, _generation
+    with _lock:
+        _matrix = None
+        _generation += 1
+
+def get_matrix(db: Session) -> ProficiencyMatrix:
+    global _matrix
+    with _lock:
+        if _matrix is not None and time.monotonic() - _matrix.built_at < ROLE_FIT_MATRIX_TTL_SECONDS:
+            return _matrix
+        generation = _generation
+
+    matrix = ProficiencyMatrix.load(db)
+    with _lock:
+        # Only keep it if no write happened while it was being built
+        if generation == _generation:
+            _matrix = matrix
+    return matrix
+
+def rank_candidates(db: Session, role: models.DesignationEnum, limit: int = 20,
+                    status: Optional[List[models.StatusEnum]] = None, account_id: Optional[int] = None,
+                    location: Optional[models.LocationEnum] = None,
+                    designation: Optional[models.DesignationEnum] = None,
+                    all_mandatory: bool = False) -> dict:
+    """Score the GenCs matching the filters against a role's skill requirements and return the best limit.
+
+    A GenC's deficit on a requirement is how many proficiency levels it falls short (the full
+    required level for a skill it does not hold), weighted by MANDATORY_WEIGHT for mandatory
+    skills. Candidates are ranked by mandatory requirements met, then by score, which is 1 minus
+    the weighted deficit over the largest possible one. all_mandatory keeps only GenCs meeting
+    every mandatory requirement.
+    """
+    requirements = db.query(
+        models.RoleSkillRequirement.skill_id, models.RoleSkillRequirement.required_proficiency_level,
+        models.RoleSkillRequirement.is_mandatory, models.Skill.skill_name
+    ).join(models.Skill, models.Skill.id == models.RoleSkillRequirement.skill_id).filter(
+        models.RoleSkillRequirement.role == role
+    ).order_by(models.RoleSkillRequirement.skill_id).all()
+    matrix = get_matrix(db)
+
+    mask = np.ones(len(matrix.genc_ids), dtype=bool)
+    if status:
+        mask &= np.isin(matrix.status, [STATUSES.index(value) for value in status])
+    if account_id is not None:
+        mask &= matrix.account_id == account_id
+    if location is not None:
+        mask &= matrix.location == LOCATIONS.index(location)
+    if designation is not None:
+        mask &= matrix.designation == DESIGNATIONS.index(designation)
+    rows = np.flatnonzero(mask)
+
+    required = np.array([PROFICIENCY_ORDER[req.required_proficiency_level] for req in requirements], dtype=np.int16)
+    mandatory = np.array([req.is_mandatory == "Yes" for req in requirements], dtype=bool)
+    weights = np.where(mandatory, MANDATORY_WEIGHT, 1).astype(np.int32)
+    max_deficit = int(required @ weights)
+
+    held = matrix.held([req.skill_id for req in requirements], rows)
+    deficit = np.maximum(required - held.astype(np.int16), 0)
+    met = deficit == 0
+    weighted_deficit = deficit @ weights
+    mandatory_met = (met & mandatory).sum(axis=1)
+    mandatory_total = int(mandatory.sum())
+
+    if all_mandatory:
+        keep = mandatory_met == mandatory_total
+        rows, held, deficit, met = rows[keep], held[keep], deficit[keep], met[keep]
+        weighted_deficit, mandatory_met = weighted_deficit[keep], mandatory_met[keep]
+
+    # One integer key: mandatory requirements met, then lower deficit, then lower GenC id (rows are id-ordered)
+    key = (mandatory_met.astype(np.int64) * (max_deficit + 1) + (max_deficit - weighted_deficit)) * len(matrix.genc_ids) \
+        + (len(matrix.genc_ids) - 1 - rows)
+    top = np.argpartition(-key, limit - 1)[:limit] if limit < len(key) else np.arange(len(key))
+    top = top[np.argsort(-key[top])]
+
+    candidates = []
+    for index in top:
+        row = rows[index]
+        gaps = [
+            {
+                "skill_id": req.skill_id,
+                "skill_name": req.skill_name,
+                "required_proficiency_level": req.required_proficiency_level,
+                "proficiency_level": list(PROFICIENCY_ORDER)[held[index, position] - 1] if held[index, position] else None,
+                "is_mandatory": bool(mandatory[position]),
+                "deficit": int(deficit[index, position])
+            }
+            for position, req in enumerate(requirements) if not met[index, position]
+        ]
+        candidates.append({
+            "genc_id": int(matrix.genc_ids[row]),
+            "associate_id": matrix.associate_ids[row],
+            "genc_name": matrix.genc_names[row],
+            "status": STATUSES[matrix.status[row]],
+            "current_designation": DESIGNATIONS[matrix.designation[row]],
+            "account_id": int(matrix.account_id[row]),
+            "score": 1 - int(weighted_deficit[index]) / max_deficit if max_deficit else 1.0,
+            "mandatory_met": int(mandatory_met[index]),
+            "requirements_met": int(met[index].sum()),
+            "weighted_deficit": int(weighted_deficit[index]),
+            "gaps": gaps
+        })
+
+    return {
+        "role": role,
+        "requirements_count": len(requirements),
+        "mandatory_count": mandatory_total,
+        "candidates_considered": len(rows),
+        "candidates": candidates
+    }
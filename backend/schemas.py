@@ -1,8 +1,21 @@
-from pydantic import BaseModel
-from typing import Optional, List
-from datetime import date
+from pydantic import BaseModel, Field, model_validator
+from typing import ClassVar, Optional, List, Dict, get_args
+from datetime import date, datetime
 from models import StatusEnum, LocationEnum, DesignationEnum, MentorDesignationEnum, UserTypeEnum, ProficiencyLevelEnum
 
+# Base of the PATCH bodies
+class PartialUpdate(BaseModel):
+    """Partial update: fields left out are not written; fields the full record requires cannot be set to null"""
+    full_model: ClassVar[type]
+
+    @model_validator(mode="after")
+    def refuse_nulls(self):
+        for name in self.model_fields_set:
+            annotation = self.full_model.model_fields[name].annotation
+            if getattr(self, name) is None and type(None) not in get_args(annotation):
+                raise ValueError(f"{name} cannot be null")
+        return self
+
 # Account schemas
 class AccountBase(BaseModel):
     account_name: str
@@ -15,6 +28,13 @@ class AccountCreate(AccountBase):
 class AccountUpdate(AccountBase):
     pass
 
+class AccountPatch(PartialUpdate):
+    account_name: Optional[str] = None
+    epl_name: Optional[str] = None
+    edp_name: Optional[str] = None
+
+    full_model = AccountBase
+
 class Account(AccountBase):
     id: int
     
@@ -35,6 +55,15 @@ class AccountServiceLineCreate(AccountServiceLineBase):
 class AccountServiceLineUpdate(AccountServiceLineBase):
     pass
 
+class AccountServiceLinePatch(PartialUpdate):
+    account_id: Optional[int] = None
+    service_line: Optional[str] = None
+    edl_name: Optional[str] = None
+    pdl_name: Optional[str] = None
+    sl_spoc: Optional[str] = None
+
+    full_model = AccountServiceLineBase
+
 class AccountServiceLine(AccountServiceLineBase):
     id: int
     account: Optional['Account'] = None
@@ -55,6 +84,14 @@ class MentorCreate(MentorBase):
 class MentorUpdate(MentorBase):
     pass
 
+class MentorPatch(PartialUpdate):
+    associate_id: Optional[str] = None
+    mentor_name: Optional[str] = None
+    designation: Optional[MentorDesignationEnum] = None
+    service_line: Optional[str] = None
+
+    full_model = MentorBase
+
 class Mentor(MentorBase):
     id: int
     
@@ -73,6 +110,13 @@ class SkillCreate(SkillBase):
 class SkillUpdate(SkillBase):
     pass
 
+class SkillPatch(PartialUpdate):
+    skill_name: Optional[str] = None
+    description: Optional[str] = None
+    category: Optional[str] = None
+
+    full_model = SkillBase
+
 class Skill(SkillBase):
     id: int
     
@@ -90,11 +134,29 @@ class GenCSkillBase(BaseModel):
 class GenCSkillCreate(GenCSkillBase):
     pass
 
-class GenCSkillUpdate(BaseModel):
+class GenCSkillPatch(PartialUpdate):
     proficiency_level: Optional[ProficiencyLevelEnum] = None
     date_acquired: Optional[date] = None
     notes: Optional[str] = None
 
+    full_model = GenCSkillBase
+
+class GenCSkillUpdate(GenCSkillPatch):
+    """PUT /genc-skills/{id} has always applied only the fields sent"""
+    pass
+
+class GenCSkillAssignment(BaseModel):
+    """A skill in the full skill set sent to PUT /gencs/{id}/skills"""
+    skill_id: int
+    proficiency_level: ProficiencyLevelEnum
+    date_acquired: Optional[date] = None
+    notes: Optional[str] = None
+
+class GenCSkillBulkUpsert(BaseModel):
+    """GenC skills to create or update; with replace, other skills of the listed GenCs are removed"""
+    items: List[GenCSkillCreate] = Field(..., max_length=10000)
+    replace: bool = False
+
 class GenCSkill(GenCSkillBase):
     id: int
     skill: Optional['Skill'] = None
@@ -115,12 +177,49 @@ class RoleSkillRequirementCreate(RoleSkillRequirementBase):
 class RoleSkillRequirementUpdate(RoleSkillRequirementBase):
     pass
 
+class RoleSkillRequirementPatch(PartialUpdate):
+    role: Optional[DesignationEnum] = None
+    skill_id: Optional[int] = None
+    required_proficiency_level: Optional[ProficiencyLevelEnum] = None
+    is_mandatory: Optional[str] = None
+
+    full_model = RoleSkillRequirementBase
+
 class RoleSkillRequirement(RoleSkillRequirementBase):
     id: int
     
     class Config:
         from_attributes = True
 
+# Role-fit ranking schemas
+class RoleFitGap(BaseModel):
+    skill_id: int
+    skill_name: str
+    required_proficiency_level: ProficiencyLevelEnum
+    proficiency_level: Optional[ProficiencyLevelEnum] = None  # None when the skill is not held
+    is_mandatory: bool
+    deficit: int
+
+class RoleFitCandidate(BaseModel):
+    genc_id: int
+    associate_id: str
+    genc_name: str
+    status: StatusEnum
+    current_designation: DesignationEnum
+    account_id: int
+    score: float
+    mandatory_met: int
+    requirements_met: int
+    weighted_deficit: int
+    gaps: List[RoleFitGap]
+
+class RoleFitRanking(BaseModel):
+    role: DesignationEnum
+    requirements_count: int
+    mandatory_count: int
+    candidates_considered: int
+    candidates: List[RoleFitCandidate]
+
 # GenC schemas (updated without skills field)
 class GenCBase(BaseModel):
     associate_id: str
@@ -144,16 +243,116 @@ class GenCCreate(GenCBase):
 class GenCUpdate(GenCBase):
     pass
 
-class GenC(GenCBase):
+class GenCPatch(PartialUpdate):
+    associate_id: Optional[str] = None
+    genc_name: Optional[str] = None
+    account_id: Optional[int] = None
+    service_line_id: Optional[int] = None
+    mentor_id: Optional[int] = None
+    status: Optional[StatusEnum] = None
+    date_of_joining: Optional[date] = None
+    date_of_allocation: Optional[date] = None
+    allocation_project: Optional[str] = None
+    team_name: Optional[str] = None
+    location: Optional[LocationEnum] = None
+    current_designation: Optional[DesignationEnum] = None
+    planned_billing_start_date: Optional[date] = None
+    actual_billing_start_date: Optional[date] = None
+
+    full_model = GenCBase
+
+class GenCListItem(GenCBase):
+    """GenC as returned by list endpoints: related account, service line and mentor, but no skills"""
     id: int
     account: Optional['Account'] = None
     service_line_obj: Optional['AccountServiceLine'] = None
     mentor: Optional['Mentor'] = None
+    
+    class Config:
+        from_attributes = True
+
+class GenC(GenCListItem):
     skills: Optional[List['GenCSkill']] = None
+
+class GenCFilters(BaseModel):
+    """Filters accepted by the GenC list; unset fields do not filter"""
+    status: Optional[List[StatusEnum]] = None
+    account_id: Optional[int] = None
+    service_line_id: Optional[int] = None
+    mentor_id: Optional[int] = None
+    location: Optional[LocationEnum] = None
+    designation: Optional[DesignationEnum] = None
+    joined_from: Optional[date] = None
+    joined_to: Optional[date] = None
+    billing_from: Optional[date] = None
+    billing_to: Optional[date] = None
+    search: Optional[str] = None
+
+class GenCStatusTransition(BaseModel):
+    """One status change in a bulk request; dates left unset keep their current value"""
+    genc_id: int
+    new_status: StatusEnum
+    date_of_allocation: Optional[date] = None
+    planned_billing_start_date: Optional[date] = None
+    actual_billing_start_date: Optional[date] = None
+
+class GenCStatusTransitionBatch(BaseModel):
+    items: List[GenCStatusTransition] = Field(..., min_length=1, max_length=5000)
+
+class GenCStatusTransitionResult(BaseModel):
+    genc_id: int
+    success: bool
+    previous_status: Optional[StatusEnum] = None
+    status: Optional[StatusEnum] = None
+    detail: Optional[str] = None
+
+class GenCStatusTransitionResponse(BaseModel):
+    applied: int
+    failed: int
+    results: List[GenCStatusTransitionResult]
+
+class GenCStatusChange(BaseModel):
+    id: int
+    genc_id: int
+    from_status: Optional[StatusEnum] = None
+    to_status: StatusEnum
+    changed_at: datetime
     
     class Config:
         from_attributes = True
 
+class StatusDurationStats(BaseModel):
+    """Completed stays in one status; durations in days, buckets keyed by day range"""
+    status: StatusEnum
+    count: int
+    avg_days: Optional[float] = None
+    min_days: Optional[float] = None
+    max_days: Optional[float] = None
+    buckets: Dict[str, int]
+
+class FunnelStage(BaseModel):
+    status: StatusEnum
+    reached: int
+    conversion_from_previous: Optional[float] = None
+    conversion_from_start: Optional[float] = None
+
+class StatusFunnel(BaseModel):
+    stages: List[FunnelStage]
+    exits: Dict[StatusEnum, int]
+
+class StatusCohort(BaseModel):
+    """GenCs joining in one month; reached[n] and rates[n] count those reaching the cohort status within n months"""
+    cohort: str
+    size: int
+    reached: List[int]
+    rates: List[float]
+
+class StatusAnalytics(BaseModel):
+    time_in_status: List[StatusDurationStats]
+    funnel: StatusFunnel
+    cohort_status: StatusEnum
+    cohorts: List[StatusCohort]
+
 # GenC Feedback schemas
 class GenCFeedbackBase(BaseModel):
     genc_id: int
@@ -167,14 +366,32 @@ class GenCFeedbackCreate(GenCFeedbackBase):
 class GenCFeedbackUpdate(GenCFeedbackBase):
     pass
 
+class GenCFeedbackPatch(PartialUpdate):
+    genc_id: Optional[int] = None
+    mentor_id: Optional[int] = None
+    date_of_feedback: Optional[date] = None
+    feedback: Optional[str] = None
+
+    full_model = GenCFeedbackBase
+
 class GenCFeedback(GenCFeedbackBase):
     id: int
-    genc: Optional['GenC'] = None
+    genc: Optional['GenCListItem'] = None
     mentor: Optional['Mentor'] = None
     
     class Config:
         from_attributes = True
 
+class SearchResult(BaseModel):
+    """A feedback or skill note matching a full-text search, best matches first"""
+    kind: str
+    source_id: int
+    genc_id: int
+    associate_id: str
+    genc_name: str
+    snippet: str
+    score: float
+
 # Application User schemas
 class ApplicationUserBase(BaseModel):
     user_assoc_id: str
@@ -187,6 +404,13 @@ class ApplicationUserCreate(ApplicationUserBase):
 class ApplicationUserUpdate(ApplicationUserBase):
     pass
 
+class ApplicationUserPatch(PartialUpdate):
+    user_assoc_id: Optional[str] = None
+    user_name: Optional[str] = None
+    user_type: Optional[UserTypeEnum] = None
+
+    full_model = ApplicationUserBase
+
 class ApplicationUser(ApplicationUserBase):
     id: int
     
@@ -214,8 +438,61 @@ class StatusTransition(BaseModel):
     from_status: StatusEnum
     to_status: StatusEnum
 
+# Import job schemas
+class ImportJob(BaseModel):
+    job_id: str
+    kind: str
+    filename: str
+    status: str  # "queued", "running", "completed" or "failed"
+    detail: Optional[str] = None
+    total_rows: int
+    imported: int
+    skipped: int
+    errors: List[str]
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+
+# Dashboard statistics schemas
+class AccountGenCCount(BaseModel):
+    account_id: int
+    account_name: str
+    genc_count: int
+
+class DashboardStats(BaseModel):
+    total_gencs: int
+    total_mentors: int
+    total_accounts: int
+    status_counts: Dict[str, int]
+    location_counts: Dict[str, int]
+    designation_counts: Dict[str, int]
+    account_counts: List[AccountGenCCount]
+
+# Enum bundle served by /enums
+class EnumBundle(BaseModel):
+    status: Dict[str, str]
+    location: Dict[str, str]
+    designation: Dict[str, str]
+    mentor_designation: Dict[str, str]
+    user_type: Dict[str, str]
+    proficiency_level: Dict[str, str]
+    status_transitions: Dict[str, List[str]]
+
+# Response cache statistics
+class ResponseCacheStats(BaseModel):
+    entries: int
+    max_entries: int
+    ttl_seconds: float
+    hits: int
+    misses: int
+    hit_ratio: Optional[float] = None
+    not_modified: int
+    evictions: int
+    invalidations: int
+
 # Update forward references
 AccountServiceLine.model_rebuild()
 GenCSkill.model_rebuild()
+GenCListItem.model_rebuild()
 GenC.model_rebuild()
-GenCFeedback.model_rebuild() 
\ No newline at end of file
+GenCFeedback.model_rebuild() 
@@ -0,0 +1,185 @@
+from sqlalchemy import event, text, table, column, select, delete, union_all
+from sqlalchemy.orm import Session
+from typing import Iterable, List, Optional, Tuple
+import html
+import re
+from database import Base
+import models
+
+# Full-text index over GenC feedback and GenC skill notes, kept in an SQLite FTS5 table.
+# The table is created with the ORM tables by create_all(); crud keeps it in sync inside the
+# transaction that changes the indexed rows. Other databases have no index and skip all of this.
+
+TABLE_NAME = "search_index"
+
+# Kinds of indexed text. Each row's rowid is derived from its source row so updates and deletes
+# address it directly: FTS5 cannot index the UNINDEXED source columns.
+FEEDBACK = "feedback"
+SKILL_NOTE = "skill_note"
+KINDS = {FEEDBACK: 0, SKILL_NOTE: 1}
+
+# Tokens of context around matches in a snippet
+SNIPPET_TOKENS = 16
+
+# Markers FTS5 places around matches; swapped for <mark> tags once the snippet is HTML-escaped
+_MATCH_START = "\x02"
+_MATCH_END = "\x03"
+
+# Lightweight handle for set-based statements against the FTS table
+_index_table = table(TABLE_NAME, column("rowid"))
+
+def _rowid(kind: str, source_id: int) -> int:
+    return source_id * len(KINDS) + KINDS[kind]
+
+def is_supported(db: Session) -> bool:
+    return db.get_bind().dialect.name == "sqlite"
+
+def _exists(connection) -> bool:
+    return connection.execute(text(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"
+    ), {"name": TABLE_NAME}).first() is not None
+
+@event.listens_for(Base.metadata, "after_create")
+def create(target, connection, **kw):
+    """Create the FTS5 table alongside the ORM tables and fill it from existing rows on first creation"""
+    if connection.dialect.name != "sqlite" or _exists(connection):
+        return
+    connection.execute(text(
+        f"CREATE VIRTUAL TABLE {TABLE_NAME} USING fts5("
+        "body, kind UNINDEXED, source_id UNINDEXED, genc_id UNINDEXED, tokenize = 'porter unicode61')"
+    ))
+    _fill(connection)
+
+def _insert(db: Session, rows: List[dict]):
+    if rows:
+        db.execute(text(
+            f"INSERT INTO {TABLE_NAME} (rowid, body, kind, source_id, genc_id) "
+            "VALUES (:rowid, :body, :kind, :source_id, :genc_id)"
+        ), rows)
+
+def _row(kind: str, source_id: int, genc_id: int, body: str) -> dict:
+    return {"rowid": _rowid(kind, source_id), "body": body, "kind": kind, "source_id": source_id, "genc_id": genc_id}
+
+def _fill(connection):
+    connection.execute(text(
+        f"INSERT INTO {TABLE_NAME} (rowid, body, kind, source_id, genc_id) "
+        f"SELECT id * {len(KINDS)} + {KINDS[FEEDBACK]}, feedback, '{FEEDBACK}', id, genc_id "
+        "FROM genc_feedbacks WHERE feedback IS NOT NULL AND feedback != ''"
+    ))
+    connection.execute(text(
+        f"INSERT INTO {TABLE_NAME} (rowid, body, kind, source_id, genc_id) "
+        f"SELECT id * {len(KINDS)} + {KINDS[SKILL_NOTE]}, notes, '{SKILL_NOTE}', id, genc_id "
+        "FROM genc_skills WHERE notes IS NOT NULL AND notes != ''"
+    ))
+
+def rebuild(db: Session):
+    """Replace the index contents with every feedback and skill note. Does not commit."""
+    db.execute(text(f"DELETE FROM {TABLE_NAME}"))
+    _fill(db.connection())
+
+def remove(db: Session, kind: str, source_ids: Iterable[int]):
+    """Drop the index rows of deleted feedback or skills. Does not commit."""
+    if not is_supported(db):
+        return
+    rowids = [{"rowid": _rowid(kind, source_id)} for source_id in set(source_ids)]
+    if rowids:
+        db.execute(text(f"DELETE FROM {TABLE_NAME} WHERE rowid = :rowid"), rowids)
+
+def remove_stale(connection):
+    """Drop index rows whose feedback or skill row no longer exists, as after rows are deleted
+    outside crud. Does not commit."""
+    if connection.dialect.name != "sqlite" or not _exists(connection):
+        return
+    connection.execute(text(
+        f"DELETE FROM {TABLE_NAME} "
+        "WHERE (kind = :feedback AND source_id NOT IN (SELECT id FROM genc_feedbacks)) "
+        "OR (kind = :skill_note AND source_id NOT IN (SELECT id FROM genc_skills))"
+    ), {"feedback": FEEDBACK, "skill_note": SKILL_NOTE})
+
+def index_feedback(db: Session, feedback: models.GenCFeedback):
+    """Index a created or updated feedback row inside the caller's transaction"""
+    if not is_supported(db):
+        return
+    db.flush()
+    remove(db, FEEDBACK, [feedback.id])
+    if feedback.feedback:
+        _insert(db, [_row(FEEDBACK, feedback.id, feedback.genc_id, feedback.feedback)])
+
+def index_genc_skill(db: Session, genc_skill: models.GenCSkill):
+    """Index the notes of a created or updated GenC skill inside the caller's transaction"""
+    index_genc_skills(db, [genc_skill])
+
+def index_genc_skills(db: Session, genc_skills: List[models.GenCSkill]):
+    if not is_supported(db):
+        return
+    db.flush()
+    remove(db, SKILL_NOTE, [genc_skill.id for genc_skill in genc_skills])
+    _insert(db, [
+        _row(SKILL_NOTE, genc_skill.id, genc_skill.genc_id, genc_skill.notes)
+        for genc_skill in genc_skills if genc_skill.notes
+    ])
+
+def remove_gencs(db: Session, genc_ids):
+    """Drop the index rows of the feedback and skills belonging to deleted GenCs, before those rows are deleted.
+
+    genc_ids may be a list or a SELECT of ids; the rows go in one set-based DELETE.
+    """
+    if not is_supported(db):
+        return
+    owned = union_all(
+        select(models.GenCFeedback.id * len(KINDS) + KINDS[FEEDBACK]).where(models.GenCFeedback.genc_id.in_(genc_ids)),
+        select(models.GenCSkill.id * len(KINDS) + KINDS[SKILL_NOTE]).where(models.GenCSkill.genc_id.in_(genc_ids))
+    )
+    db.execute(delete(_index_table).where(_index_table.c.rowid.in_(owned)))
+
+def match_expression(q: str) -> str:
+    """Turn free text into an FTS5 query: every word must match, the last one as a prefix.
+
+    Words are quoted so FTS5 operators and punctuation in user input are taken literally.
+    """
+    terms = re.findall(r"\w+", q)
+    if not terms:
+        raise ValueError("Search query must contain at least one word")
+    quoted = [f'"{term}"' for term in terms]
+    quoted[-1] += "*"
+    return " ".join(quoted)
+
+def _highlight(snippet: str) -> str:
+    return html.escape(snippet).replace(_MATCH_START, "<mark>").replace(_MATCH_END, "</mark>")
+
+def search(db: Session, q: str, kind: Optional[str] = None, skip: int = 0,
+           limit: int = 20) -> Tuple[List[dict], int]:
+    """Rank indexed text matching q by BM25, best first. Only for databases where is_supported().
+
+    Returns (results, total). Snippets are HTML-escaped with matches wrapped in <mark> tags.
+    """
+    if kind is not None and kind not in KINDS:
+        raise ValueError(f"Invalid kind '{kind}'. Valid values: {', '.join(KINDS)}")
+
+    # GenCs deleted without cleaning up their feedback drop out through the join
+    where = f"{TABLE_NAME} MATCH :match" + (" AND s.kind = :kind" if kind else "")
+    params = {"match": match_expression(q), "kind": kind}
+    total = db.execute(text(
+        f"SELECT count(*) FROM {TABLE_NAME} AS s JOIN gencs AS g ON g.id = s.genc_id WHERE {where}"
+    ), params).scalar()
+    rows = db.execute(text(
+        f"SELECT s.kind, s.source_id, s.genc_id, g.associate_id, g.genc_name, "
+        f"snippet({TABLE_NAME}, 0, :start, :end, '…', {SNIPPET_TOKENS}) AS snippet, bm25({TABLE_NAME}) AS score "
+        f"FROM {TABLE_NAME} AS s JOIN gencs AS g ON g.id = s.genc_id WHERE {where} "
+        "ORDER BY score, s.rowid LIMIT :limit OFFSET :skip"
+    ), {**params, "start": _MATCH_START, "end": _MATCH_END, "limit": limit, "skip": skip})
+
+    results = [
+        {
+            "kind": row.kind,
+            "source_id": row.source_id,
+            "genc_id": row.genc_id,
+            "associate_id": row.associate_id,
+            "genc_name": row.genc_name,
+            "snippet": _highlight(row.snippet),
+            # bm25() is lower-is-better; flip it so larger scores rank higher
+            "score": -row.score
+        }
+        for row in rows
+    ]
+    return results, total
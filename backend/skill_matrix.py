@@ -0,0 +1,231 @@
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import and_, or_, exists
+from typing import Iterable, List, Optional, Tuple
+import base64
+import json
+import models
+
+# GenCs recomputed per batch when refreshing the materialized skill matrix
+REFRESH_BATCH_SIZE = 500
+
+# Proficiency level hierarchy for comparison
+PROFICIENCY_LEVELS = {
+    models.ProficiencyLevelEnum.BEGINNER: 1,
+    models.ProficiencyLevelEnum.INTERMEDIATE: 2,
+    models.ProficiencyLevelEnum.ADVANCED: 3,
+    models.ProficiencyLevelEnum.EXPERT: 4
+}
+
+def _load_role_requirements(db: Session, roles: Iterable[models.DesignationEnum]):
+    """Map role -> skill_id -> requirement for the given roles"""
+    role_skill_map = {role: {} for role in roles}
+    if not role_skill_map:
+        return role_skill_map
+    requirements = db.query(models.RoleSkillRequirement).options(
+        selectinload(models.RoleSkillRequirement.skill)
+    ).filter(models.RoleSkillRequirement.role.in_(list(role_skill_map))).all()
+    for req in requirements:
+        if req.skill is not None:
+            role_skill_map[req.role][req.skill_id] = req
+    return role_skill_map
+
+def build_entry(genc: models.GenC, requirements_by_skill: dict) -> dict:
+    """Compute the skill matrix row (skills, gaps and missing mandatory skills) for one GenC"""
+    genc_skills = []
+    held_skill_ids = set()
+
+    for skill_rel in sorted(genc.skills, key=lambda skill_rel: skill_rel.id):
+        if skill_rel.skill is None:
+            continue
+        held_skill_ids.add(skill_rel.skill_id)
+
+        # Check if this skill has requirements for the current role
+        requirement = requirements_by_skill.get(skill_rel.skill_id)
+        meets_requirement = True
+        required_proficiency = None
+        is_mandatory = False
+
+        if requirement:
+            required_proficiency = requirement.required_proficiency_level.value
+            is_mandatory = requirement.is_mandatory == "Yes"
+            meets_requirement = (PROFICIENCY_LEVELS[skill_rel.proficiency_level]
+                                 >= PROFICIENCY_LEVELS[requirement.required_proficiency_level])
+
+        genc_skills.append({
+            "skill_name": skill_rel.skill.skill_name,
+            "proficiency_level": skill_rel.proficiency_level.value,
+            "category": skill_rel.skill.category,
+            "date_acquired": skill_rel.date_acquired.isoformat() if skill_rel.date_acquired else None,
+            "notes": skill_rel.notes,
+            "required_proficiency_level": required_proficiency,
+            "is_mandatory": is_mandatory,
+            "meets_requirement": meets_requirement
+        })
+
+    # Mandatory skills for the role that the GenC does not hold at all
+    missing_skills = [
+        {
+            "skill_name": requirement.skill.skill_name,
+            "required_proficiency_level": requirement.required_proficiency_level.value,
+            "is_mandatory": True,
+            "is_missing": True
+        }
+        for skill_id, requirement in requirements_by_skill.items()
+        if requirement.is_mandatory == "Yes" and skill_id not in held_skill_ids
+    ]
+
+    return {
+        "associate_id": genc.associate_id,
+        "genc_name": genc.genc_name,
+        "current_designation": genc.current_designation.value,
+        "skills": genc_skills,
+        "missing_mandatory_skills": missing_skills,
+        "skill_gaps_count": len([s for s in genc_skills if not s["meets_requirement"]]) + len(missing_skills)
+    }
+
+def refresh(db: Session, genc_ids: Iterable[int]):
+    """Recompute the stored skill matrix rows for the given GenCs.
+
+    Does not commit; callers refresh inside the transaction that made the change.
+    GenCs that no longer exist simply lose their row.
+    """
+    db.flush()
+    genc_ids = sorted(set(genc_ids))
+    for start in range(0, len(genc_ids), REFRESH_BATCH_SIZE):
+        batch = genc_ids[start:start + REFRESH_BATCH_SIZE]
+        gencs = db.query(models.GenC).options(
+            selectinload(models.GenC.skills).selectinload(models.GenCSkill.skill)
+        ).filter(models.GenC.id.in_(batch)).populate_existing().all()
+        role_skill_map = _load_role_requirements(db, {genc.current_designation for genc in gencs})
+
+        db.query(models.GenCSkillMatrixEntry).filter(
+            models.GenCSkillMatrixEntry.genc_id.in_(batch)
+        ).delete(synchronize_session=False)
+
+        rows = []
+        for genc in gencs:
+            entry = build_entry(genc, role_skill_map[genc.current_designation])
+            rows.append({
+                "genc_id": genc.id,
+                "skill_gaps_count": entry["skill_gaps_count"],
+                "missing_mandatory_count": len(entry["missing_mandatory_skills"]),
+                "entry": json.dumps(entry)
+            })
+        if rows:
+            db.bulk_insert_mappings(models.GenCSkillMatrixEntry, rows)
+
+def refresh_role(db: Session, roles: Iterable[models.DesignationEnum]):
+    """Recompute every GenC currently holding one of the given designations"""
+    db.flush()
+    roles = list(set(roles))
+    genc_ids = [genc_id for (genc_id,) in db.query(models.GenC.id).filter(models.GenC.current_designation.in_(roles))]
+    refresh(db, genc_ids)
+
+def refresh_skill(db: Session, skill_id: int):
+    """Recompute GenCs whose stored rows mention a skill (held, or required by their role)"""
+    db.flush()
+    holders = db.query(models.GenCSkill.genc_id).filter(models.GenCSkill.skill_id == skill_id)
+    roles = db.query(models.RoleSkillRequirement.role).filter(models.RoleSkillRequirement.skill_id == skill_id)
+    genc_ids = [genc_id for (genc_id,) in db.query(models.GenC.id).filter(
+        models.GenC.id.in_(holders) | models.GenC.current_designation.in_(roles)
+    )]
+    refresh(db, genc_ids)
+
+def remove(db: Session, genc_ids: List[int]):
+    """Drop the stored rows of deleted GenCs"""
+    db.query(models.GenCSkillMatrixEntry).filter(
+        models.GenCSkillMatrixEntry.genc_id.in_(genc_ids)
+    ).delete(synchronize_session=False)
+
+def fill_missing(db: Session):
+    """Materialize rows for GenCs that have none yet (new databases, bulk imports) and commit"""
+    genc_ids = [genc_id for (genc_id,) in db.query(models.GenC.id).outerjoin(
+        models.GenCSkillMatrixEntry, models.GenCSkillMatrixEntry.genc_id == models.GenC.id
+    ).filter(models.GenCSkillMatrixEntry.genc_id.is_(None))]
+    refresh(db, genc_ids)
+    db.commit()
+
+# Sort keys accepted by get_entries(); prefix with "-" for descending order
+SORT_COLUMNS = {
+    "id": models.GenC.id,
+    "associate_id": models.GenC.associate_id,
+    "genc_name": models.GenC.genc_name,
+    "skill_gaps_count": models.GenCSkillMatrixEntry.skill_gaps_count,
+    "missing_mandatory_count": models.GenCSkillMatrixEntry.missing_mandatory_count
+}
+
+def encode_cursor(sort_value, genc_id: int) -> str:
+    return base64.urlsafe_b64encode(json.dumps([sort_value, genc_id]).encode()).decode()
+
+def decode_cursor(cursor: str):
+    try:
+        sort_value, genc_id = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return sort_value, int(genc_id)
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+def get_entries(db: Session, designation: Optional[models.DesignationEnum] = None, account_id: Optional[int] = None,
+                category: Optional[str] = None, only_with_gaps: bool = False, min_gap_count: Optional[int] = None,
+                search: Optional[str] = None, sort: str = "id", after: Optional[str] = None,
+                limit: int = 100) -> Tuple[List[dict], Optional[str]]:
+    """Read one page of precomputed skill matrix rows, filtered and ordered in SQL.
+
+    Returns (entries, next_cursor); next_cursor is None on the last page.
+    """
+    descending = sort.startswith("-")
+    sort_key = sort[1:] if descending else sort
+    if sort_key not in SORT_COLUMNS:
+        raise ValueError(f"Invalid sort key '{sort_key}'. Valid values: {', '.join(SORT_COLUMNS)}")
+    sort_column = SORT_COLUMNS[sort_key]
+
+    query = db.query(models.GenCSkillMatrixEntry.entry, sort_column, models.GenC.id).join(
+        models.GenC, models.GenC.id == models.GenCSkillMatrixEntry.genc_id
+    )
+
+    if designation is not None:
+        query = query.filter(models.GenC.current_designation == designation)
+    if account_id is not None:
+        query = query.filter(models.GenC.account_id == account_id)
+    if category:
+        query = query.filter(exists().where(
+            models.GenCSkill.genc_id == models.GenC.id,
+            models.GenCSkill.skill_id == models.Skill.id,
+            models.Skill.category == category
+        ))
+    if only_with_gaps:
+        query = query.filter(models.GenCSkillMatrixEntry.skill_gaps_count > 0)
+    if min_gap_count is not None:
+        query = query.filter(models.GenCSkillMatrixEntry.skill_gaps_count >= min_gap_count)
+    if search:
+        query = query.filter(or_(
+            models.GenC.genc_name.icontains(search, autoescape=True),
+            models.GenC.associate_id.icontains(search, autoescape=True)
+        ))
+
+    # Keyset pagination on (sort value, GenC id)
+    if after:
+        sort_value, genc_id = decode_cursor(after)
+        if descending:
+            query = query.filter(or_(sort_column < sort_value, and_(sort_column == sort_value, models.GenC.id < genc_id)))
+        else:
+            query = query.filter(or_(sort_column > sort_value, and_(sort_column == sort_value, models.GenC.id > genc_id)))
+
+    if descending:
+        query = query.order_by(sort_column.desc(), models.GenC.id.desc())
+    else:
+        query = query.order_by(sort_column, models.GenC.id)
+
+    rows = query.limit(limit + 1).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        _, last_sort_value, last_genc_id = rows[-1]
+        next_cursor = encode_cursor(last_sort_value, last_genc_id)
+
+    return [json.loads(entry) for entry, _, _ in rows], next_cursor
+
+def get_categories(db: Session) -> List[str]:
+    """Distinct skill categories, for the skill matrix category filter"""
+    return [category for (category,) in db.query(models.Skill.category).filter(
+        models.Skill.category.isnot(None)
+    ).distinct().order_by(models.Skill.category)]
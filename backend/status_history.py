@@ -0,0 +1,184 @@
+from sqlalchemy import select, insert, exists, func, case, literal, distinct, extract, DateTime
+from sqlalchemy.orm import Session
+from datetime import datetime
+from typing import Iterable, List, Optional, Tuple
+import models
+
+# Append-only GenC status history and the analytics computed from it.
+# crud records every status change in the transaction that makes it.
+
+# Main path through the status workflow, in order, for the funnel
+FUNNEL_STAGES = [
+    models.StatusEnum.IDLE,
+    models.StatusEnum.UNDER_PROJECT_TRAINING,
+    models.StatusEnum.CUSTOMER_ONBOARDED,
+    models.StatusEnum.BILLING_PLANNED,
+    models.StatusEnum.BILLING_STARTED,
+    models.StatusEnum.GENC_REGULARIZED
+]
+
+# Statuses that leave the main path
+EXIT_STATUSES = [models.StatusEnum.FEEDBACK_NOT_GOOD, models.StatusEnum.RELEASED_RESIGNED]
+
+# Time-in-status histogram buckets in days: (label, lower bound inclusive, upper bound exclusive)
+DURATION_BUCKETS = [
+    ("0-7", 0, 7),
+    ("7-30", 7, 30),
+    ("30-90", 30, 90),
+    ("90-180", 90, 180),
+    ("180+", 180, None)
+]
+
+def record(db: Session, changes: Iterable[Tuple[int, Optional[models.StatusEnum], models.StatusEnum]],
+           changed_at: Optional[datetime] = None):
+    """Append (genc_id, from_status, to_status) changes. Does not commit."""
+    changed_at = changed_at or datetime.utcnow()
+    rows = [
+        {"genc_id": genc_id, "from_status": from_status, "to_status": to_status, "changed_at": changed_at}
+        for genc_id, from_status, to_status in changes
+    ]
+    if rows:
+        db.execute(insert(models.GenCStatusChange), rows)
+
+def remove(db: Session, genc_ids: List[int]):
+    """Drop the history of deleted GenCs"""
+    db.query(models.GenCStatusChange).filter(
+        models.GenCStatusChange.genc_id.in_(genc_ids)
+    ).delete(synchronize_session=False)
+
+def fill_missing(db: Session):
+    """Start the history of GenCs that have none (created before it existed, bulk imports) at their current status, and commit.
+
+    Their first interval starts now: earlier time in that status is unknown.
+    """
+    history = models.GenCStatusChange
+    db.execute(insert(history).from_select(
+        ["genc_id", "to_status", "changed_at"],
+        select(models.GenC.id, models.GenC.status, literal(datetime.utcnow(), DateTime)).where(
+            ~exists().where(history.genc_id == models.GenC.id)
+        )
+    ))
+    db.commit()
+
+def get_history(db: Session, genc_id: int):
+    return db.query(models.GenCStatusChange).filter(
+        models.GenCStatusChange.genc_id == genc_id
+    ).order_by(models.GenCStatusChange.changed_at, models.GenCStatusChange.id).all()
+
+def _days_between(db: Session, start, end):
+    if db.get_bind().dialect.name == "sqlite":
+        return func.julianday(end) - func.julianday(start)
+    return extract("epoch", end - start) / 86400.0
+
+def time_in_status(db: Session, include_current: bool = False) -> List[dict]:
+    """Per status: how many stays ended, and their average, minimum, maximum and bucketed durations in days.
+
+    With include_current, GenCs still in a status count their time so far.
+    """
+    history = models.GenCStatusChange
+    stays = select(
+        history.to_status.label("status"),
+        history.changed_at.label("entered_at"),
+        func.lead(history.changed_at).over(
+            partition_by=history.genc_id, order_by=(history.changed_at, history.id)
+        ).label("left_at")
+    ).join(models.GenC, models.GenC.id == history.genc_id).subquery()
+
+    left_at = stays.c.left_at
+    if include_current:
+        left_at = func.coalesce(left_at, literal(datetime.utcnow(), DateTime))
+    days = _days_between(db, stays.c.entered_at, left_at)
+
+    bucket_columns = [
+        func.sum(case((days >= low if high is None else (days >= low) & (days < high), 1), else_=0)).label(label)
+        for label, low, high in DURATION_BUCKETS
+    ]
+    rows = db.execute(
+        select(stays.c.status, func.count().label("count"), func.avg(days).label("avg_days"),
+               func.min(days).label("min_days"), func.max(days).label("max_days"), *bucket_columns)
+        .where(left_at.isnot(None))
+        .group_by(stays.c.status)
+    ).all()
+    by_status = {row.status: row for row in rows}
+
+    results = []
+    for status in models.StatusEnum:
+        row = by_status.get(status)
+        results.append({
+            "status": status,
+            "count": row.count if row else 0,
+            "avg_days": row.avg_days if row else None,
+            "min_days": row.min_days if row else None,
+            "max_days": row.max_days if row else None,
+            "buckets": {label: getattr(row, label) if row else 0 for label, _, _ in DURATION_BUCKETS}
+        })
+    return results
+
+def funnel(db: Session) -> dict:
+    """GenCs that reached each stage of the main path (or a later one), with conversion rates between stages"""
+    history = models.GenCStatusChange
+    stage_rank = case(*[(history.to_status == status, rank) for rank, status in enumerate(FUNNEL_STAGES)], else_=-1)
+    furthest = select(func.max(stage_rank).label("rank")).join(
+        models.GenC, models.GenC.id == history.genc_id
+    ).group_by(history.genc_id).subquery()
+    reached = db.execute(select(*[
+        func.coalesce(func.sum(case((furthest.c.rank >= rank, 1), else_=0)), 0)
+        for rank in range(len(FUNNEL_STAGES))
+    ])).one()
+
+    exits = dict(db.execute(
+        select(history.to_status, func.count(distinct(history.genc_id)))
+        .join(models.GenC, models.GenC.id == history.genc_id)
+        .filter(history.to_status.in_(EXIT_STATUSES))
+        .group_by(history.to_status)
+    ).all())
+
+    started = reached[0]
+    stages = [
+        {
+            "status": status,
+            "reached": reached[rank],
+            "conversion_from_previous": (reached[rank] / reached[rank - 1] if reached[rank - 1] else None) if rank else None,
+            "conversion_from_start": reached[rank] / started if started else None
+        }
+        for rank, status in enumerate(FUNNEL_STAGES)
+    ]
+    return {"stages": stages, "exits": {status: exits.get(status, 0) for status in EXIT_STATUSES}}
+
+def cohorts(db: Session, target_status: models.StatusEnum = models.StatusEnum.BILLING_STARTED,
+            months: int = 12) -> List[dict]:
+    """Group GenCs by joining month; for each cohort, how many had first reached target_status
+    within 0..months months of joining (cumulative)
+    """
+    history = models.GenCStatusChange
+    first_reached = select(
+        history.genc_id, func.min(history.changed_at).label("reached_at")
+    ).filter(history.to_status == target_status).group_by(history.genc_id).subquery()
+
+    joined_year = extract("year", models.GenC.date_of_joining)
+    joined_month = extract("month", models.GenC.date_of_joining)
+    months_to_reach = (
+        extract("year", first_reached.c.reached_at) * 12 + extract("month", first_reached.c.reached_at)
+        - (joined_year * 12 + joined_month)
+    )
+    reached_columns = [
+        func.sum(case((months_to_reach <= offset, 1), else_=0)).label(f"m{offset}")
+        for offset in range(months + 1)
+    ]
+    rows = db.execute(
+        select(joined_year.label("year"), joined_month.label("month"), func.count(models.GenC.id).label("size"),
+               *reached_columns)
+        .outerjoin(first_reached, first_reached.c.genc_id == models.GenC.id)
+        .group_by(joined_year, joined_month)
+        .order_by(joined_year, joined_month)
+    ).all()
+
+    return [
+        {
+            "cohort": f"{int(row.year):04d}-{int(row.month):02d}",
+            "size": row.size,
+            "reached": [row[3 + offset] for offset in range(months + 1)],
+            "rates": [row[3 + offset] / row.size for offset in range(months + 1)]
+        }
+        for row in rows
+    ]
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+"""
+Test script to verify ON DELETE CASCADE foreign keys and the set-based deletes
+Checks that SQLite enforces the foreign keys and cascades account deletes, that the single
+GenC, account, mentor and skill deletes remove every dependent row and report what they
+deleted, that a service line cannot be deleted while GenCs are on it, that
+delete_all_accounts_and_related_data() does the same in both its single-transaction and
+chunked modes, and that migrations.upgrade() adds the cascades to a database created
+without them, deleting rows already orphaned only when asked to.
+"""
+
+import sys
+import os
+import tempfile
+from datetime import date
+
+# Add the current directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import MetaData, delete, func, insert, select, text
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import sessionmaker
+
+from database import make_engine
+import models
+import crud
+import migrations
+import search_index
+import skill_matrix
+import status_history
+from test_query_plans import seed
+
+def table_counts(db) -> dict:
+    return {
+        "genc_skills": db.query(func.count(models.GenCSkill.id)).scalar(),
+        "genc_feedbacks": db.query(func.count(models.GenCFeedback.id)).scalar(),
+        "gencs": db.query(func.count(models.GenC.id)).scalar(),
+        "account_service_lines": db.query(func.count(models.AccountServiceLine.id)).scalar(),
+        "accounts": db.query(func.count(models.Account.id)).scalar()
+    }
+
+def seeded_session(path: str):
+    engine = make_engine(f"sqlite:///{path}")
+    models.Base.metadata.create_all(bind=engine)
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    seed(db)
+    return engine, db
+
+def test_foreign_keys_cascade(tmp_path):
+    engine, db = seeded_session(os.path.join(tmp_path, "cascade.db"))
+    genc_ids = select(models.GenC.id).where(models.GenC.account_id == 1)
+    skills_of_account = db.query(func.count(models.GenCSkill.id)).filter(models.GenCSkill.genc_id.in_(genc_ids)).scalar()
+    assert skills_of_account > 0
+
+    try:
+        db.execute(insert(models.GenCSkill), [{"genc_id": 999999, "skill_id": 1, "proficiency_level": models.ProficiencyLevelEnum.EXPERT}])
+        db.commit()
+        raise AssertionError("a GenC skill of a missing GenC was accepted")
+    except IntegrityError:
+        db.rollback()
+    print("✅ Foreign keys are enforced")
+
+    before = db.query(func.count(models.GenCSkill.id)).scalar()
+    db.execute(delete(models.Account).where(models.Account.id == 1))
+    db.commit()
+    assert db.query(func.count(models.GenC.id)).filter(models.GenC.account_id == 1).scalar() == 0
+    assert db.query(func.count(models.GenCSkill.id)).scalar() == before - skills_of_account
+    orphans = db.query(func.count(models.GenCSkillMatrixEntry.genc_id)).filter(
+        models.GenCSkillMatrixEntry.genc_id.notin_(select(models.GenC.id))
+    ).scalar()
+    assert orphans == 0
+    print("✅ Deleting an account cascades to its GenCs and their rows")
+    db.close()
+    engine.dispose()
+
+def search_rows(db, kind: str) -> int:
+    return db.execute(text(f"SELECT count(*) FROM {search_index.TABLE_NAME} WHERE kind = :kind"), {"kind": kind}).scalar()
+
+def assert_no_orphans(db):
+    for model in (models.GenCSkill, models.GenCFeedback, models.GenCSkillMatrixEntry, models.GenCStatusChange):
+        orphans = db.query(func.count()).select_from(model).filter(model.genc_id.notin_(select(models.GenC.id))).scalar()
+        assert orphans == 0, f"{orphans} orphaned {model.__tablename__} rows"
+    orphans = db.execute(text(
+        f"SELECT count(*) FROM {search_index.TABLE_NAME} WHERE genc_id NOT IN (SELECT id FROM gencs) "
+        "OR (kind = 'skill_note' AND source_id NOT IN (SELECT id FROM genc_skills)) "
+        "OR (kind = 'feedback' AND source_id NOT IN (SELECT id FROM genc_feedbacks))"
+    )).scalar()
+    assert orphans == 0, f"{orphans} orphaned search index rows"
+
+def test_single_entity_deletes(tmp_path):
+    engine, db = seeded_session(os.path.join(tmp_path, "single.db"))
+    search_index.rebuild(db)
+    db.commit()
+    skill_matrix.fill_missing(db)
+    status_history.fill_missing(db)
+
+    skills_of_genc = db.query(func.count(models.GenCSkill.id)).filter(models.GenCSkill.genc_id == 7).scalar()
+    feedback_of_genc = db.query(func.count(models.GenCFeedback.id)).filter(models.GenCFeedback.genc_id == 7).scalar()
+    assert crud.delete_genc(db, 7) == {"genc_skills": skills_of_genc, "genc_feedbacks": feedback_of_genc, "gencs": 1}
+    assert crud.delete_genc(db, 7) is None
+    assert_no_orphans(db)
+    print("✅ delete_genc removes the GenC's rows; a second delete finds nothing")
+
+    account_gencs = select(models.GenC.id).where(models.GenC.account_id == 3)
+    expected = {
+        "genc_skills": db.query(func.count(models.GenCSkill.id)).filter(models.GenCSkill.genc_id.in_(account_gencs)).scalar(),
+        "genc_feedbacks": db.query(func.count(models.GenCFeedback.id)).filter(models.GenCFeedback.genc_id.in_(account_gencs)).scalar(),
+        "gencs": db.query(func.count(models.GenC.id)).filter(models.GenC.account_id == 3).scalar(),
+        "account_service_lines": db.query(func.count(models.AccountServiceLine.id)).filter(models.AccountServiceLine.account_id == 3).scalar(),
+        "accounts": 1
+    }
+    assert crud.delete_account(db, 3) == expected
+    assert crud.delete_account(db, 3) is None
+    assert_no_orphans(db)
+    print(f"✅ delete_account removes the account's rows: {expected}")
+
+    try:
+        crud.delete_mentor(db, 1)
+        raise AssertionError("a mentor with GenCs assigned was deleted")
+    except ValueError:
+        pass
+    db.execute(models.GenC.__table__.update().where(models.GenC.mentor_id == 1).values(mentor_id=2))
+    db.commit()
+    feedback_of_mentor = db.query(func.count(models.GenCFeedback.id)).filter(models.GenCFeedback.mentor_id == 1).scalar()
+    feedback_rows = search_rows(db, search_index.FEEDBACK)
+    assert crud.delete_mentor(db, 1) == {"genc_feedbacks": feedback_of_mentor, "mentors": 1}
+    assert crud.delete_mentor(db, 1) is None
+    assert search_rows(db, search_index.FEEDBACK) == feedback_rows - feedback_of_mentor
+    assert_no_orphans(db)
+    print("✅ delete_mentor refuses while GenCs are assigned, then removes the mentor's feedback")
+
+    holders = db.query(func.count(models.GenCSkill.id)).filter(models.GenCSkill.skill_id == 2).scalar()
+    requirements = db.query(func.count(models.RoleSkillRequirement.id)).filter(models.RoleSkillRequirement.skill_id == 2).scalar()
+    assert crud.delete_skill(db, 2) == {"genc_skills": holders, "role_skill_requirements": requirements, "skills": 1}
+    assert crud.delete_skill(db, 2) is None
+    assert_no_orphans(db)
+    stale = [entry for (entry,) in db.query(models.GenCSkillMatrixEntry.entry) if '"Skill 1"' in entry]
+    assert not stale, "skill matrix rows still mention the deleted skill"
+    print("✅ delete_skill removes the skill's GenC skills and requirements and refreshes the skill matrix")
+    db.close()
+    engine.dispose()
+
+def test_service_line_delete_refused_while_gencs_remain(tmp_path):
+    engine, db = seeded_session(os.path.join(tmp_path, "service_line.db"))
+    search_index.rebuild(db)
+    db.commit()
+    skill_matrix.fill_missing(db)
+    status_history.fill_missing(db)
+    before = table_counts(db)
+
+    try:
+        crud.delete_account_service_line(db, 5)
+        raise AssertionError("a service line with GenCs was deleted")
+    except ValueError:
+        db.rollback()
+    assert table_counts(db) == before
+    assert_no_orphans(db)
+
+    db.execute(models.GenC.__table__.update().where(models.GenC.service_line_id == 5).values(service_line_id=6))
+    db.commit()
+    assert crud.delete_account_service_line(db, 5) == {"account_service_lines": 1}
+    assert crud.delete_account_service_line(db, 5) is None
+    assert table_counts(db) == {**before, "account_service_lines": before["account_service_lines"] - 1}
+    assert_no_orphans(db)
+    print("✅ delete_account_service_line refuses while GenCs are on the service line, then deletes only it")
+    db.close()
+    engine.dispose()
+
+def check_delete_all(tmp_path, chunk_size):
+    engine, db = seeded_session(os.path.join(tmp_path, f"delete_all_{chunk_size}.db"))
+    search_index.rebuild(db)
+    db.commit()
+    assert db.execute(text(f"SELECT count(*) FROM {search_index.TABLE_NAME}")).scalar() > 0
+    expected = table_counts(db)
+
+    result = crud.delete_all_accounts_and_related_data(db, chunk_size=chunk_size)
+    assert result["deleted_counts"] == expected, (result["deleted_counts"], expected)
+    assert all(count == 0 for count in table_counts(db).values())
+    assert db.query(func.count(models.GenCStatusChange.id)).scalar() == 0
+    assert db.execute(text(f"SELECT count(*) FROM {search_index.TABLE_NAME}")).scalar() == 0
+    print(f"✅ delete_all (chunk_size={chunk_size}) deleted and counted {expected}")
+    db.close()
+    engine.dispose()
+
+def test_delete_all(tmp_path):
+    check_delete_all(tmp_path, None)
+
+def test_delete_all_chunked(tmp_path):
+    check_delete_all(tmp_path, 64)
+
+def test_migration_adds_cascades(tmp_path):
+    # The schema as it was before the cascades: same tables, foreign keys without ON DELETE
+    legacy = MetaData()
+    for table in models.Base.metadata.sorted_tables:
+        table.to_metadata(legacy)
+    for table in legacy.tables.values():
+        for constraint in table.foreign_key_constraints:
+            constraint.ondelete = None
+    engine = make_engine(f"sqlite:///{os.path.join(tmp_path, 'legacy_fks.db')}")
+    legacy.create_all(bind=engine)
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    seed(db)
+    assert migrations._outdated_foreign_keys(engine)
+
+    # A feedback row left behind by a GenC deleted while foreign keys were not enforced
+    db.connection().exec_driver_sql("PRAGMA foreign_keys=OFF")
+    db.execute(insert(models.GenCFeedback), [{
+        "genc_id": 999999, "mentor_id": 1, "date_of_feedback": date(2024, 3, 1),
+        "feedback": "Orphaned"
+    }])
+    db.commit()
+    db.connection().exec_driver_sql("PRAGMA foreign_keys=ON")
+    expected = table_counts(db)
+    expected["genc_feedbacks"] -= 1
+    db.close()
+
+    models.Base.metadata.create_all(bind=engine)
+    # Without the opt-in the orphan is kept and the foreign keys are left alone
+    migrations.upgrade(engine, remove_invalid_rows=False)
+    assert migrations._outdated_foreign_keys(engine)
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    assert table_counts(db)["genc_feedbacks"] == expected["genc_feedbacks"] + 1
+    db.close()
+
+    migrations.upgrade(engine, remove_invalid_rows=True)
+
+    assert not migrations._outdated_foreign_keys(engine)
+    assert not migrations._missing_indexes(engine)
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    assert table_counts(db) == expected, "rows were lost in the rebuild"
+    assert not db.connection().exec_driver_sql("PRAGMA foreign_key_check").all()
+    assert_no_orphans(db)
+    db.execute(delete(models.Account).where(models.Account.id == 2))
+    db.commit()
+    assert db.query(func.count(models.GenC.id)).filter(models.GenC.account_id == 2).scalar() == 0
+    db.close()
+
+    # Running it again is a no-op
+    migrations.upgrade(engine, remove_invalid_rows=True)
+    engine.dispose()
+    print("✅ migrations.upgrade() adds ON DELETE CASCADE to an existing database")
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as scratch:
+        test_foreign_keys_cascade(scratch)
+        test_single_entity_deletes(scratch)
+        test_service_line_delete_refused_while_gencs_remain(scratch)
+        test_delete_all(scratch)
+        test_delete_all_chunked(scratch)
+        test_migration_adds_cascades(scratch)
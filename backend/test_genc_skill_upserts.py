@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+Test script to verify bulk GenC skill upserts and replacement
+Checks that upsert_genc_skills() inserts new (GenC, skill) pairs and updates existing ones in
+place, that replacing removes the unlisted skills of the listed GenCs only, that bad input is
+refused before anything is written, that the search index and skill matrix follow, and that
+upserts still work on a database where the unique indexes they rely on could not be created.
+"""
+
+import sys
+import os
+import tempfile
+import logging
+
+# Add the current directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import insert, inspect, text
+
+import models
+import crud
+import migrations
+import schemas
+import search_index
+from test_cascade_deletes import seeded_session, table_counts, assert_no_orphans
+
+Level = models.ProficiencyLevelEnum
+
+def skill(genc_id: int, skill_id: int, level: Level = Level.ADVANCED, notes=None) -> schemas.GenCSkillCreate:
+    return schemas.GenCSkillCreate(genc_id=genc_id, skill_id=skill_id, proficiency_level=level, notes=notes)
+
+def held(db, genc_id: int) -> dict:
+    return {genc_skill.skill_id: (genc_skill.id, genc_skill.proficiency_level, genc_skill.notes)
+            for genc_skill in db.query(models.GenCSkill).filter(models.GenCSkill.genc_id == genc_id)}
+
+def matrix_skills(db, genc_id: int) -> dict:
+    associate_id = db.get(models.GenC, genc_id).associate_id
+    entries, _ = crud.get_skill_matrix(db, search=associate_id, limit=1000)
+    entry = next(entry for entry in entries if entry["associate_id"] == associate_id)
+    return {skill_entry["skill_name"]: skill_entry["proficiency_level"] for skill_entry in entry["skills"]}
+
+def test_upsert_and_replace(tmp_path):
+    engine, db = seeded_session(os.path.join(tmp_path, "skill_upserts.db"))
+    search_index.rebuild(db)
+    db.commit()
+    before_1, before_2 = held(db, 1), held(db, 2)
+
+    result = crud.upsert_genc_skills(db, [
+        skill(1, 2, Level.EXPERT, notes="Led the migration"),
+        skill(1, 20, Level.INTERMEDIATE, notes="Migration tooling"),
+        skill(2, 3)
+    ])
+    after_1 = held(db, 1)
+    assert [(genc_skill.genc_id, genc_skill.id) for genc_skill in result] == sorted(
+        [(1, row[0]) for row in after_1.values()] + [(2, row[0]) for row in held(db, 2).values()]
+    )
+    assert all(genc_skill.skill is not None for genc_skill in result)
+    assert set(after_1) == set(before_1) | {20}
+    assert after_1[2] == (before_1[2][0], Level.EXPERT, "Led the migration")
+    assert held(db, 2)[3] == (before_2[3][0], Level.ADVANCED, None)
+    assert matrix_skills(db, 1)["Skill 1"] == Level.EXPERT.value and "Skill 19" in matrix_skills(db, 1)
+    assert {result["source_id"] for result in crud.search_feedback(db, "migration")[0]} == {after_1[2][0], after_1[20][0]}
+    print("✅ New pairs are inserted, existing pairs updated in place, and the index and matrix follow")
+
+    others = held(db, 3)
+    result = crud.replace_genc_skills(db, 1, [
+        schemas.GenCSkillAssignment(skill_id=20, proficiency_level=Level.EXPERT),
+        schemas.GenCSkillAssignment(skill_id=4, proficiency_level=Level.BEGINNER, notes="Basics only")
+    ])
+    assert [(genc_skill.skill_id, genc_skill.proficiency_level) for genc_skill in result] == [(4, Level.BEGINNER), (20, Level.EXPERT)]
+    replaced = held(db, 1)
+    assert set(replaced) == {4, 20} and replaced[20][0] == after_1[20][0]
+    assert held(db, 3) == others
+    assert crud.search_feedback(db, "migration")[1] == 0
+    assert [result["source_id"] for result in crud.search_feedback(db, "basics")[0]] == [replaced[4][0]]
+    assert set(matrix_skills(db, 1)) == {"Skill 3", "Skill 19"}
+    assert_no_orphans(db)
+    print("✅ Replacing removes the unlisted skills of that GenC only")
+
+    assert crud.replace_genc_skills(db, 1, []) == [] and held(db, 1) == {}
+    assert crud.search_feedback(db, "basics")[1] == 0 and matrix_skills(db, 1) == {}
+    assert crud.replace_genc_skills(db, 999999, []) is None
+    print("✅ An empty set clears a GenC's skills; a missing GenC gives None")
+    db.close()
+    engine.dispose()
+
+def test_bad_upserts_write_nothing(tmp_path):
+    engine, db = seeded_session(os.path.join(tmp_path, "skill_upserts_refused.db"))
+    counts, before = table_counts(db), held(db, 5)
+    for items, replace, message in (
+        ([skill(5, 7), skill(5, 7, Level.EXPERT)], None, "Skill 7 is listed more than once for GenC 5"),
+        ([skill(5, 7), skill(999999, 7)], None, "GenC 999999 not found"),
+        ([skill(5, 7)], [999998], "GenC 999998 not found"),
+        ([skill(5, 1, Level.EXPERT), skill(5, 999)], [5], "Skill 999 not found")
+    ):
+        try:
+            crud.upsert_genc_skills(db, items, replace_genc_ids=replace)
+            raise AssertionError(f"{message!r} was not raised")
+        except ValueError as e:
+            assert str(e) == message, str(e)
+        db.rollback()
+        assert table_counts(db) == counts and held(db, 5) == before
+    print("✅ Repeated pairs, missing GenCs and missing skills are refused before any write")
+    db.close()
+    engine.dispose()
+
+def test_upserts_while_unique_index_is_blocked(tmp_path):
+    engine, db = seeded_session(os.path.join(tmp_path, "skill_upserts_blocked.db"))
+    # An existing database holding a duplicate pair, which keeps upgrade() from creating the index
+    db.execute(text("DROP INDEX uq_genc_skills_genc_id_skill_id"))
+    db.execute(insert(models.GenCSkill), [{"genc_id": 5, "skill_id": 1, "proficiency_level": Level.EXPERT}])
+    db.commit()
+    logging.getLogger("migrations").setLevel(logging.ERROR)
+    try:
+        migrations.upgrade(engine)
+    finally:
+        logging.getLogger("migrations").setLevel(logging.NOTSET)
+    assert "uq_genc_skills_genc_id_skill_id" not in {index["name"] for index in inspect(engine).get_indexes("genc_skills")}
+    assert "uq_genc_skills_genc_id_skill_id" not in migrations.unique_indexes(db.connection())
+    oldest = min(genc_skill_id for genc_skill_id, in db.query(models.GenCSkill.id).filter(
+        models.GenCSkill.genc_id == 5, models.GenCSkill.skill_id == 1
+    ))
+
+    result = crud.replace_genc_skills(db, 5, [
+        schemas.GenCSkillAssignment(skill_id=1, proficiency_level=Level.ADVANCED, notes="Kept"),
+        schemas.GenCSkillAssignment(skill_id=30, proficiency_level=Level.BEGINNER)
+    ])
+    assert [genc_skill.skill_id for genc_skill in result] == [1, 1, 30]
+    assert next(genc_skill for genc_skill in result if genc_skill.id == oldest).notes == "Kept"
+    crud.upsert_genc_skills(db, [skill(6, 2, Level.EXPERT), skill(6, 29)])
+    assert held(db, 6)[2][1] == Level.EXPERT and 29 in held(db, 6)
+    assert matrix_skills(db, 6)["Skill 28"] == Level.ADVANCED.value
+    print("✅ Without the unique index, upserts look rows up and write them")
+    db.close()
+    engine.dispose()
+
+def test_single_upserts_while_unique_indexes_are_blocked(tmp_path):
+    engine, db = seeded_session(os.path.join(tmp_path, "single_upserts_blocked.db"))
+    db.execute(text("DROP INDEX uq_genc_skills_genc_id_skill_id"))
+    db.execute(text("DROP INDEX uq_role_skill_requirements_role_skill_id"))
+    db.execute(insert(models.GenCSkill), [{"genc_id": 8, "skill_id": 3, "proficiency_level": Level.BEGINNER}])
+    db.execute(insert(models.RoleSkillRequirement), [{
+        "role": models.DesignationEnum.PA, "skill_id": 4, "required_proficiency_level": Level.BEGINNER
+    }])
+    db.commit()
+    logging.getLogger("migrations").setLevel(logging.ERROR)
+    try:
+        migrations.upgrade(engine)
+    finally:
+        logging.getLogger("migrations").setLevel(logging.NOTSET)
+    assert not {"uq_genc_skills_genc_id_skill_id", "uq_role_skill_requirements_role_skill_id"} & migrations.unique_indexes(db.connection())
+
+    oldest_skill = min(genc_skill_id for genc_skill_id, in db.query(models.GenCSkill.id).filter(
+        models.GenCSkill.genc_id == 8, models.GenCSkill.skill_id == 3
+    ))
+    genc_skill = crud.create_genc_skill(db, skill(8, 3, Level.EXPERT, notes="Updated"))
+    assert genc_skill.id == oldest_skill
+    assert (db.get(models.GenCSkill, oldest_skill).proficiency_level, db.get(models.GenCSkill, oldest_skill).notes) == (Level.EXPERT, "Updated")
+    created = crud.create_genc_skill(db, skill(8, 25))
+    assert held(db, 8)[25][0] == created.id
+    print("✅ GenC skills are created or updated without their unique index")
+
+    role = models.DesignationEnum.PA
+    requirement = crud.create_role_skill_requirement(db, schemas.RoleSkillRequirementCreate(
+        role=role, skill_id=4, required_proficiency_level=Level.EXPERT, is_mandatory="Yes"
+    ))
+    requirements = db.query(models.RoleSkillRequirement).filter(
+        models.RoleSkillRequirement.role == role, models.RoleSkillRequirement.skill_id == 4
+    ).order_by(models.RoleSkillRequirement.id).all()
+    assert len(requirements) == 2 and requirement.id == requirements[0].id
+    assert requirements[0].required_proficiency_level == Level.EXPERT
+    added = crud.create_role_skill_requirement(db, schemas.RoleSkillRequirementCreate(
+        role=role, skill_id=20, required_proficiency_level=Level.BEGINNER, is_mandatory="No"
+    ))
+    assert db.get(models.RoleSkillRequirement, added.id).skill_id == 20
+    print("✅ Role requirements are created or updated without their unique index")
+    db.close()
+    engine.dispose()
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as scratch:
+        test_upsert_and_replace(scratch)
+        test_bad_upserts_write_nothing(scratch)
+        test_upserts_while_unique_index_is_blocked(scratch)
+        test_single_upserts_while_unique_indexes_are_blocked(scratch)
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the fast JSON list paths
+Checks that the GenC and feedback pages built from column tuples and encoded with orjson are
+byte-for-byte the JSON the response_model path produces from ORM objects, with and without
+skills, for offset and cursor pages (with the same next cursors), and that the async GenC list
+filters like the sync one.
+"""
+
+import sys
+import os
+import tempfile
+import asyncio
+from datetime import date
+from typing import List
+
+# Add the current directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from database import make_async_engine
+import models
+import crud
+import schemas
+import async_crud
+from benchmark_list_serialization import model_path, fast_path
+from test_cascade_deletes import seeded_session
+
+def seeded_database(path: str):
+    engine, db = seeded_session(path)
+    # Optional columns, non-ASCII text and characters JSON must escape
+    db.execute(update(models.GenC).where(models.GenC.id % 7 == 0).values(
+        date_of_allocation=date(2024, 2, 29), allocation_project='Projet "Été" ✓', team_name="Team\\Ω\n",
+        planned_billing_start_date=date(2024, 4, 1), actual_billing_start_date=date(2024, 4, 15)
+    ))
+    db.execute(update(models.GenCSkill).where(models.GenCSkill.genc_id % 3 == 0).values(
+        date_acquired=date(2023, 12, 31), notes="Niveau avancé <b> </b>"
+    ))
+    db.execute(update(models.GenCFeedback).where(models.GenCFeedback.id % 5 == 0).values(feedback="Très bien 👍 \"quoted\""))
+    db.commit()
+    return engine, db
+
+async def compare_pages(path: str):
+    engine = make_async_engine(f"sqlite:///{path}")
+    Session = async_sessionmaker(engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+    cases = [
+        ("gencs", List[schemas.GenC], True, async_crud.get_gencs, async_crud.get_genc_rows, {"skip": 35, "limit": 60}),
+        ("gencs with skills", List[schemas.GenC], False, async_crud.get_gencs, async_crud.get_genc_rows,
+         {"limit": 60, "include_skills": True}),
+        ("feedback", List[schemas.GenCFeedback], False, async_crud.get_genc_feedbacks, async_crud.get_genc_feedback_rows,
+         {"skip": 10, "limit": 80}),
+    ]
+    for label, response_model, slim, read, read_rows, arguments in cases:
+        async with Session() as db:
+            model_body = await model_path(response_model, lambda: read(db, **arguments), slim=slim)
+            fast_body = await fast_path(lambda: read_rows(db, **arguments))
+        assert model_body == fast_body, label
+
+        # Walk the cursor pages of both paths in step
+        arguments = {key: value for key, value in arguments.items() if key != "skip"}
+        cursor, pages = 0, 0
+        while cursor is not None:
+            async with Session() as db:
+                items, next_cursor = await read(db, after=cursor, **arguments)
+                rows, next_row_cursor = await read_rows(db, after=cursor, **arguments)
+                model_body = await model_path(response_model, lambda: read(db, after=cursor, **arguments), slim=slim)
+                fast_body = await fast_path(lambda: read_rows(db, after=cursor, **arguments))
+            assert next_cursor == next_row_cursor and [item.id for item in items] == [row["id"] for row in rows], label
+            assert model_body == fast_body, f"{label} after {cursor}"
+            cursor, pages = next_cursor, pages + 1
+        assert pages > 1, label
+    await engine.dispose()
+
+async def async_filtered_ids(path: str, filters: schemas.GenCFilters):
+    engine = make_async_engine(f"sqlite:///{path}")
+    Session = async_sessionmaker(engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+    async with Session() as db:
+        items, _ = await async_crud.get_gencs(db, limit=1000, filters=filters)
+        rows, _ = await async_crud.get_genc_rows(db, limit=1000, filters=filters)
+        count = await async_crud.count_gencs(db, filters)
+    await engine.dispose()
+    return [item.id for item in items], [row["id"] for row in rows], count
+
+def test_fast_json_matches_response_model(tmp_path):
+    path = os.path.join(tmp_path, "list_serialization.db")
+    engine, db = seeded_database(path)
+    db.close()
+    engine.dispose()
+    asyncio.run(compare_pages(path))
+    print("✅ Fast JSON pages are byte-identical to the response_model output, cursors included")
+
+def test_async_filters_match_sync(tmp_path):
+    path = os.path.join(tmp_path, "list_filters.db")
+    engine, db = seeded_database(path)
+    db.execute(update(models.GenC).where(models.GenC.id == 12).values(genc_name="Under_score 100% GenC"))
+    db.commit()
+    for filters in (
+        schemas.GenCFilters(),
+        schemas.GenCFilters(status=[models.StatusEnum.IDLE, models.StatusEnum.BILLING_STARTED]),
+        schemas.GenCFilters(account_id=3, designation=models.DesignationEnum.PA),
+        schemas.GenCFilters(billing_from=date(2024, 4, 10), search="GenC 4"),
+        schemas.GenCFilters(joined_to=date(2023, 12, 31)),
+        schemas.GenCFilters(search="%"),
+        schemas.GenCFilters(search="_score 100%")
+    ):
+        expected, _ = crud.get_gencs(db, limit=1000, filters=filters)
+        expected = [genc.id for genc in expected]
+        items, rows, count = asyncio.run(async_filtered_ids(path, filters))
+        assert items == rows == expected and count == len(expected), filters
+    assert [genc.id for genc in crud.get_gencs(db, filters=schemas.GenCFilters(search="%"))[0]] == [12]
+    assert crud.get_gencs(db, filters=schemas.GenCFilters(search="G_"))[0] == []
+    assert [genc.id for genc in crud.get_gencs(db, filters=schemas.GenCFilters(search=" _SCORE 100% "))[0]] == [12]
+    print("✅ Async GenC lists filter like the sync one; % and _ in the search match literally")
+    db.close()
+    engine.dispose()
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as scratch:
+        test_fast_json_matches_response_model(scratch)
+        test_async_filters_match_sync(scratch)
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Test script to verify partial (PATCH) updates
+Checks that a partial update writes only the fields sent, in a single UPDATE when the GenC
+status is left alone, that status changes are still validated and recorded, that null is
+refused for required fields, and that every entity's update accepts a partial body.
+"""
+
+import sys
+import os
+import tempfile
+from datetime import date
+
+# Add the current directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from pydantic import ValidationError
+from sqlalchemy import event
+
+import models
+import crud
+import schemas
+from test_cascade_deletes import seeded_session
+
+def captured_statements(engine, call):
+    """Run call() and return its result and the SQL statements it executed"""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement.lstrip().split()[0].upper())
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        result = call()
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    return result, statements
+
+def test_patch_genc(tmp_path):
+    engine, db = seeded_session(os.path.join(tmp_path, "patch_genc.db"))
+    before = schemas.GenCListItem.model_validate(db.get(models.GenC, 1)).model_dump(exclude={"account", "service_line_obj", "mentor"})
+    assert before["status"] == models.StatusEnum.IDLE
+    db.close()
+
+    patch = schemas.GenCPatch(planned_billing_start_date=date(2024, 6, 1))
+    genc, statements = captured_statements(engine, lambda: crud.update_genc(db, 1, patch))
+    assert statements == ["UPDATE"], statements
+    assert genc.planned_billing_start_date == date(2024, 6, 1)
+    assert {key: getattr(genc, key) for key in before if key != "planned_billing_start_date"} == \
+        {key: value for key, value in before.items() if key != "planned_billing_start_date"}
+    assert not crud.get_genc_status_history(db, 1)
+    print("✅ Setting a billing date is a single UPDATE that leaves the other fields alone")
+
+    genc = crud.update_genc(db, 1, schemas.GenCPatch(status=models.StatusEnum.UNDER_PROJECT_TRAINING))
+    assert genc.status == models.StatusEnum.UNDER_PROJECT_TRAINING
+    history = crud.get_genc_status_history(db, 1)
+    assert [(change.from_status, change.to_status) for change in history] == \
+        [(models.StatusEnum.IDLE, models.StatusEnum.UNDER_PROJECT_TRAINING)]
+    try:
+        crud.update_genc(db, 1, schemas.GenCPatch(status=models.StatusEnum.IDLE))
+        raise AssertionError("a disallowed status transition was applied")
+    except ValueError:
+        db.rollback()
+    assert db.get(models.GenC, 1).status == models.StatusEnum.UNDER_PROJECT_TRAINING
+    print("✅ Status changes are validated and recorded")
+
+    assert crud.update_genc(db, 999999, schemas.GenCPatch(team_name="Nobody")) is None
+    assert crud.update_genc(db, 999999, schemas.GenCPatch(status=models.StatusEnum.IDLE)) is None
+    assert crud.update_genc(db, 1, schemas.GenCPatch()).id == 1
+    try:
+        schemas.GenCPatch(genc_name=None)
+        raise AssertionError("null was accepted for a required field")
+    except ValidationError:
+        pass
+    assert crud.update_genc(db, 1, schemas.GenCPatch(team_name=None)).team_name is None
+    print("✅ Missing GenCs give None, empty patches change nothing, null only clears optional fields")
+    db.close()
+    engine.dispose()
+
+def test_patch_other_entities(tmp_path):
+    engine, db = seeded_session(os.path.join(tmp_path, "patch_entities.db"))
+    cases = [
+        (crud.update_account, models.Account, schemas.AccountPatch(epl_name="New EPL"), "epl_name"),
+        (crud.update_account_service_line, models.AccountServiceLine, schemas.AccountServiceLinePatch(sl_spoc="New SPOC"), "sl_spoc"),
+        (crud.update_mentor, models.Mentor, schemas.MentorPatch(mentor_name="Renamed"), "mentor_name"),
+        (crud.update_skill, models.Skill, schemas.SkillPatch(description="Described"), "description"),
+        (crud.update_role_skill_requirement, models.RoleSkillRequirement,
+         schemas.RoleSkillRequirementPatch(is_mandatory="No"), "is_mandatory"),
+        (crud.update_genc_feedback, models.GenCFeedback, schemas.GenCFeedbackPatch(feedback="Revised"), "feedback"),
+        (crud.update_genc_skill, models.GenCSkill, schemas.GenCSkillPatch(notes="Revised"), "notes"),
+    ]
+    for update, model, patch, field in cases:
+        columns = [column.name for column in model.__table__.c]
+        before = {name: getattr(db.get(model, 1), name) for name in columns}
+        db.close()
+        row = update(db, 1, patch)
+        after = {name: getattr(db.get(model, 1), name) for name in columns}
+        assert getattr(row, field) == after[field] == getattr(patch, field), model.__name__
+        assert {name: value for name, value in after.items() if name != field} == \
+            {name: value for name, value in before.items() if name != field}, model.__name__
+        assert update(db, 999999, patch) is None
+        db.close()
+    user = crud.create_application_user(db, schemas.ApplicationUserCreate(
+        user_assoc_id="U1", user_name="User", user_type=models.UserTypeEnum.PMO_MEMBER
+    ))
+    assert crud.update_application_user(db, user.id, schemas.ApplicationUserPatch(user_name="Renamed")).user_type == \
+        models.UserTypeEnum.PMO_MEMBER
+    for schema in (schemas.GenCSkillPatch, schemas.GenCSkillUpdate):
+        try:
+            schema(proficiency_level=None)
+            raise AssertionError(f"{schema.__name__} accepted null for a required field")
+        except ValidationError:
+            pass
+    assert crud.update_genc_skill(db, 1, schemas.GenCSkillPatch(date_acquired=None)).date_acquired is None
+    print("✅ Partial updates of every entity write only the fields sent")
+    db.close()
+    engine.dispose()
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as scratch:
+        test_patch_genc(scratch)
+        test_patch_other_entities(scratch)
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Test script to verify that the hot CRUD lookups use indexes
+Runs each crud function against a scratch SQLite database, captures the SQL it emits and
+checks EXPLAIN QUERY PLAN for the expected index. Also checks that migrations.upgrade()
+adds the indexes to a database created before they existed, deleting duplicates that block a
+unique index only when asked to.
+"""
+
+import sys
+import os
+import tempfile
+from datetime import date
+
+# Add the current directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import event, inspect, insert, text
+from sqlalchemy.orm import sessionmaker
+
+from database import make_engine
+import models
+import crud
+import schemas
+import migrations
+import search_index
+
+# Indexes introduced for the lookups checked below
+ADDED_INDEXES = [
+    "ix_account_service_lines_account_id_service_line",
+    "ix_gencs_account_id",
+    "ix_gencs_service_line_id",
+    "ix_gencs_mentor_id",
+    "ix_gencs_status",
+    "ix_gencs_current_designation",
+    "ix_gencs_date_of_joining",
+    "ix_gencs_actual_billing_start_date",
+    "uq_genc_skills_genc_id_skill_id",
+    "ix_genc_skills_skill_id",
+    "uq_role_skill_requirements_role_skill_id",
+    "ix_role_skill_requirements_skill_id",
+    "ix_genc_feedbacks_genc_id",
+    "ix_genc_feedbacks_mentor_id",
+]
+
+def captured_selects(engine, call):
+    """Run call() and return the (statement, parameters) of every SELECT it executed"""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        call()
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+    return statements
+
+def query_plan(engine, statement, parameters) -> str:
+    with engine.connect() as conn:
+        return "\n".join(row[3] for row in conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters))
+
+def assert_uses_index(engine, label: str, call, table: str, index_name: str):
+    """The first SELECT from table emitted by call() must search it through index_name"""
+    for statement, parameters in captured_selects(engine, call):
+        if f"FROM {table}" not in statement:
+            continue
+        plan = query_plan(engine, statement, parameters)
+        assert f"SCAN {table}" not in plan, f"{label}: full scan of {table}\n{plan}"
+        assert f"INDEX {index_name}" in plan, f"{label}: expected {index_name}\n{plan}"
+        print(f"✅ {label}: {index_name}")
+        return
+    raise AssertionError(f"{label}: no SELECT from {table} was executed")
+
+def seed(db):
+    db.execute(insert(models.Account), [{"account_name": f"Account {i}", "epl_name": "EPL", "edp_name": "EDP"} for i in range(50)])
+    db.execute(insert(models.AccountServiceLine), [{
+        "account_id": i % 50 + 1, "service_line": f"SL {i}", "edl_name": "EDL", "pdl_name": "PDL", "sl_spoc": "SPOC"
+    } for i in range(100)])
+    db.execute(insert(models.Mentor), [{
+        "associate_id": f"M{i}", "mentor_name": "Mentor", "designation": models.MentorDesignationEnum.M, "service_line": "SL"
+    } for i in range(20)])
+    db.execute(insert(models.Skill), [{"skill_name": f"Skill {i}", "category": "Technical"} for i in range(30)])
+    db.execute(insert(models.GenC), [{
+        "associate_id": f"G{i}", "genc_name": f"GenC {i}", "account_id": i % 50 + 1, "service_line_id": i % 100 + 1,
+        "mentor_id": i % 20 + 1, "status": list(models.StatusEnum)[i % len(models.StatusEnum)],
+        "date_of_joining": date(2024, 1, 1), "location": models.LocationEnum.PUNE,
+        "current_designation": list(models.DesignationEnum)[i % len(models.DesignationEnum)]
+    } for i in range(500)])
+    db.execute(insert(models.GenCSkill), [{
+        "genc_id": genc_id, "skill_id": skill_id, "proficiency_level": models.ProficiencyLevelEnum.BEGINNER
+    } for genc_id in range(1, 501) for skill_id in range(1, 6)])
+    db.execute(insert(models.GenCFeedback), [{
+        "genc_id": i % 500 + 1, "mentor_id": i % 20 + 1, "date_of_feedback": date(2024, 2, 1), "feedback": "Good progress"
+    } for i in range(1000)])
+    db.execute(insert(models.RoleSkillRequirement), [{
+        "role": role, "skill_id": skill_id, "required_proficiency_level": models.ProficiencyLevelEnum.INTERMEDIATE
+    } for role in models.DesignationEnum for skill_id in range(1, 11)])
+    db.commit()
+    # Give the planner real statistics, as a long-running database would have
+    db.connection().exec_driver_sql("ANALYZE")
+    db.commit()
+
+def test_index_usage(tmp_path):
+    engine = make_engine(f"sqlite:///{os.path.join(tmp_path, 'plans.db')}")
+    models.Base.metadata.create_all(bind=engine)
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    seed(db)
+
+    assert_uses_index(engine, "get_skills_by_genc", lambda: crud.get_skills_by_genc(db, 7),
+                      "genc_skills", "uq_genc_skills_genc_id_skill_id")
+    assert_uses_index(engine, "get_gencs_by_skill", lambda: crud.get_gencs_by_skill(db, 3),
+                      "genc_skills", "ix_genc_skills_skill_id")
+    assert_uses_index(engine, "create_genc_skill duplicate check", lambda: crud.create_genc_skill(db, schemas.GenCSkillCreate(
+        genc_id=7, skill_id=2, proficiency_level=models.ProficiencyLevelEnum.EXPERT
+    )), "genc_skills", "uq_genc_skills_genc_id_skill_id")
+    assert_uses_index(engine, "get_feedbacks_by_genc", lambda: crud.get_feedbacks_by_genc(db, 7),
+                      "genc_feedbacks", "ix_genc_feedbacks_genc_id")
+    assert_uses_index(engine, "get_service_lines_by_account", lambda: crud.get_service_lines_by_account(db, 4),
+                      "account_service_lines", "ix_account_service_lines_account_id_service_line")
+    assert_uses_index(engine, "get_requirements_by_role", lambda: crud.get_requirements_by_role(db, models.DesignationEnum.PA),
+                      "role_skill_requirements", "uq_role_skill_requirements_role_skill_id")
+    assert_uses_index(engine, "create_role_skill_requirement duplicate check", lambda: crud.create_role_skill_requirement(
+        db, schemas.RoleSkillRequirementCreate(role=models.DesignationEnum.A, skill_id=4,
+                                               required_proficiency_level=models.ProficiencyLevelEnum.EXPERT)
+    ), "role_skill_requirements", "uq_role_skill_requirements_role_skill_id")
+    assert_uses_index(engine, "GenCs by mentor", lambda: db.query(models.GenC).filter(models.GenC.mentor_id == 3).all(),
+                      "gencs", "ix_gencs_mentor_id")
+    assert_uses_index(engine, "GenCs by account", lambda: db.query(models.GenC).filter(models.GenC.account_id == 3).all(),
+                      "gencs", "ix_gencs_account_id")
+    assert_uses_index(engine, "GenCs by status", lambda: db.query(models.GenC).filter(
+        models.GenC.status == models.StatusEnum.BILLING_STARTED
+    ).all(), "gencs", "ix_gencs_status")
+    assert_uses_index(engine, "GenC list filtered by status and mentor", lambda: crud.get_gencs(db, filters=schemas.GenCFilters(
+        status=[models.StatusEnum.IDLE, models.StatusEnum.BILLING_STARTED], mentor_id=3
+    )), "gencs", "ix_gencs_mentor_id")
+    db.close()
+    engine.dispose()
+
+def test_migration_adds_indexes(tmp_path):
+    engine = make_engine(f"sqlite:///{os.path.join(tmp_path, 'legacy.db')}")
+    models.Base.metadata.create_all(bind=engine)
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    seed(db)
+
+    # Recreate the pre-index schema: drop the new indexes, then add a duplicate GenC/skill pair
+    for index_name in ADDED_INDEXES:
+        db.connection().exec_driver_sql(f"DROP INDEX {index_name}")
+    duplicate = db.execute(insert(models.GenCSkill).returning(models.GenCSkill.id), [{
+        "genc_id": 1, "skill_id": 1, "proficiency_level": models.ProficiencyLevelEnum.EXPERT, "notes": "Duplicate pair"
+    }]).scalar_one()
+    search_index.rebuild(db)
+    db.commit()
+    db.close()
+
+    # Without the opt-in the duplicate is kept and only its unique index is left out
+    migrations.upgrade(engine, remove_invalid_rows=False)
+    assert [index.name for index in migrations._missing_indexes(engine)] == ["uq_genc_skills_genc_id_skill_id"]
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    assert db.get(models.GenCSkill, duplicate) is not None
+    db.close()
+
+    migrations.upgrade(engine, remove_invalid_rows=True)
+
+    inspector = inspect(engine)
+    for table in models.Base.metadata.sorted_tables:
+        existing = {index["name"] for index in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            assert index.name in existing, f"{index.name} missing after upgrade"
+    db = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    pairs = db.query(models.GenCSkill).filter(models.GenCSkill.genc_id == 1, models.GenCSkill.skill_id == 1).all()
+    assert len(pairs) == 1 and pairs[0].proficiency_level == models.ProficiencyLevelEnum.BEGINNER, "oldest duplicate should be kept"
+    assert not db.execute(text(f"SELECT count(*) FROM {search_index.TABLE_NAME} WHERE source_id = :id AND kind = :kind"),
+                          {"id": duplicate, "kind": search_index.SKILL_NOTE}).scalar(), "the duplicate is still indexed"
+    db.close()
+
+    # Running it again is a no-op
+    assert not migrations._missing_indexes(engine)
+    migrations.upgrade(engine)
+    engine.dispose()
+    print("✅ migrations.upgrade() adds the indexes to an existing database")
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as scratch:
+        test_index_usage(scratch)
+        test_migration_adds_indexes(scratch)
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the response cache
+Checks the LRU, TTL and tag invalidation of ResponseCache, that a response built while its
+tag was invalidated is not stored, and drives ResponseCacheMiddleware over a small ASGI app
+reading mentors through crud: misses then hits, 304s for a matching If-None-Match, errors
+and other methods passed through, and a new body and ETag served after a crud write.
+"""
+
+import sys
+import os
+import tempfile
+import asyncio
+import re
+import time
+
+# Add the current directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import crud
+import schemas
+import response_cache
+from test_cascade_deletes import seeded_session
+
+HEADERS = [(b"content-type", b"application/json")]
+
+def test_cache_entries(tmp_path):
+    cache = response_cache.ResponseCache(max_entries=2, ttl_seconds=300)
+    for key in ("a", "b"):
+        cache.put((key,), ("tag",), cache.generation(("tag",)), HEADERS, key.encode())
+    assert cache.get(("a",)).body == b"a"
+    cache.put(("c",), ("other",), cache.generation(("other",)), HEADERS, b"c")
+    assert cache.get(("b",)) is None and cache.get(("a",)) and cache.get(("c",))
+    assert cache.stats()["evictions"] == 1
+    print("✅ The least recently used entry is evicted first")
+
+    cache.invalidate("tag")
+    assert cache.get(("a",)) is None and cache.get(("c",)).body == b"c"
+    generation = cache.generation(("tag",))
+    cache.invalidate("tag")
+    built = cache.put(("a",), ("tag",), generation, HEADERS, b"stale")
+    assert built.body == b"stale" and cache.get(("a",)) is None
+    print("✅ Invalidation drops tagged entries and discards responses built across it")
+
+    short = response_cache.ResponseCache(ttl_seconds=0.05)
+    entry = short.put(("a",), ("tag",), short.generation(("tag",)), HEADERS + [(b"etag", b'"old"')], b"body")
+    assert short.get(("a",)) is entry
+    assert [value for name, value in entry.headers if name == b"etag"] == [entry.etag.encode()]
+    time.sleep(0.1)
+    assert short.get(("a",)) is None and short.stats()["evictions"] == 1
+    print("✅ Entries expire after the TTL")
+
+    assert response_cache.matches_etag(b'W/"x", "y"', '"x"') and response_cache.matches_etag("*", '"x"')
+    assert not response_cache.matches_etag(None, '"x"') and not response_cache.matches_etag('"y"', '"x"')
+    print("✅ If-None-Match uses weak comparison")
+
+class MentorApp:
+    """Minimal ASGI app serving /mentors/{id} from a session, counting the requests it builds"""
+
+    def __init__(self, db):
+        self.db = db
+        self.calls = 0
+
+    async def __call__(self, scope, receive, send):
+        self.calls += 1
+        mentor_id = int(re.match(r"^/mentors/(\d+)$", scope["path"]).group(1))
+        mentor = crud.get_mentor(self.db, mentor_id)
+        if mentor is None:
+            status, body = 404, b'{"detail":"Mentor not found"}'
+        else:
+            status, body = 200, schemas.Mentor.model_validate(mentor).model_dump_json().encode()
+        await send({"type": "http.response.start", "status": status, "headers": HEADERS})
+        await send({"type": "http.response.body", "body": body})
+
+def request(app, path: str, method: str = "GET", headers=(), query: bytes = b"") -> dict:
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {"type": "http", "method": method, "path": path, "query_string": query, "headers": list(headers)}
+    asyncio.run(app(scope, receive, send))
+    start_headers = dict(sent[0]["headers"])
+    return {"status": sent[0]["status"], "etag": start_headers.get(b"etag"),
+            "body": b"".join(message.get("body", b"") for message in sent[1:])}
+
+def test_middleware_serves_and_revalidates(tmp_path):
+    engine, db = seeded_session(os.path.join(tmp_path, "response_cache.db"))
+    inner = MentorApp(db)
+    # crud invalidates the process-wide cache, so the middleware must use it
+    app = response_cache.ResponseCacheMiddleware(inner)
+    cache = response_cache.cache
+    response_cache.invalidate(response_cache.MENTORS)
+    before = cache.stats()
+
+    first = request(app, "/mentors/3", query=b"b=2&a=1")
+    second = request(app, "/mentors/3", query=b"a=1&b=2")
+    assert first["status"] == second["status"] == 200 and first["body"] == second["body"]
+    assert b'"associate_id":"M2"' in first["body"]
+    assert first["etag"] == second["etag"] and inner.calls == 1
+    print("✅ A repeated GET is served from the cache, whatever the parameter order")
+
+    revalidated = request(app, "/mentors/3", headers=[(b"if-none-match", first["etag"])], query=b"a=1&b=2")
+    assert revalidated["status"] == 304 and revalidated["body"] == b"" and revalidated["etag"] == first["etag"]
+    stats = cache.stats()
+    assert stats["hits"] - before["hits"] == 2 and stats["misses"] - before["misses"] == 1
+    assert stats["not_modified"] - before["not_modified"] == 1
+    print("✅ A matching If-None-Match gets a 304 and is counted")
+
+    for _ in range(2):
+        assert request(app, "/mentors/999999")["status"] == 404
+    assert request(app, "/mentors/3", method="HEAD")["status"] == 200
+    assert inner.calls == 4
+    crud.update_mentor(db, 3, schemas.MentorPatch(mentor_name="Renamed Mentor"))
+    changed = request(app, "/mentors/3", headers=[(b"if-none-match", first["etag"])], query=b"a=1&b=2")
+    assert changed["status"] == 200 and b'"mentor_name":"Renamed Mentor"' in changed["body"]
+    assert changed["etag"] != first["etag"] and inner.calls == 5
+    print("✅ Errors and other methods are not cached, and a crud write serves a new body and ETag")
+    db.close()
+    engine.dispose()
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as scratch:
+        test_cache_entries(scratch)
+        test_middleware_serves_and_revalidates(scratch)
@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+Test script to verify role-fit candidate ranking
+Scores varied skill data against each role and compares rank_candidates() with a plain Python
+ranking over the ORM rows: the same candidates in the same order with the same scores and
+gaps, under each filter and all_mandatory, and a fresh ranking after skills are written.
+"""
+
+import sys
+import os
+import tempfile
+import random
+
+# Add the current directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import insert
+
+import models
+import crud
+import schemas
+import role_fit
+from test_cascade_deletes import seeded_session
+
+LEVELS = list(models.ProficiencyLevelEnum)
+
+def seeded_skills(path: str):
+    engine, db = seeded_session(path)
+    generator = random.Random(7)
+    for genc_skill in db.query(models.GenCSkill):
+        genc_skill.proficiency_level = generator.choice(LEVELS)
+    db.execute(insert(models.GenCSkill), [
+        {"genc_id": genc_id, "skill_id": skill_id, "proficiency_level": generator.choice(LEVELS)}
+        for genc_id in range(1, 501) for skill_id in range(6, 13) if generator.random() < 0.3
+    ])
+    for requirement in db.query(models.RoleSkillRequirement):
+        requirement.required_proficiency_level = LEVELS[requirement.skill_id % len(LEVELS)]
+        requirement.is_mandatory = "Yes" if requirement.skill_id % 3 == 0 else "No"
+    db.commit()
+    role_fit.invalidate()
+    return engine, db
+
+def reference_ranking(db, role, limit, status=None, account_id=None, location=None, designation=None, all_mandatory=False):
+    requirements = db.query(models.RoleSkillRequirement).filter(
+        models.RoleSkillRequirement.role == role
+    ).order_by(models.RoleSkillRequirement.skill_id).all()
+    ranked = []
+    for genc in db.query(models.GenC):
+        if ((status and genc.status not in status) or (account_id is not None and genc.account_id != account_id)
+                or (location is not None and genc.location != location)
+                or (designation is not None and genc.current_designation != designation)):
+            continue
+        held = {genc_skill.skill_id: role_fit.PROFICIENCY_ORDER[genc_skill.proficiency_level] for genc_skill in genc.skills}
+        gaps, weighted, mandatory_met = [], 0, 0
+        for requirement in requirements:
+            deficit = max(role_fit.PROFICIENCY_ORDER[requirement.required_proficiency_level] - held.get(requirement.skill_id, 0), 0)
+            mandatory = requirement.is_mandatory == "Yes"
+            weighted += deficit * (role_fit.MANDATORY_WEIGHT if mandatory else 1)
+            if deficit:
+                gaps.append((requirement.skill_id, deficit))
+            elif mandatory:
+                mandatory_met += 1
+        ranked.append((genc.id, mandatory_met, weighted, gaps))
+    mandatory_total = sum(requirement.is_mandatory == "Yes" for requirement in requirements)
+    if all_mandatory:
+        ranked = [row for row in ranked if row[1] == mandatory_total]
+    ranked.sort(key=lambda row: (-row[1], row[2], row[0]))
+    return len(ranked), ranked[:limit]
+
+def assert_matches_reference(db, role, limit=15, **filters):
+    result = crud.rank_role_candidates(db, role, limit=limit, **filters)
+    considered, expected = reference_ranking(db, role, limit, **filters)
+    max_deficit = sum(
+        role_fit.PROFICIENCY_ORDER[requirement.required_proficiency_level]
+        * (role_fit.MANDATORY_WEIGHT if requirement.is_mandatory == "Yes" else 1)
+        for requirement in db.query(models.RoleSkillRequirement).filter(models.RoleSkillRequirement.role == role)
+    )
+    assert result["candidates_considered"] == considered, (role, filters)
+    actual = [
+        (candidate["genc_id"], candidate["mandatory_met"], candidate["weighted_deficit"],
+         [(gap["skill_id"], gap["deficit"]) for gap in candidate["gaps"]])
+        for candidate in result["candidates"]
+    ]
+    assert actual == expected, (role, filters)
+    for candidate in result["candidates"]:
+        assert abs(candidate["score"] - (1 - candidate["weighted_deficit"] / max_deficit)) < 1e-9
+        assert candidate["requirements_met"] == result["requirements_count"] - len(candidate["gaps"])
+    return result
+
+def test_ranking_matches_reference(tmp_path):
+    engine, db = seeded_skills(os.path.join(tmp_path, "role_fit.db"))
+    for role in models.DesignationEnum:
+        result = assert_matches_reference(db, role)
+        assert result["requirements_count"] == 10 and result["mandatory_count"] == 3
+        assert len({candidate["weighted_deficit"] for candidate in result["candidates"]}) > 1
+    print("✅ Rankings match a plain Python ranking for every role")
+
+    role = models.DesignationEnum.PA
+    for filters in ({"status": [models.StatusEnum.IDLE, models.StatusEnum.BILLING_STARTED]},
+                    {"account_id": 4}, {"location": list(models.LocationEnum)[0]},
+                    {"designation": models.DesignationEnum.A}, {"all_mandatory": True},
+                    {"status": [models.StatusEnum.IDLE], "all_mandatory": True}):
+        assert_matches_reference(db, role, **filters)
+    assert_matches_reference(db, role, limit=1000)
+    assert crud.rank_role_candidates(db, role, account_id=999999)["candidates"] == []
+    print("✅ Filters, all_mandatory and large limits match too")
+    db.close()
+    engine.dispose()
+
+def test_ranking_follows_skill_writes(tmp_path):
+    engine, db = seeded_skills(os.path.join(tmp_path, "role_fit_writes.db"))
+    role = models.DesignationEnum.PAT
+    last = crud.rank_role_candidates(db, role, limit=500)["candidates"][-1]["genc_id"]
+    crud.replace_genc_skills(db, last, [
+        schemas.GenCSkillAssignment(skill_id=skill_id, proficiency_level=models.ProficiencyLevelEnum.EXPERT)
+        for skill_id in range(1, 11)
+    ])
+    best = assert_matches_reference(db, role)["candidates"][0]
+    assert best["genc_id"] == last and best["score"] == 1.0 and best["gaps"] == []
+    print("✅ A skill write is reflected in the next ranking")
+    db.close()
+    engine.dispose()
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as scratch:
+        test_ranking_matches_reference(scratch)
+        test_ranking_follows_skill_writes(scratch)
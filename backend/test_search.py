@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Test script to verify full-text search over feedback and skill notes
+Checks that crud keeps the FTS5 index in step with feedback and GenC skill writes, that
+matching is by word with the last word as a prefix, that user input is taken literally, that
+snippets are HTML-escaped with matches wrapped in <mark> tags, and that kind filters and
+paging work.
+"""
+
+import sys
+import os
+import tempfile
+from datetime import date
+
+# Add the current directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import models
+import crud
+import schemas
+import search_index
+from test_cascade_deletes import seeded_session
+
+def feedback(genc_id: int, text: str) -> schemas.GenCFeedbackCreate:
+    return schemas.GenCFeedbackCreate(genc_id=genc_id, mentor_id=1, date_of_feedback=date(2024, 3, 1), feedback=text)
+
+def test_search_follows_writes(tmp_path):
+    engine, db = seeded_session(os.path.join(tmp_path, "search.db"))
+    search_index.rebuild(db)
+    db.commit()
+
+    results, total = crud.search_feedback(db, "good progress")
+    assert total == 1000 and len(results) == 20
+    assert {result["kind"] for result in results} == {search_index.FEEDBACK}
+    page, _ = crud.search_feedback(db, "good progress", skip=20, limit=20)
+    assert not {result["source_id"] for result in results} & {result["source_id"] for result in page}
+    print("✅ Rebuilt index finds the seeded feedback, paged")
+
+    created = crud.create_genc_feedback(db, feedback(7, 'Handled the <script>alert("x")</script> review excellently'))
+    results, total = crud.search_feedback(db, "excel")
+    assert total == 1 and results[0]["source_id"] == created.id and results[0]["genc_id"] == 7
+    assert results[0]["associate_id"] == "G6" and results[0]["genc_name"] == "GenC 6"
+    snippet = results[0]["snippet"]
+    assert "<mark>excellently</mark>" in snippet, snippet
+    assert "<script>" not in snippet and "&lt;script&gt;" in snippet, snippet
+    print("✅ New feedback is indexed; the last word matches as a prefix and snippets are escaped")
+
+    crud.update_genc_feedback(db, created.id, schemas.GenCFeedbackPatch(feedback="Needs more practice"))
+    assert crud.search_feedback(db, "excel")[1] == 0
+    assert crud.search_feedback(db, "practice")[0][0]["source_id"] == created.id
+    crud.delete_genc_feedback(db, created.id)
+    assert crud.search_feedback(db, "practice")[1] == 0
+    print("✅ Updated and deleted feedback leave the index")
+
+    genc_skill = crud.create_genc_skill(db, schemas.GenCSkillCreate(
+        genc_id=9, skill_id=20, proficiency_level=models.ProficiencyLevelEnum.ADVANCED, notes="Kubernetes certification"
+    ))
+    results, total = crud.search_feedback(db, "kubernetes", kind=search_index.SKILL_NOTE)
+    assert total == 1 and results[0]["source_id"] == genc_skill.id and results[0]["kind"] == search_index.SKILL_NOTE
+    assert crud.search_feedback(db, "kubernetes", kind=search_index.FEEDBACK)[1] == 0
+    crud.update_genc_skill(db, genc_skill.id, schemas.GenCSkillPatch(notes=None))
+    assert crud.search_feedback(db, "kubernetes")[1] == 0
+    print("✅ Skill notes are indexed under their own kind and removed when cleared")
+    db.close()
+    engine.dispose()
+
+def test_search_input_is_literal(tmp_path):
+    engine, db = seeded_session(os.path.join(tmp_path, "search_input.db"))
+    crud.create_genc_feedback(db, feedback(3, "Strong NEAR-term delivery, not great at estimates"))
+
+    # FTS5 operators and punctuation in the query are searched as words
+    assert crud.search_feedback(db, 'NEAR "delivery')[1] == 1
+    assert crud.search_feedback(db, "not great*")[1] == 1
+    assert crud.search_feedback(db, "great OR missing")[1] == 0
+    for query in ("", "  ", "***"):
+        try:
+            crud.search_feedback(db, query)
+            raise AssertionError(f"query {query!r} was accepted")
+        except ValueError:
+            pass
+    try:
+        crud.search_feedback(db, "delivery", kind="everything")
+        raise AssertionError("an unknown kind was accepted")
+    except ValueError:
+        pass
+    print("✅ Query text is taken literally; empty queries and unknown kinds are refused")
+    db.close()
+    engine.dispose()
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as scratch:
+        test_search_follows_writes(scratch)
+        test_search_input_is_literal(scratch)
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Test script to verify keyset paging over the precomputed skill matrix
+Walks every sort key, ascending and descending, a few rows at a time and checks that the
+pages join up into exactly the single-page result, in (sort value, GenC id) order, with no
+row repeated or skipped; that filters combine with cursors; and that bad sort keys and
+cursors are refused.
+"""
+
+import sys
+import os
+import tempfile
+
+# Add the current directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import update
+
+import models
+import crud
+import schemas
+import skill_matrix
+from test_cascade_deletes import seeded_session
+
+def seeded_matrix(path: str):
+    engine, db = seeded_session(path)
+    # Vary the gap counts so the gap sorts have runs of ties to page through
+    db.execute(update(models.GenCSkill).where((models.GenCSkill.genc_id + models.GenCSkill.skill_id) % 4 == 0).values(
+        proficiency_level=models.ProficiencyLevelEnum.EXPERT
+    ))
+    db.commit()
+    skill_matrix.fill_missing(db)
+    return engine, db
+
+def all_pages(db, limit: int, **filters) -> list:
+    entries, cursor, pages = [], None, 0
+    while True:
+        page, cursor = crud.get_skill_matrix(db, after=cursor, limit=limit, **filters)
+        assert len(page) <= limit
+        entries.extend(page)
+        pages += 1
+        if cursor is None:
+            return entries
+        assert pages <= 1000, "paging did not terminate"
+
+def expected_order(db, sort: str) -> list:
+    rows = db.query(models.GenC.id, models.GenC.associate_id, skill_matrix.SORT_COLUMNS[sort.lstrip("-")]).join(
+        models.GenCSkillMatrixEntry, models.GenCSkillMatrixEntry.genc_id == models.GenC.id
+    ).all()
+    rows.sort(key=lambda row: (row[2], row.id), reverse=sort.startswith("-"))
+    return [row.associate_id for row in rows]
+
+def test_keyset_pages_join_up(tmp_path):
+    engine, db = seeded_matrix(os.path.join(tmp_path, "matrix_pages.db"))
+    gap_counts = {count for (count,) in db.query(models.GenCSkillMatrixEntry.skill_gaps_count)}
+    assert len(gap_counts) > 1
+
+    for key in skill_matrix.SORT_COLUMNS:
+        for sort in (key, f"-{key}"):
+            single, cursor = crud.get_skill_matrix(db, sort=sort, limit=1000)
+            assert cursor is None and len(single) == 500
+            paged = all_pages(db, limit=37, sort=sort)
+            associate_ids = [entry["associate_id"] for entry in paged]
+            assert paged == single, sort
+            assert len(set(associate_ids)) == len(associate_ids) == 500, sort
+            assert associate_ids == expected_order(db, sort), sort
+    print("✅ Pages of every sort, both directions, join up into the full ordered result")
+
+    filters = {"designation": models.DesignationEnum.PA, "only_with_gaps": True, "search": "G1"}
+    single, _ = crud.get_skill_matrix(db, sort="-skill_gaps_count", limit=1000, **filters)
+    assert single and all(entry["current_designation"] == models.DesignationEnum.PA.value for entry in single)
+    assert all("G1" in entry["associate_id"] and entry["skill_gaps_count"] > 0 for entry in single)
+    assert all_pages(db, limit=3, sort="-skill_gaps_count", **filters) == single
+    assert crud.get_skill_matrix(db, search="%")[0] == [] and crud.get_skill_matrix(db, search="G_")[0] == []
+    print("✅ Filters hold across cursor pages; search text matches literally")
+
+    page, cursor = crud.get_skill_matrix(db, sort="genc_name", limit=500)
+    assert len(page) == 500 and cursor is None
+    page, cursor = crud.get_skill_matrix(db, sort="genc_name", limit=499)
+    assert crud.get_skill_matrix(db, sort="genc_name", after=cursor, limit=10) == (
+        [crud.get_skill_matrix(db, sort="genc_name", limit=500)[0][-1]], None
+    )
+    print("✅ The last page carries no cursor")
+    db.close()
+    engine.dispose()
+
+def test_matrix_follows_writes_and_refuses_bad_input(tmp_path):
+    engine, db = seeded_matrix(os.path.join(tmp_path, "matrix_writes.db"))
+    genc = db.get(models.GenC, 11)
+    before = next(entry for entry in crud.get_skill_matrix(db, limit=1000)[0] if entry["associate_id"] == genc.associate_id)
+    crud.create_genc_skill(db, schemas.GenCSkillCreate(
+        genc_id=11, skill_id=25, proficiency_level=models.ProficiencyLevelEnum.ADVANCED, notes="Picked up on the job"
+    ))
+    after = next(entry for entry in crud.get_skill_matrix(db, limit=1000)[0] if entry["associate_id"] == genc.associate_id)
+    assert len(after["skills"]) == len(before["skills"]) + 1
+    assert after["skills"][-1]["notes"] == "Picked up on the job"
+    print("✅ Skill writes refresh the stored row")
+
+    for bad in ({"sort": "mentor"}, {"sort": "--id"}, {"after": "not-a-cursor"},
+                {"after": skill_matrix.encode_cursor(1, 2)[:-4]}):
+        try:
+            crud.get_skill_matrix(db, **bad)
+            raise AssertionError(f"{bad} was accepted")
+        except ValueError:
+            pass
+    print("✅ Unknown sort keys and malformed cursors are refused")
+    db.close()
+    engine.dispose()
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as scratch:
+        test_keyset_pages_join_up(scratch)
+        test_matrix_follows_writes_and_refuses_bad_input(scratch)
@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+Test script to verify the status history analytics
+Records a known history for a few GenCs and checks the time-in-status durations and buckets
+(with and without the current stay), the funnel's reached counts, conversion rates and exits,
+and the joining-month cohorts' cumulative reach of a target status.
+"""
+
+import sys
+import os
+import tempfile
+from datetime import date, datetime
+
+# Add the current directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import update
+
+import models
+import crud
+import status_history
+from test_cascade_deletes import seeded_session
+
+Status = models.StatusEnum
+
+# genc_id -> [(from_status, to_status, changed_at)]; every GenC joined on 2023-06-15
+HISTORIES = {
+    1: [(None, Status.IDLE, datetime(2023, 6, 15)),
+        (Status.IDLE, Status.UNDER_PROJECT_TRAINING, datetime(2023, 6, 20)),
+        (Status.UNDER_PROJECT_TRAINING, Status.CUSTOMER_ONBOARDED, datetime(2023, 7, 20)),
+        (Status.CUSTOMER_ONBOARDED, Status.BILLING_PLANNED, datetime(2023, 9, 18)),
+        (Status.BILLING_PLANNED, Status.BILLING_STARTED, datetime(2024, 1, 15))],
+    2: [(None, Status.IDLE, datetime(2023, 6, 15)),
+        (Status.IDLE, Status.UNDER_PROJECT_TRAINING, datetime(2023, 6, 25)),
+        (Status.UNDER_PROJECT_TRAINING, Status.FEEDBACK_NOT_GOOD, datetime(2023, 10, 3))],
+    3: [(None, Status.IDLE, datetime(2023, 6, 15)),
+        (Status.IDLE, Status.RELEASED_RESIGNED, datetime(2024, 6, 15))],
+    4: [(None, Status.IDLE, datetime(2023, 6, 15))]
+}
+
+def seeded_history(path: str):
+    engine, db = seeded_session(path)
+    db.execute(update(models.GenC).where(models.GenC.id.in_(HISTORIES)).values(date_of_joining=date(2023, 6, 15)))
+    for genc_id, changes in HISTORIES.items():
+        for from_status, to_status, changed_at in changes:
+            status_history.record(db, [(genc_id, from_status, to_status)], changed_at=changed_at)
+    db.commit()
+    return engine, db
+
+def test_time_in_status(tmp_path):
+    engine, db = seeded_history(os.path.join(tmp_path, "time_in_status.db"))
+    by_status = {row["status"]: row for row in status_history.time_in_status(db)}
+    assert list(by_status) == list(Status)
+
+    idle = by_status[Status.IDLE]
+    assert idle["count"] == 3 and idle["min_days"] == 5 and idle["max_days"] == 366
+    assert abs(idle["avg_days"] - (5 + 10 + 366) / 3) < 1e-6
+    assert idle["buckets"] == {"0-7": 1, "7-30": 1, "30-90": 0, "90-180": 0, "180+": 1}
+    training = by_status[Status.UNDER_PROJECT_TRAINING]
+    assert training["count"] == 2 and training["buckets"] == {"0-7": 0, "7-30": 0, "30-90": 1, "90-180": 1, "180+": 0}
+    assert by_status[Status.CUSTOMER_ONBOARDED]["max_days"] == 60
+    assert by_status[Status.BILLING_PLANNED]["buckets"]["90-180"] == 1
+    started = by_status[Status.BILLING_STARTED]
+    assert started["count"] == 0 and started["avg_days"] is None and sum(started["buckets"].values()) == 0
+    print("✅ Finished stays are measured and bucketed per status")
+
+    current = {row["status"]: row for row in status_history.time_in_status(db, include_current=True)}
+    assert current[Status.IDLE]["count"] == 4 and current[Status.IDLE]["buckets"]["180+"] == 2
+    for status in (Status.BILLING_STARTED, Status.FEEDBACK_NOT_GOOD, Status.RELEASED_RESIGNED):
+        assert current[status]["count"] == 1 and current[status]["buckets"]["180+"] == 1
+    print("✅ include_current counts the time so far in the current status")
+    db.close()
+    engine.dispose()
+
+def test_funnel_and_cohorts(tmp_path):
+    engine, db = seeded_history(os.path.join(tmp_path, "funnel.db"))
+    funnel = status_history.funnel(db)
+    stages = {stage["status"]: stage for stage in funnel["stages"]}
+    assert [stage["status"] for stage in funnel["stages"]] == status_history.FUNNEL_STAGES
+    assert [stage["reached"] for stage in funnel["stages"]] == [4, 2, 1, 1, 1, 0]
+    assert stages[Status.IDLE]["conversion_from_previous"] is None
+    assert stages[Status.UNDER_PROJECT_TRAINING]["conversion_from_previous"] == 0.5
+    assert stages[Status.BILLING_STARTED]["conversion_from_previous"] == 1.0
+    assert stages[Status.BILLING_STARTED]["conversion_from_start"] == 0.25
+    assert stages[Status.GENC_REGULARIZED]["conversion_from_previous"] == 0.0
+    assert funnel["exits"] == {Status.FEEDBACK_NOT_GOOD: 1, Status.RELEASED_RESIGNED: 1}
+    print("✅ Funnel counts the furthest stage reached and exits")
+
+    cohorts = {cohort["cohort"]: cohort for cohort in status_history.cohorts(db, Status.BILLING_STARTED, months=12)}
+    assert list(cohorts) == ["2023-06", "2024-01"]
+    june = cohorts["2023-06"]
+    assert june["size"] == 4
+    assert june["reached"] == [0] * 7 + [1] * 6
+    assert june["rates"][7] == 0.25
+    assert cohorts["2024-01"]["size"] == 496 and not any(cohorts["2024-01"]["reached"])
+    released = status_history.cohorts(db, Status.RELEASED_RESIGNED, months=3)
+    assert released[0]["reached"] == [0, 0, 0, 0]
+    print("✅ Cohorts accumulate first arrivals by months since joining")
+
+    crud.delete_genc(db, 1)
+    analytics = crud.get_status_analytics(db, cohort_months=12)
+    assert [stage["reached"] for stage in analytics["funnel"]["stages"]] == [3, 1, 0, 0, 0, 0]
+    assert analytics["cohorts"][0]["size"] == 3 and analytics["cohorts"][0]["reached"][-1] == 0
+    print("✅ Deleted GenCs drop out of the analytics")
+    db.close()
+    engine.dispose()
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as scratch:
+        test_time_in_status(scratch)
+        test_funnel_and_cohorts(scratch)
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""
+Test script to verify bulk GenC status transitions
+Checks that transition_genc_statuses() applies every allowed change with its dates, reports
+invalid transitions, unknown GenCs and repeated GenCs per item in request order without
+blocking the valid ones, records status history only for real changes, and leaves other
+GenCs alone; and that a single GenC update does not apply a transition checked against a
+status another request has since changed.
+"""
+
+import sys
+import os
+import tempfile
+from datetime import date
+
+# Add the current directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+import models
+import crud
+import schemas
+from test_cascade_deletes import seeded_session
+
+Status = models.StatusEnum
+
+def gencs_in(db, status: Status, count: int) -> list:
+    return [genc_id for (genc_id,) in db.query(models.GenC.id).filter(models.GenC.status == status).order_by(models.GenC.id).limit(count)]
+
+def genc_columns(db, genc_id: int) -> dict:
+    genc = db.get(models.GenC, genc_id)
+    return {column.name: getattr(genc, column.name) for column in models.GenC.__table__.c}
+
+def test_bulk_status_transitions(tmp_path):
+    engine, db = seeded_session(os.path.join(tmp_path, "transitions.db"))
+    idle = gencs_in(db, Status.IDLE, 4)
+    (billing,) = gencs_in(db, Status.BILLING_STARTED, 1)
+    untouched = gencs_in(db, Status.IDLE, 5)[4]
+    before_untouched = genc_columns(db, untouched)
+
+    items = [
+        schemas.GenCStatusTransition(genc_id=idle[0], new_status=Status.UNDER_PROJECT_TRAINING, date_of_allocation=date(2024, 4, 1)),
+        schemas.GenCStatusTransition(genc_id=idle[1], new_status=Status.CUSTOMER_ONBOARDED, planned_billing_start_date=date(2024, 5, 1)),
+        schemas.GenCStatusTransition(genc_id=billing, new_status=Status.GENC_REGULARIZED),
+        schemas.GenCStatusTransition(genc_id=idle[2], new_status=Status.BILLING_STARTED),
+        schemas.GenCStatusTransition(genc_id=999999, new_status=Status.IDLE),
+        schemas.GenCStatusTransition(genc_id=idle[0], new_status=Status.RELEASED_RESIGNED),
+        schemas.GenCStatusTransition(genc_id=idle[3], new_status=Status.IDLE)
+    ]
+    results = crud.transition_genc_statuses(db, items)
+
+    assert [result["genc_id"] for result in results] == [item.genc_id for item in items]
+    assert [result["success"] for result in results] == [True, True, True, False, False, False, True]
+    assert results[3]["detail"] == "Invalid status transition from Idle to Billing Started"
+    assert results[3]["status"] == Status.IDLE
+    assert results[4]["detail"] == "GenC not found" and results[4]["previous_status"] is None
+    assert results[5]["detail"] == "GenC appears more than once in the request"
+    assert results[0]["previous_status"] == Status.IDLE and results[0]["status"] == Status.UNDER_PROJECT_TRAINING
+    print("✅ Each item gets a result in request order; invalid items do not block valid ones")
+
+    db.close()
+    first, second, regularized = genc_columns(db, idle[0]), genc_columns(db, idle[1]), genc_columns(db, billing)
+    assert first["status"] == Status.UNDER_PROJECT_TRAINING and first["date_of_allocation"] == date(2024, 4, 1)
+    assert first["planned_billing_start_date"] is None
+    assert second["status"] == Status.CUSTOMER_ONBOARDED and second["planned_billing_start_date"] == date(2024, 5, 1)
+    assert second["date_of_allocation"] is None
+    assert regularized["status"] == Status.GENC_REGULARIZED
+    assert genc_columns(db, idle[2])["status"] == Status.IDLE
+    assert genc_columns(db, untouched) == before_untouched
+    print("✅ Valid transitions are applied with their own dates only")
+
+    history = {genc_id: [(change.from_status, change.to_status) for change in crud.get_genc_status_history(db, genc_id)]
+               for genc_id in (idle[0], idle[1], billing, idle[2], idle[3])}
+    assert history == {
+        idle[0]: [(Status.IDLE, Status.UNDER_PROJECT_TRAINING)],
+        idle[1]: [(Status.IDLE, Status.CUSTOMER_ONBOARDED)],
+        billing: [(Status.BILLING_STARTED, Status.GENC_REGULARIZED)],
+        idle[2]: [],
+        idle[3]: []
+    }, history
+    print("✅ Status history records the real changes only")
+
+    assert [result["success"] for result in crud.transition_genc_statuses(db, [
+        schemas.GenCStatusTransition(genc_id=billing, new_status=Status.RELEASED_RESIGNED)
+    ])] == [False]
+    print("✅ Terminal statuses cannot be left")
+    db.close()
+    engine.dispose()
+
+def test_update_refuses_a_status_changed_underneath(tmp_path):
+    engine, db = seeded_session(os.path.join(tmp_path, "transition_race.db"))
+    genc_id, other_id = gencs_in(db, Status.BILLING_PLANNED, 2)
+    db.close()
+
+    # Another request moves the GenC on between update_genc() checking the status and writing it
+    update_returning = crud._update_returning
+
+    def after_concurrent_write(*args, **kwargs):
+        with Session(engine) as other:
+            other.execute(update(models.GenC).where(models.GenC.id == genc_id).values(status=Status.BILLING_STARTED))
+            other.commit()
+        return update_returning(*args, **kwargs)
+
+    crud._update_returning = after_concurrent_write
+    try:
+        crud.update_genc(db, genc_id, schemas.GenCPatch(status=Status.FEEDBACK_NOT_GOOD))
+        raise AssertionError("the stale transition was applied")
+    except crud.StatusConflictError:
+        pass
+    finally:
+        crud._update_returning = update_returning
+    assert genc_columns(db, genc_id)["status"] == Status.BILLING_STARTED
+    assert crud.get_genc_status_history(db, genc_id) == []
+    print("✅ A status changed after the transition check is not overwritten")
+
+    # The bulk transitions are guarded the same way: nothing in the batch is applied
+    validate = crud.validate_status_transition
+
+    def validate_after_concurrent_write(current_status, new_status):
+        crud.validate_status_transition = validate
+        with Session(engine) as other:
+            other.execute(update(models.GenC).where(models.GenC.id == other_id).values(status=Status.BILLING_STARTED))
+            other.commit()
+        return validate(current_status, new_status)
+
+    crud.validate_status_transition = validate_after_concurrent_write
+    try:
+        crud.transition_genc_statuses(db, [
+            schemas.GenCStatusTransition(genc_id=other_id, new_status=Status.FEEDBACK_NOT_GOOD)
+        ])
+        raise AssertionError("the stale bulk transition was applied")
+    except crud.StatusConflictError:
+        pass
+    finally:
+        crud.validate_status_transition = validate
+    assert genc_columns(db, other_id)["status"] == Status.BILLING_STARTED
+    print("✅ Bulk transitions refuse statuses changed after they were checked")
+
+    updated = crud.update_genc(db, other_id, schemas.GenCPatch(status=Status.GENC_REGULARIZED))
+    assert updated.status == Status.GENC_REGULARIZED
+    assert crud.update_genc(db, 999999, schemas.GenCPatch(status=Status.IDLE)) is None
+    print("✅ Unchallenged transitions apply and missing GenCs give None")
+    db.close()
+    engine.dispose()
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as scratch:
+        test_bulk_status_transitions(scratch)
+        test_update_refuses_a_status_changed_underneath(scratch)
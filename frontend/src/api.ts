@@ -3,7 +3,9 @@ import {
   Account, AccountCreate, AccountServiceLine, AccountServiceLineCreate,
   Mentor, MentorCreate, GenC, GenCCreate, GenCFeedback, GenCFeedbackCreate,
   ApplicationUser, ApplicationUserCreate, Skill, SkillCreate, GenCSkill, GenCSkillCreate,
-  RoleSkillRequirement, RoleSkillRequirementCreate, SkillMatrixEntry, RoleRequirementMatrix
+  RoleSkillRequirement, RoleSkillRequirementCreate, SkillMatrixEntry, RoleRequirementMatrix, ImportJob,
+  DashboardStats, SkillMatrixQuery, GenCQuery, SearchResult, GenCStatusTransition, GenCStatusTransitionResponse,
+  GenCStatusChange, StatusAnalytics, EnumBundle, GenCSkillAssignment, RoleFitQuery, RoleFitRanking
 } from './types';
 
 const API_BASE_URL = import.meta.env.VITE_API_BASE_URL || 'http://localhost:8000';
@@ -15,23 +17,46 @@ const api = axios.create({
   },
 });
 
+const IMPORT_POLL_INTERVAL_MS = 1000;
+
+// Import Job API
+export const importJobAPI = {
+  getById: (jobId: string) => api.get<ImportJob>(`/import-jobs/${jobId}`)
+};
+
+// Upload a file to an import endpoint and resolve with the finished job
+const submitImport = async (url: string, file: File) => {
+  const formData = new FormData();
+  formData.append('file', file);
+  const { data: job } = await api.post<ImportJob>(url, formData, {
+    headers: {
+      'Content-Type': 'multipart/form-data',
+    },
+  });
+
+  let response = await importJobAPI.getById(job.job_id);
+  while (response.data.status === 'queued' || response.data.status === 'running') {
+    await new Promise((resolve) => setTimeout(resolve, IMPORT_POLL_INTERVAL_MS));
+    response = await importJobAPI.getById(job.job_id);
+  }
+  if (response.data.status === 'failed') {
+    throw new Error(response.data.detail || 'Import failed');
+  }
+  return response;
+};
+
 // Account API
 export const accountAPI = {
   getAll: () => api.get<Account[]>('/accounts/'),
   getById: (id: number) => api.get<Account>(`/accounts/${id}`),
   create: (data: AccountCreate) => api.post<Account>('/accounts/', data),
   update: (id: number, data: AccountCreate) => api.put<Account>(`/accounts/${id}`, data),
+  patch: (id: number, data: Partial<AccountCreate>) => api.patch<Account>(`/accounts/${id}`, data),
   delete: (id: number) => api.delete(`/accounts/${id}`),
-  importExcel: (file: File) => {
-    const formData = new FormData();
-    formData.append('file', file);
-    return api.post('/accounts/import/', formData, {
-      headers: {
-        'Content-Type': 'multipart/form-data',
-      },
-    });
-  },
-  deleteAll: () => api.delete('/accounts/delete-all/')
+  importExcel: (file: File) => submitImport('/accounts/import/', file),
+  // With chunkSize the server deletes in short batches instead of one long transaction
+  deleteAll: (chunkSize?: number) =>
+    api.delete('/accounts/delete-all/', { params: chunkSize ? { chunk_size: chunkSize } : undefined })
 };
 
 // Account Service Line API
@@ -41,16 +66,9 @@ export const accountServiceLineAPI = {
   getByAccount: (accountId: number) => api.get<AccountServiceLine[]>(`/accounts/${accountId}/service-lines/`),
   create: (data: AccountServiceLineCreate) => api.post<AccountServiceLine>('/account-service-lines/', data),
   update: (id: number, data: AccountServiceLineCreate) => api.put<AccountServiceLine>(`/account-service-lines/${id}`, data),
+  patch: (id: number, data: Partial<AccountServiceLineCreate>) => api.patch<AccountServiceLine>(`/account-service-lines/${id}`, data),
   delete: (id: number) => api.delete(`/account-service-lines/${id}`),
-  importExcel: (file: File) => {
-    const formData = new FormData();
-    formData.append('file', file);
-    return api.post('/account-service-lines/import/', formData, {
-      headers: {
-        'Content-Type': 'multipart/form-data',
-      },
-    });
-  }
+  importExcel: (file: File) => submitImport('/account-service-lines/import/', file)
 };
 
 // Mentor API
@@ -59,16 +77,9 @@ export const mentorAPI = {
   getById: (id: number) => api.get<Mentor>(`/mentors/${id}`),
   create: (data: MentorCreate) => api.post<Mentor>('/mentors/', data),
   update: (id: number, data: MentorCreate) => api.put<Mentor>(`/mentors/${id}`, data),
+  patch: (id: number, data: Partial<MentorCreate>) => api.patch<Mentor>(`/mentors/${id}`, data),
   delete: (id: number) => api.delete(`/mentors/${id}`),
-  importExcel: (file: File) => {
-    const formData = new FormData();
-    formData.append('file', file);
-    return api.post('/mentors/import/', formData, {
-      headers: {
-        'Content-Type': 'multipart/form-data',
-      },
-    });
-  }
+  importExcel: (file: File) => submitImport('/mentors/import/', file)
 };
 
 // Skill API
@@ -76,8 +87,10 @@ export const skillAPI = {
   getAll: () => api.get<Skill[]>('/skills/'),
   getById: (id: number) => api.get<Skill>(`/skills/${id}`),
   getByCategory: (category: string) => api.get<Skill[]>(`/skills/category/${category}`),
+  getCategories: () => api.get<string[]>('/skills/categories/'),
   create: (data: SkillCreate) => api.post<Skill>('/skills/', data),
   update: (id: number, data: SkillCreate) => api.put<Skill>(`/skills/${id}`, data),
+  patch: (id: number, data: Partial<SkillCreate>) => api.patch<Skill>(`/skills/${id}`, data),
   delete: (id: number) => api.delete(`/skills/${id}`)
 };
 
@@ -89,7 +102,12 @@ export const genCSkillAPI = {
   getBySkill: (skillId: number) => api.get<GenCSkill[]>(`/skills/${skillId}/gencs/`),
   create: (data: GenCSkillCreate) => api.post<GenCSkill>('/genc-skills/', data),
   update: (id: number, data: Partial<GenCSkillCreate>) => api.put<GenCSkill>(`/genc-skills/${id}`, data),
-  delete: (id: number) => api.delete(`/genc-skills/${id}`)
+  delete: (id: number) => api.delete(`/genc-skills/${id}`),
+  // Replaces the GenC's whole skill set in one transaction and returns the result
+  replaceForGenC: (gencId: number, skills: GenCSkillAssignment[]) =>
+    api.put<GenCSkill[]>(`/gencs/${gencId}/skills`, skills),
+  bulkUpsert: (items: GenCSkillCreate[], replace = false) =>
+    api.post<GenCSkill[]>('/genc-skills/bulk', { items, replace })
 };
 
 // Role Skill Requirement API
@@ -97,27 +115,28 @@ export const roleSkillRequirementAPI = {
   getAll: () => api.get<RoleSkillRequirement[]>('/role-skill-requirements/'),
   getById: (id: number) => api.get<RoleSkillRequirement>(`/role-skill-requirements/${id}`),
   getByRole: (role: string) => api.get<RoleSkillRequirement[]>(`/roles/${role}/requirements/`),
+  // GenCs ranked by fit to the role's requirements; repeated status values are sent as status=A&status=B
+  rankCandidates: (role: string, params: RoleFitQuery = {}) =>
+    api.get<RoleFitRanking>(`/roles/${role}/candidates/`, { params, paramsSerializer: { indexes: null } }),
   create: (data: RoleSkillRequirementCreate) => api.post<RoleSkillRequirement>('/role-skill-requirements/', data),
   update: (id: number, data: RoleSkillRequirementCreate) => api.put<RoleSkillRequirement>(`/role-skill-requirements/${id}`, data),
+  patch: (id: number, data: Partial<RoleSkillRequirementCreate>) => api.patch<RoleSkillRequirement>(`/role-skill-requirements/${id}`, data),
   delete: (id: number) => api.delete(`/role-skill-requirements/${id}`)
 };
 
 // GenC API (updated)
 export const genCAPI = {
-  getAll: () => api.get<GenC[]>('/gencs/'),
+  // Repeated status values are sent as status=A&status=B
+  getAll: (params: GenCQuery = {}) => api.get<GenC[]>('/gencs/', { params, paramsSerializer: { indexes: null } }),
   getById: (id: number) => api.get<GenC>(`/gencs/${id}`),
   create: (data: GenCCreate) => api.post<GenC>('/gencs/', data),
   update: (id: number, data: GenCCreate) => api.put<GenC>(`/gencs/${id}`, data),
+  patch: (id: number, data: Partial<GenCCreate>) => api.patch<GenC>(`/gencs/${id}`, data),
   delete: (id: number) => api.delete(`/gencs/${id}`),
-  importExcel: (file: File) => {
-    const formData = new FormData();
-    formData.append('file', file);
-    return api.post('/gencs/import/', formData, {
-      headers: {
-        'Content-Type': 'multipart/form-data',
-      },
-    });
-  }
+  getStatusHistory: (id: number) => api.get<GenCStatusChange[]>(`/gencs/${id}/status-history`),
+  transitionStatuses: (items: GenCStatusTransition[]) =>
+    api.post<GenCStatusTransitionResponse>('/gencs/status-transitions', { items }),
+  importExcel: (file: File) => submitImport('/gencs/import/', file)
 };
 
 // GenC Feedback API
@@ -127,33 +146,65 @@ export const genCFeedbackAPI = {
   getByGenC: (gencId: number) => api.get<GenCFeedback[]>(`/gencs/${gencId}/feedbacks/`),
   create: (data: GenCFeedbackCreate) => api.post<GenCFeedback>('/genc-feedbacks/', data),
   update: (id: number, data: GenCFeedbackCreate) => api.put<GenCFeedback>(`/genc-feedbacks/${id}`, data),
+  patch: (id: number, data: Partial<GenCFeedbackCreate>) => api.patch<GenCFeedback>(`/genc-feedbacks/${id}`, data),
   delete: (id: number) => api.delete(`/genc-feedbacks/${id}`)
 };
 
+// Search API
+export const searchAPI = {
+  // Snippets come back HTML-escaped with matches wrapped in <mark> tags
+  feedback: (q: string, params: { kind?: SearchResult['kind']; skip?: number; limit?: number } = {}) =>
+    api.get<SearchResult[]>('/search/feedback', { params: { q, ...params } })
+};
+
 // Application User API
 export const applicationUserAPI = {
   getAll: () => api.get<ApplicationUser[]>('/application-users/'),
   getById: (id: number) => api.get<ApplicationUser>(`/application-users/${id}`),
   create: (data: ApplicationUserCreate) => api.post<ApplicationUser>('/application-users/', data),
   update: (id: number, data: ApplicationUserCreate) => api.put<ApplicationUser>(`/application-users/${id}`, data),
+  patch: (id: number, data: Partial<ApplicationUserCreate>) => api.patch<ApplicationUser>(`/application-users/${id}`, data),
   delete: (id: number) => api.delete(`/application-users/${id}`)
 };
 
 // Skill Matrix API
 export const skillMatrixAPI = {
-  getSkillMatrix: () => api.get<SkillMatrixEntry[]>('/skill-matrix/'),
+  getSkillMatrix: (params: SkillMatrixQuery = {}) => api.get<SkillMatrixEntry[]>('/skill-matrix/', { params }),
   getRoleRequirementsMatrix: () => api.get<RoleRequirementMatrix[]>('/role-requirements-matrix/')
 };
 
+// Statistics API
+export const statsAPI = {
+  getDashboard: () => api.get<DashboardStats>('/stats/dashboard'),
+  getStatusAnalytics: (params: { include_current?: boolean; cohort_status?: string; cohort_months?: number } = {}) =>
+    api.get<StatusAnalytics>('/stats/status-analytics', { params })
+};
+
 // Enum API
+// All enums arrive in one long-cached request, shared by the getters below
+let enumBundle: Promise<EnumBundle> | null = null;
+
+const getEnumBundle = () => {
+  if (!enumBundle) {
+    enumBundle = api.get<EnumBundle>('/enums')
+      .then((response) => response.data)
+      .catch((error) => {
+        enumBundle = null;
+        throw error;
+      });
+  }
+  return enumBundle;
+};
+
 export const enumAPI = {
-  getStatuses: () => api.get('/enums/status'),
-  getLocations: () => api.get('/enums/location'),
-  getDesignations: () => api.get('/enums/designation'),
-  getMentorDesignations: () => api.get('/enums/mentor-designation'),
-  getUserTypes: () => api.get('/enums/user-type'),
-  getProficiencyLevels: () => api.get('/enums/proficiency-level'),
-  getStatusTransitions: () => api.get('/enums/status-transitions')
+  getAll: getEnumBundle,
+  getStatuses: () => getEnumBundle().then((enums) => enums.status),
+  getLocations: () => getEnumBundle().then((enums) => enums.location),
+  getDesignations: () => getEnumBundle().then((enums) => enums.designation),
+  getMentorDesignations: () => getEnumBundle().then((enums) => enums.mentor_designation),
+  getUserTypes: () => getEnumBundle().then((enums) => enums.user_type),
+  getProficiencyLevels: () => getEnumBundle().then((enums) => enums.proficiency_level),
+  getStatusTransitions: () => getEnumBundle().then((enums) => enums.status_transitions)
 };
 
 export default api; 
\ No newline at end of file
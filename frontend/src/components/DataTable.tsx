@@ -22,6 +22,7 @@ interface DataTableProps {
   onEdit: (item: any) => void;
   onDelete: (item: any) => void;
   actionButtons?: ActionButton[];
+  filters?: React.ReactNode;
 }
 
 export default function DataTable({ 
@@ -32,7 +33,8 @@ export default function DataTable({
   onNew, 
   onEdit, 
   onDelete,
-  actionButtons = []
+  actionButtons = [],
+  filters
 }: DataTableProps) {
   return (
     <div>
@@ -68,6 +70,8 @@ export default function DataTable({
         </div>
       </div>
 
+      {filters}
+
       <div className="cognizant-card overflow-hidden">
         {loading ? (
           <div className="p-8 text-center">
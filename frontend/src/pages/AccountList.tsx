@@ -110,7 +110,7 @@ export default function AccountList() {
       );
       
       if (response) {
-        setImportResult(response.data);
+        setImportResult(response);
         refetch(); // Refresh the accounts list
       }
     } catch (error) {
@@ -250,7 +250,7 @@ export default function AccountList() {
                 <div>
                   <h3 className="text-sm font-medium text-gray-900 mb-2">Instructions:</h3>
                   <ul className="text-sm text-gray-600 space-y-1">
-                    <li>• Upload an Excel file (.xlsx or .xls) with account data</li>
+                    <li>• Upload an Excel or CSV file (.xlsx, .xls or .csv) with account data</li>
                     <li>• Required columns: <code className="bg-gray-100 px-1 rounded">account_name</code>, <code className="bg-gray-100 px-1 rounded">epl_name</code>, <code className="bg-gray-100 px-1 rounded">edp_name</code></li>
                     <li>• Duplicate account names will be skipped</li>
                   </ul>
@@ -269,13 +269,13 @@ export default function AccountList() {
                           id="file-upload"
                           name="file-upload"
                           type="file"
-                          accept=".xlsx,.xls"
+                          accept=".xlsx,.xls,.csv"
                           onChange={handleFileUpload}
                           className="sr-only"
                         />
                       </label>
                       <p className="mt-2 text-xs text-gray-500">
-                        Supports .xlsx and .xls files
+                        Supports .xlsx, .xls and .csv files
                       </p>
                     </div>
                   </div>
@@ -314,7 +314,7 @@ export default function AccountList() {
               {importResult.errors && importResult.errors.length > 0 && (
                 <div className="bg-red-50 border border-red-200 rounded-md p-4">
                   <h4 className="text-sm font-medium text-red-900 mb-2">Errors:</h4>
-                  <ul className="text-sm text-red-800 space-y-1">
+                  <ul className="text-sm text-red-800 space-y-1 max-h-60 overflow-y-auto">
                     {importResult.errors.map((error: string, index: number) => (
                       <li key={index}>• {error}</li>
                     ))}
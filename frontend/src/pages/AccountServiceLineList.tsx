@@ -114,7 +114,7 @@ export default function AccountServiceLineList() {
       );
       
       if (response) {
-        setImportResult(response.data);
+        setImportResult(response);
         refetch(); // Refresh the service lines list
       }
     } catch (error) {
@@ -225,7 +225,7 @@ export default function AccountServiceLineList() {
                 <div>
                   <h3 className="text-sm font-medium text-gray-900 mb-2">Instructions:</h3>
                   <ul className="text-sm text-gray-600 space-y-1">
-                    <li>• Upload an Excel file (.xlsx or .xls) with account service line data</li>
+                    <li>• Upload an Excel or CSV file (.xlsx, .xls or .csv) with account service line data</li>
                     <li>• Required columns: <code className="bg-gray-100 px-1 rounded">account_name</code>, <code className="bg-gray-100 px-1 rounded">service_line</code>, <code className="bg-gray-100 px-1 rounded">edl_name</code>, <code className="bg-gray-100 px-1 rounded">pdl_name</code>, <code className="bg-gray-100 px-1 rounded">sl_spoc</code></li>
                     <li>• Account names must match existing accounts in the system</li>
                   </ul>
@@ -244,13 +244,13 @@ export default function AccountServiceLineList() {
                           id="service-line-file-upload"
                           name="service-line-file-upload"
                           type="file"
-                          accept=".xlsx,.xls"
+                          accept=".xlsx,.xls,.csv"
                           onChange={handleFileUpload}
                           className="sr-only"
                         />
                       </label>
                       <p className="mt-2 text-xs text-gray-500">
-                        Supports .xlsx and .xls files
+                        Supports .xlsx, .xls and .csv files
                       </p>
                     </div>
                   </div>
@@ -289,7 +289,7 @@ export default function AccountServiceLineList() {
               {importResult.errors && importResult.errors.length > 0 && (
                 <div className="bg-red-50 border border-red-200 rounded-md p-4">
                   <h4 className="text-sm font-medium text-red-900 mb-2">Errors:</h4>
-                  <ul className="text-sm text-red-800 space-y-1">
+                  <ul className="text-sm text-red-800 space-y-1 max-h-60 overflow-y-auto">
                     {importResult.errors.map((error: string, index: number) => (
                       <li key={index}>• {error}</li>
                     ))}
@@ -1,32 +1,33 @@
+import { useEffect, useState } from 'react';
 import { useNavigate } from 'react-router-dom';
+import { toast } from 'react-hot-toast';
 import { useApiData } from '../hooks/useApi';
-import { genCAPI, mentorAPI, accountAPI, genCFeedbackAPI } from '../api';
-import { GenC, Mentor, Account, GenCFeedback } from '../types';
-import { Users, UserCheck, Building2, MessageSquare, TrendingUp, Plus, DollarSign, Clock } from 'lucide-react';
+import { genCFeedbackAPI, statsAPI } from '../api';
+import { DashboardStats, GenCFeedback } from '../types';
+import { Users, UserCheck, MessageSquare, TrendingUp, Plus, DollarSign, Clock } from 'lucide-react';
 
 export default function Dashboard() {
   const navigate = useNavigate();
   
-  const { data: gencs, loading: gencsLoading } = useApiData<GenC>(() => genCAPI.getAll());
-  const { data: mentors, loading: mentorsLoading } = useApiData<Mentor>(() => mentorAPI.getAll());
-  const { data: accounts, loading: accountsLoading } = useApiData<Account>(() => accountAPI.getAll());
+  const [stats, setStats] = useState<DashboardStats | null>(null);
+  const [statsLoading, setStatsLoading] = useState(true);
   const { data: feedbacks, loading: feedbacksLoading } = useApiData<GenCFeedback>(() => genCFeedbackAPI.getAll());
 
-  // Calculate metrics
-  const totalGenCs = gencs.length;
-  const activeMentors = mentors.length;
-  const totalAccounts = accounts.length;
-  const billingStartedCount = gencs.filter(genc => genc.status === 'Billing Started').length;
-  const billingPlannedCount = gencs.filter(genc => genc.status === 'Billing Planned').length;
-  const idleGenCsCount = gencs.filter(genc => genc.status === 'Idle').length;
+  useEffect(() => {
+    statsAPI.getDashboard()
+      .then((response) => setStats(response.data))
+      .catch((err) => toast.error(err.response?.data?.detail || err.message || 'Failed to fetch dashboard statistics'))
+      .finally(() => setStatsLoading(false));
+  }, []);
 
-  // Status breakdown
-  const statusBreakdown = gencs.reduce((acc, genc) => {
-    acc[genc.status] = (acc[genc.status] || 0) + 1;
-    return acc;
-  }, {} as Record<string, number>);
+  // Metrics are aggregated server-side over all GenCs
+  const statusBreakdown = stats?.status_counts ?? {};
+  const totalGenCs = stats?.total_gencs ?? 0;
+  const billingStartedCount = statusBreakdown['Billing Started'] ?? 0;
+  const billingPlannedCount = statusBreakdown['Billing Planned'] ?? 0;
+  const idleGenCsCount = statusBreakdown['Idle'] ?? 0;
 
-  const isLoading = gencsLoading || mentorsLoading || accountsLoading || feedbacksLoading;
+  const isLoading = statsLoading || feedbacksLoading;
 
   const metrics = [
     {
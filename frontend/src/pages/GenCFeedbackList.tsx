@@ -1,10 +1,10 @@
-import { useState } from 'react';
+import { useState, useEffect } from 'react';
 import DataTable from '../components/DataTable';
 import Modal from '../components/Modal';
 import GenCFeedbackForm from '../components/GenCFeedbackForm';
-import { genCFeedbackAPI } from '../api';
+import { genCFeedbackAPI, searchAPI } from '../api';
 import { useApiData, useApi } from '../hooks/useApi';
-import { GenCFeedback, GenCFeedbackCreate } from '../types';
+import { GenCFeedback, GenCFeedbackCreate, SearchResult } from '../types';
 
 export default function GenCFeedbackList() {
   const [showModal, setShowModal] = useState(false);
@@ -15,6 +15,34 @@ export default function GenCFeedbackList() {
   const { data: feedbacks, loading, refetch } = useApiData<GenCFeedback>(() => genCFeedbackAPI.getAll());
   const { execute, loading: submitting } = useApi();
 
+  const [search, setSearch] = useState('');
+  const [results, setResults] = useState<SearchResult[]>([]);
+  const [resultCount, setResultCount] = useState(0);
+  const [searching, setSearching] = useState(false);
+
+  // Full-text search over feedback and skill notes, debounced while typing
+  useEffect(() => {
+    if (!search.trim()) {
+      setResults([]);
+      setResultCount(0);
+      return;
+    }
+    const timeout = setTimeout(async () => {
+      setSearching(true);
+      try {
+        const response = await searchAPI.feedback(search.trim(), { limit: 20 });
+        setResults(response.data);
+        setResultCount(Number(response.headers['x-total-count'] ?? response.data.length));
+      } catch {
+        setResults([]);
+        setResultCount(0);
+      } finally {
+        setSearching(false);
+      }
+    }, 300);
+    return () => clearTimeout(timeout);
+  }, [search]);
+
   const columns = [
     { 
       key: 'genc', 
@@ -117,6 +145,37 @@ export default function GenCFeedbackList() {
         onNew={handleNew}
         onEdit={handleEdit}
         onDelete={handleDelete}
+        filters={
+          <div className="mb-6 cognizant-card p-4 space-y-3">
+            <input
+              type="text"
+              value={search}
+              onChange={(e) => setSearch(e.target.value)}
+              placeholder="Search feedback and skill notes"
+              className="form-input w-full"
+            />
+            {search.trim() && (
+              <div className="space-y-2">
+                <p className="text-sm text-gray-500">
+                  {searching ? 'Searching...' : `${resultCount} matching ${resultCount === 1 ? 'entry' : 'entries'}`}
+                </p>
+                {results.map((result) => (
+                  <div key={`${result.kind}-${result.source_id}`} className="border-b border-gray-100 pb-2">
+                    <div className="flex items-center gap-2 text-sm">
+                      <span className="font-medium text-gray-900">{result.genc_name}</span>
+                      <span className="text-gray-500">{result.associate_id}</span>
+                      <span className="px-2 py-0.5 text-xs rounded-full bg-gray-100 text-gray-700">
+                        {result.kind === 'feedback' ? 'Feedback' : 'Skill note'}
+                      </span>
+                    </div>
+                    {/* The API escapes the snippet and only adds <mark> tags */}
+                    <p className="text-sm text-gray-700" dangerouslySetInnerHTML={{ __html: result.snippet }} />
+                  </div>
+                ))}
+              </div>
+            )}
+          </div>
+        }
       />
 
       {/* Create/Edit Modal */}
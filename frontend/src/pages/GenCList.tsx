@@ -1,10 +1,10 @@
-import { useState, useRef } from 'react';
+import { useState, useRef, useEffect } from 'react';
 import DataTable from '../components/DataTable';
 import Modal from '../components/Modal';
 import GenCForm from '../components/GenCForm';
-import { genCAPI, genCSkillAPI } from '../api';
+import { genCAPI, genCSkillAPI, accountAPI } from '../api';
 import { useApiData, useApi } from '../hooks/useApi';
-import { GenC, GenCCreate } from '../types';
+import { Account, GenC, GenCCreate, GenCQuery, GenCSkillAssignment, StatusEnum, LocationEnum, DesignationEnum } from '../types';
 import { SelectedSkill } from '../components/GenCSkillSelector';
 import { Upload, Download } from 'lucide-react';
 
@@ -12,6 +12,52 @@ interface GenCFormData extends GenCCreate {
   skills?: SelectedSkill[];
 }
 
+interface GenCFilterState {
+  search: string;
+  status: string;
+  account_id: string;
+  location: string;
+  designation: string;
+  joined_from: string;
+  joined_to: string;
+  billing_from: string;
+  billing_to: string;
+}
+
+const EMPTY_FILTERS: GenCFilterState = {
+  search: '',
+  status: '',
+  account_id: '',
+  location: '',
+  designation: '',
+  joined_from: '',
+  joined_to: '',
+  billing_from: '',
+  billing_to: '',
+};
+
+// Filters are applied server-side; empty fields are left out of the query
+const buildQuery = (filters: GenCFilterState): GenCQuery => ({
+  include: 'skills',
+  ...(filters.search.trim() && { search: filters.search.trim() }),
+  ...(filters.status && { status: [filters.status as StatusEnum] }),
+  ...(filters.account_id && { account_id: Number(filters.account_id) }),
+  ...(filters.location && { location: filters.location as LocationEnum }),
+  ...(filters.designation && { designation: filters.designation as DesignationEnum }),
+  ...(filters.joined_from && { joined_from: filters.joined_from }),
+  ...(filters.joined_to && { joined_to: filters.joined_to }),
+  ...(filters.billing_from && { billing_from: filters.billing_from }),
+  ...(filters.billing_to && { billing_to: filters.billing_to }),
+});
+
+const toSkillAssignments = (skills: SelectedSkill[]): GenCSkillAssignment[] =>
+  skills.map(skill => ({
+    skill_id: skill.skill_id,
+    proficiency_level: skill.proficiency_level,
+    date_acquired: skill.date_acquired ? new Date(skill.date_acquired).toISOString().split('T')[0] : undefined,
+    notes: skill.notes || undefined
+  }));
+
 export default function GenCList() {
   const [showModal, setShowModal] = useState(false);
   const [editingGenC, setEditingGenC] = useState<GenC | null>(null);
@@ -21,9 +67,28 @@ export default function GenCList() {
   const [importResult, setImportResult] = useState<any>(null);
   const fileInputRef = useRef<HTMLInputElement>(null);
 
-  const { data: gencs, loading, refetch } = useApiData<GenC>(() => genCAPI.getAll());
+  const [filters, setFilters] = useState<GenCFilterState>(EMPTY_FILTERS);
+  const isFirstRender = useRef(true);
+
+  const { data: gencs, loading, refetch } = useApiData<GenC>(() => genCAPI.getAll(buildQuery(filters)));
+  const { data: accounts } = useApiData<Account>(() => accountAPI.getAll());
   const { execute, loading: submitting } = useApi();
 
+  useEffect(() => {
+    if (isFirstRender.current) {
+      isFirstRender.current = false;
+      return;
+    }
+    const timeout = setTimeout(refetch, filters.search ? 300 : 0);
+    return () => clearTimeout(timeout);
+  }, [filters]);
+
+  const updateFilter = (key: keyof GenCFilterState, value: string) => {
+    setFilters((current) => ({ ...current, [key]: value }));
+  };
+
+  const hasFilters = Object.values(filters).some((value) => value !== '');
+
   const columns = [
     { key: 'associate_id', label: 'Associate ID' },
     { key: 'genc_name', label: 'Name' },
@@ -141,25 +206,9 @@ export default function GenCList() {
           { 
             successMessage: 'GenC updated successfully',
             onSuccess: async (updatedGenC) => {
-              // Handle skills update
+              // Replace the GenC's skill set in one request
               if (skills && skills.length > 0) {
-                // Delete existing skills for this GenC
-                if (editingGenC.skills) {
-                  for (const existingSkill of editingGenC.skills) {
-                    await genCSkillAPI.delete(existingSkill.id);
-                  }
-                }
-                
-                // Create new skills
-                for (const skill of skills) {
-                  await genCSkillAPI.create({
-                    genc_id: editingGenC.id,
-                    skill_id: skill.skill_id,
-                    proficiency_level: skill.proficiency_level,
-                    date_acquired: skill.date_acquired ? new Date(skill.date_acquired).toISOString().split('T')[0] : undefined,
-                    notes: skill.notes || undefined
-                  });
-                }
+                await genCSkillAPI.replaceForGenC(editingGenC.id, toSkillAssignments(skills));
               }
               
               setShowModal(false);
@@ -174,17 +223,9 @@ export default function GenCList() {
           { 
             successMessage: 'GenC created successfully',
             onSuccess: async (newGenC) => {
-              // Handle skills creation
+              // Assign all selected skills in one request
               if (skills && skills.length > 0) {
-                for (const skill of skills) {
-                  await genCSkillAPI.create({
-                    genc_id: newGenC.data.id,
-                    skill_id: skill.skill_id,
-                    proficiency_level: skill.proficiency_level,
-                    date_acquired: skill.date_acquired ? new Date(skill.date_acquired).toISOString().split('T')[0] : undefined,
-                    notes: skill.notes || undefined
-                  });
-                }
+                await genCSkillAPI.replaceForGenC(newGenC.data.id, toSkillAssignments(skills));
               }
               
               setShowModal(false);
@@ -237,7 +278,7 @@ export default function GenCList() {
       );
       
       if (response) {
-        setImportResult(response.data);
+        setImportResult(response);
         refetch(); // Refresh the GenCs list
       }
     } catch (error) {
@@ -288,6 +329,106 @@ export default function GenCList() {
         onEdit={handleEdit}
         onDelete={handleDelete}
         actionButtons={actionButtons}
+        filters={
+          <div className="mb-6 cognizant-card p-4">
+            <div className="flex flex-wrap gap-4 items-center">
+              <input
+                type="text"
+                value={filters.search}
+                onChange={(e) => updateFilter('search', e.target.value)}
+                placeholder="Search name or associate ID"
+                className="form-input min-w-0 w-auto"
+              />
+
+              <select
+                value={filters.status}
+                onChange={(e) => updateFilter('status', e.target.value)}
+                className="form-select min-w-0 w-auto"
+              >
+                <option value="">All Statuses</option>
+                {Object.values(StatusEnum).map((status) => (
+                  <option key={status} value={status}>{status}</option>
+                ))}
+              </select>
+
+              <select
+                value={filters.account_id}
+                onChange={(e) => updateFilter('account_id', e.target.value)}
+                className="form-select min-w-0 w-auto"
+              >
+                <option value="">All Accounts</option>
+                {accounts.map((account) => (
+                  <option key={account.id} value={account.id}>{account.account_name}</option>
+                ))}
+              </select>
+
+              <select
+                value={filters.location}
+                onChange={(e) => updateFilter('location', e.target.value)}
+                className="form-select min-w-0 w-auto"
+              >
+                <option value="">All Locations</option>
+                {Object.values(LocationEnum).map((location) => (
+                  <option key={location} value={location}>{location}</option>
+                ))}
+              </select>
+
+              <select
+                value={filters.designation}
+                onChange={(e) => updateFilter('designation', e.target.value)}
+                className="form-select min-w-0 w-auto"
+              >
+                <option value="">All Designations</option>
+                {Object.values(DesignationEnum).map((designation) => (
+                  <option key={designation} value={designation}>{designation}</option>
+                ))}
+              </select>
+
+              <div className="flex items-center gap-2">
+                <label className="text-sm font-medium text-gray-700">Joined:</label>
+                <input
+                  type="date"
+                  value={filters.joined_from}
+                  onChange={(e) => updateFilter('joined_from', e.target.value)}
+                  className="form-input min-w-0 w-auto"
+                />
+                <span className="text-gray-500">to</span>
+                <input
+                  type="date"
+                  value={filters.joined_to}
+                  onChange={(e) => updateFilter('joined_to', e.target.value)}
+                  className="form-input min-w-0 w-auto"
+                />
+              </div>
+
+              <div className="flex items-center gap-2">
+                <label className="text-sm font-medium text-gray-700">Billing started:</label>
+                <input
+                  type="date"
+                  value={filters.billing_from}
+                  onChange={(e) => updateFilter('billing_from', e.target.value)}
+                  className="form-input min-w-0 w-auto"
+                />
+                <span className="text-gray-500">to</span>
+                <input
+                  type="date"
+                  value={filters.billing_to}
+                  onChange={(e) => updateFilter('billing_to', e.target.value)}
+                  className="form-input min-w-0 w-auto"
+                />
+              </div>
+
+              {hasFilters && (
+                <button
+                  onClick={() => setFilters(EMPTY_FILTERS)}
+                  className="cognizant-button-secondary"
+                >
+                  Clear filters
+                </button>
+              )}
+            </div>
+          </div>
+        }
       />
 
       {/* Create/Edit Modal */}
@@ -348,7 +489,7 @@ export default function GenCList() {
                 <div>
                   <h3 className="text-sm font-medium text-gray-900 mb-2">Instructions:</h3>
                   <ul className="text-sm text-gray-600 space-y-1">
-                    <li>• Upload an Excel file (.xlsx or .xls) with GenC data</li>
+                    <li>• Upload an Excel or CSV file (.xlsx, .xls or .csv) with GenC data</li>
                     <li>• Required columns: <code className="bg-gray-100 px-1 rounded">associate_id</code>, <code className="bg-gray-100 px-1 rounded">genc_name</code>, <code className="bg-gray-100 px-1 rounded">account_name</code>, <code className="bg-gray-100 px-1 rounded">service_line</code>, <code className="bg-gray-100 px-1 rounded">mentor_associate_id</code>, <code className="bg-gray-100 px-1 rounded">status</code>, <code className="bg-gray-100 px-1 rounded">date_of_joining</code>, <code className="bg-gray-100 px-1 rounded">location</code>, <code className="bg-gray-100 px-1 rounded">current_designation</code></li>
                     <li>• Status values: Active, Allocated, Terminated</li>
                     <li>• Location values: Bangalore, Chennai, Hyderabad, Pune, Mumbai, Kolkata</li>
@@ -372,13 +513,13 @@ export default function GenCList() {
                           id="genc-file-upload"
                           name="genc-file-upload"
                           type="file"
-                          accept=".xlsx,.xls"
+                          accept=".xlsx,.xls,.csv"
                           onChange={handleFileUpload}
                           className="sr-only"
                         />
                       </label>
                       <p className="mt-2 text-xs text-gray-500">
-                        Supports .xlsx and .xls files
+                        Supports .xlsx, .xls and .csv files
                       </p>
                     </div>
                   </div>
@@ -417,7 +558,7 @@ export default function GenCList() {
               {importResult.errors && importResult.errors.length > 0 && (
                 <div className="bg-red-50 border border-red-200 rounded-md p-4">
                   <h4 className="text-sm font-medium text-red-900 mb-2">Errors:</h4>
-                  <ul className="text-sm text-red-800 space-y-1">
+                  <ul className="text-sm text-red-800 space-y-1 max-h-60 overflow-y-auto">
                     {importResult.errors.map((error: string, index: number) => (
                       <li key={index}>• {error}</li>
                     ))}
@@ -117,7 +117,7 @@ export default function MentorList() {
       );
       
       if (response) {
-        setImportResult(response.data);
+        setImportResult(response);
         refetch(); // Refresh the mentors list
       }
     } catch (error) {
@@ -228,7 +228,7 @@ export default function MentorList() {
                 <div>
                   <h3 className="text-sm font-medium text-gray-900 mb-2">Instructions:</h3>
                   <ul className="text-sm text-gray-600 space-y-1">
-                    <li>• Upload an Excel file (.xlsx or .xls) with mentor data</li>
+                    <li>• Upload an Excel or CSV file (.xlsx, .xls or .csv) with mentor data</li>
                     <li>• Required columns: <code className="bg-gray-100 px-1 rounded">associate_id</code>, <code className="bg-gray-100 px-1 rounded">mentor_name</code>, <code className="bg-gray-100 px-1 rounded">designation</code>, <code className="bg-gray-100 px-1 rounded">service_line</code></li>
                     <li>• Designation values: D, AD, SM, M, SA, A</li>
                     <li>• Duplicate associate IDs will be skipped</li>
@@ -248,13 +248,13 @@ export default function MentorList() {
                           id="mentor-file-upload"
                           name="mentor-file-upload"
                           type="file"
-                          accept=".xlsx,.xls"
+                          accept=".xlsx,.xls,.csv"
                           onChange={handleFileUpload}
                           className="sr-only"
                         />
                       </label>
                       <p className="mt-2 text-xs text-gray-500">
-                        Supports .xlsx and .xls files
+                        Supports .xlsx, .xls and .csv files
                       </p>
                     </div>
                   </div>
@@ -293,7 +293,7 @@ export default function MentorList() {
               {importResult.errors && importResult.errors.length > 0 && (
                 <div className="bg-red-50 border border-red-200 rounded-md p-4">
                   <h4 className="text-sm font-medium text-red-900 mb-2">Errors:</h4>
-                  <ul className="text-sm text-red-800 space-y-1">
+                  <ul className="text-sm text-red-800 space-y-1 max-h-60 overflow-y-auto">
                     {importResult.errors.map((error: string, index: number) => (
                       <li key={index}>• {error}</li>
                     ))}
@@ -1,34 +1,70 @@
-import { useState } from 'react';
-import { useApiData } from '../hooks/useApi';
-import { skillMatrixAPI } from '../api';
-import { SkillMatrixEntry } from '../types';
+import { useEffect, useState } from 'react';
+import { toast } from 'react-hot-toast';
+import { skillAPI, skillMatrixAPI } from '../api';
+import { SkillMatrixEntry, SkillMatrixQuery } from '../types';
 import { Users, Award, Calendar, Info, AlertTriangle, CheckCircle, Target, ArrowUp } from 'lucide-react';
 
+const PAGE_SIZE = 50;
+const ROLES = ['A', 'PA', 'PAT'];
+
 export default function SkillMatrix() {
   const [selectedCategory, setSelectedCategory] = useState<string>('all');
   const [selectedRole, setSelectedRole] = useState<string>('all');
   const [showOnlyGaps, setShowOnlyGaps] = useState<boolean>(false);
+  const [search, setSearch] = useState<string>('');
+  const [sort, setSort] = useState<string>('id');
 
-  const { data: skillMatrix, loading } = useApiData<SkillMatrixEntry>(() => skillMatrixAPI.getSkillMatrix());
+  const [skillMatrix, setSkillMatrix] = useState<SkillMatrixEntry[]>([]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
+  const [categories, setCategories] = useState<string[]>([]);
+  const [loading, setLoading] = useState(true);
+  const [initialized, setInitialized] = useState(false);
+  const [loadingMore, setLoadingMore] = useState(false);
 
-  // Get unique categories and roles from the data
-  const categories = [...new Set(
-    skillMatrix.flatMap(entry => 
-      entry.skills.map(skill => skill.category).filter(Boolean)
-    )
-  )].sort();
+  // Filters, sorting and pagination are evaluated server-side
+  const buildQuery = (after?: string): SkillMatrixQuery => ({
+    limit: PAGE_SIZE,
+    sort,
+    ...(selectedRole !== 'all' && { designation: selectedRole }),
+    ...(selectedCategory !== 'all' && { category: selectedCategory }),
+    ...(showOnlyGaps && { only_with_gaps: true }),
+    ...(search.trim() && { search: search.trim() }),
+    ...(after && { after }),
+  });
 
-  const roles = [...new Set(skillMatrix.map(entry => entry.current_designation))].sort();
+  const fetchPage = async (after?: string) => {
+    try {
+      const response = await skillMatrixAPI.getSkillMatrix(buildQuery(after));
+      setSkillMatrix((current) => (after ? [...current, ...response.data] : response.data));
+      setNextCursor(response.headers['x-next-cursor'] || null);
+    } catch (err: any) {
+      toast.error(err.response?.data?.detail || err.message || 'Failed to fetch data');
+    }
+  };
 
-  // Filter data based on selected filters
-  const filteredMatrix = skillMatrix.filter(entry => {
-    const roleMatch = selectedRole === 'all' || entry.current_designation === selectedRole;
-    const categoryMatch = selectedCategory === 'all' || 
-      entry.skills.some(skill => skill.category === selectedCategory);
-    const gapMatch = !showOnlyGaps || (entry.skill_gaps_count && entry.skill_gaps_count > 0);
-    
-    return roleMatch && categoryMatch && gapMatch;
-  });
+  useEffect(() => {
+    skillAPI.getCategories()
+      .then((response) => setCategories(response.data))
+      .catch(() => setCategories([]));
+  }, []);
+
+  useEffect(() => {
+    const timeout = setTimeout(() => {
+      setLoading(true);
+      fetchPage().finally(() => {
+        setLoading(false);
+        setInitialized(true);
+      });
+    }, search ? 300 : 0);
+    return () => clearTimeout(timeout);
+  }, [selectedRole, selectedCategory, showOnlyGaps, search, sort]);
+
+  const loadMore = async () => {
+    if (!nextCursor) return;
+    setLoadingMore(true);
+    await fetchPage(nextCursor);
+    setLoadingMore(false);
+  };
 
   const getProficiencyColor = (level: string) => {
     switch (level?.toLowerCase()) {
@@ -68,7 +104,7 @@ export default function SkillMatrix() {
     return null;
   };
 
-  if (loading) {
+  if (loading && !initialized) {
     return (
       <div className="space-y-6">
         <div className="page-header">
@@ -109,7 +145,7 @@ export default function SkillMatrix() {
               className="form-select min-w-0 w-auto"
             >
               <option value="all">All Roles</option>
-              {roles.map((role) => (
+              {ROLES.map((role) => (
                 <option key={role} value={role}>
                   {role}
                 </option>
@@ -145,16 +181,41 @@ export default function SkillMatrix() {
             </label>
           </div>
 
+          <div className="flex items-center gap-2">
+            <label className="text-sm font-medium text-gray-700">Sort:</label>
+            <select
+              value={sort}
+              onChange={(e) => setSort(e.target.value)}
+              className="form-select min-w-0 w-auto"
+            >
+              <option value="id">Default</option>
+              <option value="genc_name">Name</option>
+              <option value="associate_id">Associate ID</option>
+              <option value="-skill_gaps_count">Most skill gaps</option>
+              <option value="-missing_mandatory_count">Most missing mandatory skills</option>
+            </select>
+          </div>
+
+          <div className="flex items-center gap-2">
+            <input
+              type="text"
+              value={search}
+              onChange={(e) => setSearch(e.target.value)}
+              placeholder="Search name or associate ID"
+              className="form-input min-w-0 w-auto"
+            />
+          </div>
+
           <div className="flex items-center gap-2 ml-auto">
             <span className="text-sm text-gray-600">
-              Showing {filteredMatrix.length} of {skillMatrix.length} GenCs
+              Showing {skillMatrix.length}{nextCursor ? '+' : ''} GenCs
             </span>
           </div>
         </div>
       </div>
 
       {/* Skill Matrix Grid */}
-      {filteredMatrix.length === 0 ? (
+      {skillMatrix.length === 0 ? (
         <div className="cognizant-card">
           <div className="text-center py-12">
             <div className="w-16 h-16 bg-gray-100 rounded-full flex items-center justify-center mx-auto mb-4">
@@ -166,7 +227,7 @@ export default function SkillMatrix() {
         </div>
       ) : (
         <div className="space-y-6">
-          {filteredMatrix.map((entry) => (
+          {skillMatrix.map((entry) => (
             <div key={entry.associate_id} className="cognizant-card">
               <div className="p-6">
                 {/* GenC Header */}
@@ -311,6 +372,18 @@ export default function SkillMatrix() {
               </div>
             </div>
           ))}
+
+          {nextCursor && (
+            <div className="text-center">
+              <button
+                onClick={loadMore}
+                disabled={loadingMore}
+                className="cognizant-button-primary"
+              >
+                {loadingMore ? 'Loading...' : 'Load more'}
+              </button>
+            </div>
+          )}
         </div>
       )}
 
@@ -127,13 +127,16 @@ export interface GenC {
   skills?: GenCSkill[];
 }
 
+// GenC as nested in feedback: account, service line and mentor, but no skills
+export type GenCListItem = Omit<GenC, 'skills'>;
+
 export interface GenCFeedback {
   id: number;
   genc_id: number;
   mentor_id: number;
   date_of_feedback: string;
   feedback: string;
-  genc?: GenC;
+  genc?: GenCListItem;
   mentor?: Mentor;
 }
 
@@ -150,8 +153,19 @@ export type AccountServiceLineCreate = Omit<AccountServiceLine, 'id' | 'account'
 export type MentorCreate = Omit<Mentor, 'id'>;
 export type SkillCreate = Omit<Skill, 'id'>;
 export type GenCSkillCreate = Omit<GenCSkill, 'id' | 'skill' | 'genc'>;
+export type GenCSkillAssignment = Omit<GenCSkillCreate, 'genc_id'>;
 export type RoleSkillRequirementCreate = Omit<RoleSkillRequirement, 'id' | 'skill'>;
 export type GenCCreate = Omit<GenC, 'id' | 'account' | 'service_line_obj' | 'mentor' | 'skills'>;
+export interface SearchResult {
+  kind: 'feedback' | 'skill_note';
+  source_id: number;
+  genc_id: number;
+  associate_id: string;
+  genc_name: string;
+  snippet: string;
+  score: number;
+}
+
 export type GenCFeedbackCreate = Omit<GenCFeedback, 'id' | 'genc' | 'mentor'>;
 export type ApplicationUserCreate = Omit<ApplicationUser, 'id'>;
 
@@ -179,6 +193,53 @@ export interface SkillMatrixEntry {
   skill_gaps_count?: number;
 }
 
+export interface GenCQuery {
+  include?: 'skills';
+  status?: StatusEnum[];
+  account_id?: number;
+  service_line_id?: number;
+  mentor_id?: number;
+  location?: LocationEnum;
+  designation?: DesignationEnum;
+  joined_from?: string;
+  joined_to?: string;
+  billing_from?: string;
+  billing_to?: string;
+  search?: string;
+}
+
+export interface GenCStatusTransition {
+  genc_id: number;
+  new_status: StatusEnum;
+  date_of_allocation?: string;
+  planned_billing_start_date?: string;
+  actual_billing_start_date?: string;
+}
+
+export interface GenCStatusTransitionResponse {
+  applied: number;
+  failed: number;
+  results: {
+    genc_id: number;
+    success: boolean;
+    previous_status?: StatusEnum;
+    status?: StatusEnum;
+    detail?: string;
+  }[];
+}
+
+export interface SkillMatrixQuery {
+  designation?: string;
+  account_id?: number;
+  category?: string;
+  only_with_gaps?: boolean;
+  min_gap_count?: number;
+  search?: string;
+  sort?: string;
+  after?: string;
+  limit?: number;
+}
+
 export interface RoleRequirementMatrix {
   role: string;
   requirements: {
@@ -187,4 +248,117 @@ export interface RoleRequirementMatrix {
     is_mandatory: string;
     category?: string;
   }[];
-} 
\ No newline at end of file
+} 
+
+// Role-fit ranking
+export interface RoleFitQuery {
+  limit?: number;
+  status?: StatusEnum[];
+  account_id?: number;
+  location?: LocationEnum;
+  designation?: DesignationEnum;
+  all_mandatory?: boolean;
+}
+
+export interface RoleFitCandidate {
+  genc_id: number;
+  associate_id: string;
+  genc_name: string;
+  status: StatusEnum;
+  current_designation: DesignationEnum;
+  account_id: number;
+  score: number;
+  mandatory_met: number;
+  requirements_met: number;
+  weighted_deficit: number;
+  gaps: {
+    skill_id: number;
+    skill_name: string;
+    required_proficiency_level: ProficiencyLevelEnum;
+    proficiency_level?: ProficiencyLevelEnum | null;
+    is_mandatory: boolean;
+    deficit: number;
+  }[];
+}
+
+export interface RoleFitRanking {
+  role: DesignationEnum;
+  requirements_count: number;
+  mandatory_count: number;
+  candidates_considered: number;
+  candidates: RoleFitCandidate[];
+}
+
+export interface ImportJob {
+  job_id: string;
+  kind: string;
+  filename: string;
+  status: 'queued' | 'running' | 'completed' | 'failed';
+  detail?: string;
+  total_rows: number;
+  imported: number;
+  skipped: number;
+  errors: string[];
+  created_at: string;
+  started_at?: string;
+  finished_at?: string;
+}
+
+export interface DashboardStats {
+  total_gencs: number;
+  total_mentors: number;
+  total_accounts: number;
+  status_counts: Record<string, number>;
+  location_counts: Record<string, number>;
+  designation_counts: Record<string, number>;
+  account_counts: {
+    account_id: number;
+    account_name: string;
+    genc_count: number;
+  }[];
+}
+
+export interface GenCStatusChange {
+  id: number;
+  genc_id: number;
+  from_status?: StatusEnum;
+  to_status: StatusEnum;
+  changed_at: string;
+}
+
+export interface StatusAnalytics {
+  time_in_status: {
+    status: StatusEnum;
+    count: number;
+    avg_days?: number;
+    min_days?: number;
+    max_days?: number;
+    buckets: Record<string, number>;
+  }[];
+  funnel: {
+    stages: {
+      status: StatusEnum;
+      reached: number;
+      conversion_from_previous?: number;
+      conversion_from_start?: number;
+    }[];
+    exits: Record<string, number>;
+  };
+  cohort_status: StatusEnum;
+  cohorts: {
+    cohort: string;
+    size: number;
+    reached: number[];
+    rates: number[];
+  }[];
+}
+
+export interface EnumBundle {
+  status: Record<string, string>;
+  location: Record<string, string>;
+  designation: Record<string, string>;
+  mentor_designation: Record<string, string>;
+  user_type: Record<string, string>;
+  proficiency_level: Record<string, string>;
+  status_transitions: Record<string, string[]>;
+}